@@ -0,0 +1,88 @@
+import random
+import sys
+import time
+
+from datalayer.chat_log import ChatLog
+
+MESSAGES = 400
+SUMMARIZE_LIMIT = 6000
+SUMMARIZE_THRESHOLD = 3000
+WORDS = [
+    "beans",
+    "jail",
+    "slap",
+    "pet",
+    "fart",
+    "crunch",
+    "garden",
+    "season",
+    "loot",
+    "gamba",
+    "karma",
+]
+
+
+def full_token_count(chat_log: ChatLog) -> int:
+    # what get_token_count used to do after every reply
+    encoding = chat_log.encoding
+    total_tokens = len(encoding.encode(chat_log.system_message.message))
+    for message in chat_log.chat_log:
+        total_tokens += len(encoding.encode(message.message))
+    return total_tokens
+
+
+def random_message(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 120)))
+
+
+def main() -> int:
+    rng = random.Random(0)
+
+    start = time.perf_counter()
+    ChatLog.get_encoding()
+    load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(100):
+        ChatLog("backstory")
+    init_time = (time.perf_counter() - start) / 100
+
+    chat_log = ChatLog(random_message(rng))
+    mismatches = 0
+    full_time = 0
+    incremental_time = 0
+    summaries = 0
+    for _ in range(MESSAGES):
+        chat_log.add_user_message(random_message(rng))
+        chat_log.add_assistant_message(random_message(rng))
+
+        start = time.perf_counter()
+        expected = full_token_count(chat_log)
+        full_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        token_count = chat_log.get_token_count()
+        incremental_time += time.perf_counter() - start
+
+        if token_count != expected:
+            mismatches += 1
+
+        if token_count > SUMMARIZE_LIMIT:
+            chat_log.summarize(SUMMARIZE_THRESHOLD)
+            chat_log.add_summary(random_message(rng))
+            summaries += 1
+            if chat_log.get_token_count() != full_token_count(chat_log):
+                mismatches += 1
+
+    print(
+        f"encoding load: {load_time * 1000:.1f}ms once, ChatLog(): {init_time * 1000:.3f}ms"
+    )
+    print(f"{MESSAGES * 2} messages, {summaries} summaries")
+    print(f"full recount: {full_time / MESSAGES * 1000:.3f}ms per reply")
+    print(f"running total: {incremental_time / MESSAGES * 1000:.5f}ms per reply")
+    print(f"{mismatches} mismatches")
+    return 1 if mismatches > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+import asyncio
+import os
+import tempfile
+import time
+
+import aiosqlite
+
+from datalayer.connection_pool import ConnectionPool
+
+QUERY_COUNT = 2000
+CONCURRENCY = 16
+
+CREATE_TABLE = """
+    CREATE TABLE if not exists events (
+        evnt_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        evnt_timestamp INTEGER,
+        evnt_guild_id INTEGER,
+        evnt_type TEXT
+    );"""
+INSERT = (
+    "INSERT INTO events (evnt_timestamp, evnt_guild_id, evnt_type) VALUES (?, ?, ?);"
+)
+SELECT = "SELECT * FROM events WHERE evnt_guild_id = ? ORDER BY evnt_id DESC LIMIT 10;"
+
+
+async def connect_per_call_select(db_file: str, task):
+    async with aiosqlite.connect(db_file, timeout=30) as db:  # noqa: SIM117
+        async with db.execute(SELECT, task) as cursor:
+            return await cursor.fetchall()
+
+
+async def connect_per_call_insert(db_file: str, task):
+    async with aiosqlite.connect(db_file, timeout=30) as db:
+        cursor = await db.execute(INSERT, task)
+        await db.commit()
+        return cursor.lastrowid
+
+
+async def pooled_select(pool: ConnectionPool, task):
+    async with pool.reader() as db:  # noqa: SIM117
+        async with db.execute(SELECT, task) as cursor:
+            return await cursor.fetchall()
+
+
+async def pooled_insert(pool: ConnectionPool, task):
+    async with pool.writer() as db:
+        cursor = await db.execute(INSERT, task)
+        await db.commit()
+        return cursor.lastrowid
+
+
+async def run(name: str, select, insert, target):
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def query(index: int):
+        async with semaphore:
+            if index % 4 == 0:
+                await insert(target, (index, index % 8, "beans"))
+            else:
+                await select(target, (index % 8,))
+
+    start = time.perf_counter()
+    await asyncio.gather(*[query(index) for index in range(QUERY_COUNT)])
+    duration = time.perf_counter() - start
+    print(f"{name}: {QUERY_COUNT / duration:.0f} queries/s ({duration:.2f}s)")
+
+
+async def main():
+    with tempfile.TemporaryDirectory() as directory:
+        db_file = os.path.join(directory, "benchmark.sqlite")
+        async with aiosqlite.connect(db_file) as db:
+            await db.execute(CREATE_TABLE)
+            await db.commit()
+
+        await run(
+            "connect per call",
+            connect_per_call_select,
+            connect_per_call_insert,
+            db_file,
+        )
+
+        pool = ConnectionPool(db_file)
+        await run("connection pool", pooled_select, pooled_insert, pool)
+        await pool.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
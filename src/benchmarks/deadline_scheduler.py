@@ -0,0 +1,101 @@
+import asyncio
+import datetime
+import random
+import sys
+import time
+
+from benchmarks.gear_loading import GearLogger
+from control.controller import Controller
+from control.deadline_scheduler import DeadlineScheduler
+from control.types import TimerType
+
+TIMERS = 3000
+RESCHEDULES = 1000
+CANCELS = 500
+# deadlines spread over this many seconds
+SPAN = 2.0
+# the polling loops checked every 20s to 60s
+POLL_INTERVAL = 20
+
+
+async def main() -> int:
+    rng = random.Random(0)
+    controller = Controller(None, GearLogger(), None)
+    scheduler: DeadlineScheduler = controller.get_service(DeadlineScheduler)
+
+    fired: list[tuple[int, datetime.datetime, datetime.datetime]] = []
+    deadlines: dict[int, datetime.datetime] = {}
+
+    def callback(target_id: int):
+        async def fire():
+            fired.append((target_id, deadlines[target_id], datetime.datetime.now()))
+
+        return fire
+
+    start = datetime.datetime.now()
+    schedule_start = time.perf_counter()
+    for target_id in range(TIMERS):
+        deadline = start + datetime.timedelta(seconds=rng.uniform(0.1, SPAN))
+        deadlines[target_id] = deadline
+        scheduler.schedule(
+            TimerType.JAIL_RELEASE, target_id, 0, deadline, callback(target_id)
+        )
+
+    for target_id in rng.sample(range(TIMERS), RESCHEDULES):
+        deadline = start + datetime.timedelta(seconds=rng.uniform(0.1, SPAN))
+        deadlines[target_id] = deadline
+        scheduler.reschedule(TimerType.JAIL_RELEASE, target_id, deadline)
+
+    cancelled = set(rng.sample(range(TIMERS), CANCELS))
+    for target_id in cancelled:
+        scheduler.cancel(TimerType.JAIL_RELEASE, target_id)
+    schedule_time = time.perf_counter() - schedule_start
+
+    pending = len(scheduler.get_pending_timers())
+    await asyncio.sleep(SPAN + 0.2)
+
+    failures = 0
+    fired_ids = [target_id for target_id, _, _ in fired]
+    if len(fired_ids) != len(set(fired_ids)):
+        failures += 1
+        print("a timer fired more than once")
+    if set(fired_ids) != set(range(TIMERS)) - cancelled:
+        failures += 1
+        print("fired timers do not match the scheduled ones")
+    if pending != TIMERS - CANCELS:
+        failures += 1
+        print(f"{pending} pending timers, expected {TIMERS - CANCELS}")
+
+    early = [1 for _, deadline, fired_at in fired if fired_at < deadline]
+    if len(early) > 0:
+        failures += 1
+        print(f"{len(early)} timers fired early")
+
+    fired_deadlines = [deadline for _, deadline, _ in fired]
+    if fired_deadlines != sorted(fired_deadlines):
+        failures += 1
+        print("timers fired out of order")
+
+    if len(scheduler.timers) != 0 or len(scheduler.queue) != 0:
+        failures += 1
+        print("fired timers were not removed")
+
+    lateness = [
+        (fired_at - deadline).total_seconds() for _, deadline, fired_at in fired
+    ]
+    print(
+        f"{TIMERS} timers, {RESCHEDULES} rescheduled, {CANCELS} cancelled: {len(fired)} fired"
+    )
+    print(f"scheduling: {schedule_time / TIMERS * 1e6:.1f}us per timer")
+    print(
+        f"lateness: {sum(lateness) / len(lateness) * 1000:.2f}ms avg, {max(lateness) * 1000:.2f}ms max"
+    )
+    print(
+        f"polling every {POLL_INTERVAL}s: up to {POLL_INTERVAL}s late and {24 * 60 * 60 // POLL_INTERVAL} wakeups per day per loop"
+    )
+    print(f"{failures} failures")
+    return 1 if failures > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
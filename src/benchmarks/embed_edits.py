@@ -0,0 +1,125 @@
+import asyncio
+import copy
+import sys
+import time
+
+import discord
+
+from control.combat.edit_scheduler import EditScheduler
+
+ENCOUNTERS = 6
+TARGETS = 8
+# the turn animation, scaled down 10x: states 0.05s apart, one edit per 0.1s
+STEP = 0.05
+EDIT_INTERVAL = 0.1
+
+
+class FakeMessage:
+
+    def __init__(self, message_id: int):
+        self.id = message_id
+        self.embeds = []
+        self.edits: list[float] = []
+
+    async def edit(self, embeds: list[discord.Embed]):
+        self.edits.append(asyncio.get_running_loop().time())
+        await asyncio.sleep(0.005)
+        self.embeds = embeds
+        return self
+
+
+async def edit_message(message: FakeMessage, **kwargs):
+    return await message.edit(**kwargs)
+
+
+def turn_embed() -> discord.Embed:
+    embed = discord.Embed(title="", description="", color=discord.Color.red())
+    embed.set_author(name="Enemy", icon_url="https://example.com/enemy.png")
+    embed.set_thumbnail(url="https://example.com/skill.png")
+    embed.add_field(name="Skill", value="Hits everyone " * 10, inline=False)
+    return embed
+
+
+def aoe_states(step_count: int) -> list[list[tuple[str, str]]]:
+    states = []
+    for step in range(step_count):
+        states.append(
+            [(f"Target {target}", f"step {step}") for target in range(TARGETS)]
+        )
+    return states
+
+
+def add_fields(base_embed: discord.Embed, fields) -> discord.Embed:
+    data = base_embed.to_dict()
+    data["fields"] = data.get("fields", []) + [
+        {"name": name, "value": value, "inline": True} for name, value in fields
+    ]
+    return discord.Embed.from_dict(data)
+
+
+async def animate(scheduler: EditScheduler, message: FakeMessage, steps: int):
+    base_embed = turn_embed()
+    for fields in aoe_states(steps):
+        scheduler.schedule(message, embeds=[add_fields(base_embed, fields)])
+        await asyncio.sleep(STEP)
+    await scheduler.flush(message)
+
+
+def min_gap(edits: list[float]) -> float:
+    gaps = [later - earlier for earlier, later in zip(edits, edits[1:], strict=False)]
+    return min(gaps) if len(gaps) > 0 else EDIT_INTERVAL
+
+
+async def main() -> int:
+    steps = 12
+    messages = [FakeMessage(index) for index in range(ENCOUNTERS)]
+    scheduler = EditScheduler(edit_message, EDIT_INTERVAL)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[animate(scheduler, message, steps) for message in messages])
+    elapsed = time.perf_counter() - start
+
+    failures = 0
+    final_state = [
+        field.value for field in add_fields(turn_embed(), aoe_states(steps)[-1]).fields
+    ]
+    for message in messages:
+        if [field.value for field in message.embeds[0].fields] != final_state:
+            failures += 1
+            print(f"message {message.id} did not end on the latest state")
+        # small tolerance for timer jitter
+        if min_gap(message.edits) < EDIT_INTERVAL * 0.95:
+            failures += 1
+            print(f"message {message.id} was edited faster than the cap")
+
+    base_embed = turn_embed()
+    fields = aoe_states(1)[0]
+    start = time.perf_counter()
+    for _ in range(2000):
+        embed = copy.deepcopy(base_embed)
+        for name, value in fields:
+            embed.add_field(name=name, value=value, inline=True)
+    deepcopy_time = (time.perf_counter() - start) / 2000
+
+    start = time.perf_counter()
+    for _ in range(2000):
+        add_fields(base_embed, fields)
+    field_copy_time = (time.perf_counter() - start) / 2000
+
+    if len(base_embed.fields) != 1:
+        failures += 1
+        print("building a state modified the base embed")
+
+    print(
+        f"{ENCOUNTERS} encounters x {steps} states: {scheduler.scheduled} scheduled, {scheduler.sent} edits sent, {scheduler.coalesced} coalesced"
+    )
+    print(f"animation took {elapsed:.2f}s")
+    print(
+        f"state copy: deepcopy {deepcopy_time * 1e6:.1f}us, field copy {field_copy_time * 1e6:.1f}us"
+    )
+    print(f"{failures} failures")
+    return 1 if failures > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,130 @@
+import datetime
+import random
+import sys
+import time
+
+from combat.event_log import CombatEventLog
+from combat.skills.types import SkillType
+from events.combat_event import CombatEvent
+from events.types import CombatEventType
+
+# a long raid, every lookup below runs once per logged event
+EVENTS = 5000
+ACTORS = [-1, 1, 2, 3, 4, 5, 6, 7]
+SKILLS = list(SkillType)[:20]
+END_TURN = [CombatEventType.MEMBER_END_TURN, CombatEventType.ENEMY_END_TURN]
+
+
+def random_event(rng: random.Random, event_id: int) -> CombatEvent:
+    member_id = rng.choice(ACTORS)
+    roll = rng.random()
+    combat_event_type = CombatEventType.MEMBER_TURN_STEP
+    skill_type = rng.choice(SKILLS)
+    if roll < 0.15:
+        combat_event_type = (
+            CombatEventType.ENEMY_END_TURN
+            if member_id < 0
+            else CombatEventType.MEMBER_END_TURN
+        )
+        skill_type = None
+    elif roll < 0.3:
+        combat_event_type = CombatEventType.STATUS_EFFECT
+    return CombatEvent(
+        datetime.datetime.now(),
+        1,
+        1,
+        member_id,
+        rng.choice(ACTORS),
+        skill_type,
+        rng.randint(-50, 50),
+        rng.randint(0, 50),
+        None,
+        combat_event_type,
+        id=event_id,
+    )
+
+
+def cooldowns(events, member_id: int) -> dict[SkillType, int]:
+    # the loop get_skill_cooldowns runs over the member's events
+    result = {}
+    last_used = 0
+    for event in events:
+        if event.member_id != member_id:
+            continue
+        if event.skill_type is not None and event.skill_type not in result:
+            result[event.skill_type] = max(0, last_used - 1)
+        if event.combat_event_type in END_TURN:
+            last_used += 1
+    return result
+
+
+def list_lookups(events: list[CombatEvent], event: CombatEvent):
+    events.insert(0, event)
+    last_actor = None
+    for logged in events:
+        if logged.combat_event_type in END_TURN:
+            last_actor = logged.member_id
+            break
+    status_values = sum(
+        logged.skill_value
+        for logged in events
+        if logged.combat_event_type == CombatEventType.STATUS_EFFECT
+    )
+    return last_actor, cooldowns(events, event.member_id), status_values
+
+
+def log_lookups(events: CombatEventLog, event: CombatEvent):
+    events.append(event)
+    last_end_turn = events.latest("type", *END_TURN)
+    last_actor = last_end_turn.member_id if last_end_turn is not None else None
+    status_values = sum(
+        logged.skill_value for logged in events.of_type(CombatEventType.STATUS_EFFECT)
+    )
+    return (
+        last_actor,
+        cooldowns(events.by_member(event.member_id), event.member_id),
+        status_values,
+    )
+
+
+def main() -> int:
+    rng = random.Random(0)
+    events = [random_event(rng, event_id) for event_id in range(1, EVENTS + 1)]
+
+    list_events = []
+    list_results = []
+    start = time.perf_counter()
+    for event in events:
+        list_results.append(list_lookups(list_events, event))
+    list_time = time.perf_counter() - start
+
+    log_events = CombatEventLog()
+    log_results = []
+    start = time.perf_counter()
+    for event in events:
+        log_results.append(log_lookups(log_events, event))
+    log_time = time.perf_counter() - start
+
+    mismatches = sum(
+        1
+        for expected, result in zip(list_results, log_results, strict=True)
+        if expected != result
+    )
+    if list(log_events) != list_events:
+        mismatches += 1
+        print("the log does not iterate newest first")
+
+    loaded = CombatEventLog(list_events)
+    if list(reversed(loaded)) != events:
+        mismatches += 1
+        print("loading a newest first list changed the order")
+
+    print(f"{EVENTS} combat events, {len(ACTORS)} actors")
+    print(f"newest first list: {list_time / EVENTS * 1e6:.1f}us per event")
+    print(f"indexed log:       {log_time / EVENTS * 1e6:.1f}us per event")
+    print(f"{mismatches} mismatches")
+    return 1 if mismatches > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
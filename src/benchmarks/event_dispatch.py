@@ -0,0 +1,185 @@
+import asyncio
+import copy
+import datetime
+import random
+import sys
+import time
+
+from benchmarks.gear_loading import GearLogger
+from control.combat.combat_actor_manager import CombatActorManager
+from control.combat.context_loader import ContextLoader
+from control.combat.encounter_manager import EncounterManager
+from control.controller import Controller
+from control.event_manager import EventManager
+from control.item_manager import ItemManager
+from control.jail_manager import JailManager
+from control.prediction_manager import PredictionManager
+from control.role_manager import RoleManager
+from control.service import Service
+from control.view.combat_view_controller import CombatViewController
+from control.view.equipment_view_controller import EquipmentViewController
+from control.view.garden_view_controller import GardenViewController
+from control.view.inventory_view_controller import InventoryViewController
+from control.view.prediction_interaction_view_controller import (
+    PredictionInteractionViewController,
+)
+from control.view.prediction_moderation_view_controller import (
+    PredictionModerationViewController,
+)
+from control.view.prediction_view_controller import PredictionViewController
+from control.view.shop_view_controller import ShopViewController
+from events.beans_event import BeansEvent
+from events.bot_event import BotEvent
+from events.combat_event import CombatEvent
+from events.encounter_event import EncounterEvent
+from events.inventory_event import InventoryEvent
+from events.types import BeansEventType, CombatEventType, EncounterEventType
+from items.types import ItemType
+
+EVENTS = 3000
+# services plus view controllers registered on a running bot
+LISTENER_COUNT = 37
+SUBSCRIBED_LISTENERS = [
+    EventManager,
+    EncounterManager,
+    CombatActorManager,
+    ContextLoader,
+    JailManager,
+    ItemManager,
+    PredictionManager,
+    RoleManager,
+    EquipmentViewController,
+    CombatViewController,
+    PredictionInteractionViewController,
+    InventoryViewController,
+    ShopViewController,
+    PredictionViewController,
+    GardenViewController,
+    PredictionModerationViewController,
+]
+
+
+class StandInListener(Service):
+
+    def __init__(self, bot, logger, database, controller):
+        super().__init__(bot, logger, database)
+        self.controller = controller
+        self.events: list[BotEvent] = []
+
+    async def listen_for_event(self, event: BotEvent):
+        self.events.append(event)
+
+
+def stand_in(name: str, subscriptions: list) -> type[Service]:
+    return type(name, (StandInListener,), {"EVENT_SUBSCRIPTIONS": subscriptions})
+
+
+def create_controller() -> Controller:
+    controller = Controller(None, GearLogger(), None)
+    for listener_class in SUBSCRIBED_LISTENERS:
+        controller.get_service(
+            stand_in(listener_class.__name__, listener_class.EVENT_SUBSCRIPTIONS)
+        )
+    for index in range(LISTENER_COUNT - len(SUBSCRIBED_LISTENERS)):
+        controller.get_service(stand_in(f"PassiveService{index}", []))
+    return controller
+
+
+async def legacy_dispatch(controller: Controller, event: BotEvent):
+    # one task per registered listener, as dispatch_event used to do
+    tasks = []
+    for service in controller.services:
+        tasks.append(asyncio.create_task(service.listen_for_event(event)))
+    result = await asyncio.gather(*tasks, return_exceptions=True)
+
+    for res in result:
+        if isinstance(res, Exception):
+            raise res
+
+
+def random_event(rng: random.Random) -> BotEvent:
+    now = datetime.datetime.now()
+    roll = rng.random()
+    if roll < 0.6:
+        return CombatEvent(
+            now,
+            1,
+            rng.randint(1, 5),
+            rng.randint(1, 10),
+            rng.randint(1, 10),
+            None,
+            rng.randint(0, 100),
+            rng.randint(0, 100),
+            None,
+            CombatEventType.MEMBER_TURN_STEP,
+        )
+    if roll < 0.75:
+        return EncounterEvent(
+            now, 1, rng.randint(1, 5), rng.randint(1, 10), EncounterEventType.NEW_ROUND
+        )
+    if roll < 0.9:
+        return BeansEvent(
+            now, 1, BeansEventType.BALANCE_CHANGE, rng.randint(1, 10), rng.randint(1, 9)
+        )
+    return InventoryEvent(now, 1, rng.randint(1, 10), ItemType.SCRAP, 1)
+
+
+async def run(dispatch, events: list[BotEvent]) -> float:
+    start = time.perf_counter()
+    for event in events:
+        await dispatch(event)
+        if isinstance(event, CombatEvent | EncounterEvent):
+            # EventManager re-dispatches these once they are logged
+            sync_event = copy.copy(event)
+            sync_event.synchronized = True
+            await dispatch(sync_event)
+    return time.perf_counter() - start
+
+
+async def main() -> int:
+    rng = random.Random(0)
+    events = [random_event(rng) for _ in range(EVENTS)]
+
+    legacy_controller = create_controller()
+    legacy_time = await run(
+        lambda event: legacy_dispatch(legacy_controller, event), events
+    )
+    legacy_calls = sum(len(service.events) for service in legacy_controller.services)
+
+    controller = create_controller()
+    routed_time = await run(controller.dispatch_event, events)
+
+    mismatches = 0
+    for legacy_service, service in zip(
+        legacy_controller.services, controller.services, strict=True
+    ):
+        expected = [
+            event
+            for event in legacy_service.events
+            if any(
+                subscription.matches(event)
+                for subscription in legacy_service.EVENT_SUBSCRIPTIONS
+            )
+        ]
+        if [(event.type, event.synchronized) for event in expected] != [
+            (event.type, event.synchronized) for event in service.events
+        ]:
+            mismatches += 1
+            print(f"{service.__class__.__name__} saw different events")
+
+    dispatches = controller.dispatched_events
+    print(f"{dispatches} dispatches over {LISTENER_COUNT} listeners")
+    print(
+        f"broadcast: {legacy_time / dispatches * 1e6:.1f}us per event, {legacy_calls / dispatches:.1f} listener tasks"
+    )
+    print(
+        f"routed:    {routed_time / dispatches * 1e6:.1f}us per event, {controller.scheduled_listeners / dispatches:.1f} listener tasks"
+    )
+    for name, stats in sorted(controller.listener_stats.items()):
+        print(f"  {name}: {stats.calls} calls, {stats.average_time * 1e6:.1f}us avg")
+    print(f"{mismatches} mismatches")
+    return 1 if mismatches > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,226 @@
+import asyncio
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmarks.gear_loading import GearLogger
+from datalayer.database import Database
+from datalayer.garden import Plot, PlotModifiers, UserGarden
+from datalayer.patches.patch import DBPatcher
+from datalayer.types import PlantType
+from events.garden_event import GardenEvent
+from events.types import GardenEventType
+
+GUILDS = 3
+GARDENS = 40
+EVENTS_PER_GARDEN = 150
+
+
+def plot_key(plot: Plot) -> tuple:
+    modifiers = plot.modifiers
+    if modifiers is None:
+        return (plot.id, plot.plant, plot.plant_datetime, plot.notified)
+    return (
+        plot.id,
+        None if plot.plant is None else plot.plant.type,
+        plot.plant_datetime,
+        plot.notified,
+        tuple(event.id for event in modifiers.water_events),
+        None if modifiers.last_fertilized is None else round(modifiers.last_fertilized),
+        tuple(event.id for event in modifiers.flash_bean_events),
+    )
+
+
+def garden_key(garden: UserGarden) -> tuple:
+    return (garden.id, garden.member_id, tuple(plot_key(plot) for plot in garden.plots))
+
+
+async def seed(database: Database, rng: random.Random):
+    now = datetime.datetime.now()
+    events = []
+    garden_ids = {}
+    for guild_id in range(1, GUILDS + 1):
+        for member_id in range(GARDENS):
+            garden = await database.get_user_garden(guild_id, member_id)
+            for _ in range(rng.randint(0, UserGarden.MAX_PLOTS - 1)):
+                garden = await database.add_garden_plot(garden)
+
+            garden_ids.setdefault(guild_id, {})[garden.id] = (
+                member_id,
+                [(plot.id, plot.x, plot.y) for plot in garden.plots],
+            )
+
+            for _ in range(EVENTS_PER_GARDEN):
+                plot = rng.choice(garden.plots)
+                event_type = rng.choice(
+                    [
+                        GardenEventType.PLANT,
+                        GardenEventType.WATER,
+                        GardenEventType.WATER,
+                        GardenEventType.HARVEST,
+                        GardenEventType.REMOVE,
+                        GardenEventType.NOTIFICATION,
+                    ]
+                )
+                payload = None
+                if event_type in [
+                    GardenEventType.PLANT,
+                    GardenEventType.HARVEST,
+                    GardenEventType.REMOVE,
+                ]:
+                    payload = rng.choice(list(PlantType)).value
+                # whole seconds, so plenty of events share a timestamp
+                timestamp = now - datetime.timedelta(seconds=rng.randint(5, 3600 * 48))
+                events.append(
+                    GardenEvent(
+                        timestamp,
+                        guild_id,
+                        garden.id,
+                        plot.id,
+                        member_id,
+                        event_type,
+                        payload,
+                    )
+                )
+    await asyncio.gather(*[database.log_event(event) for event in events])
+    return garden_ids, len(events)
+
+
+async def legacy_garden_plots(
+    database: Database, garden_id: int, plots: list[Plot]
+) -> list[Plot]:
+    # replays the garden's whole event history, as get_garden_plots used to
+    async with database.pool.reader() as db:
+        cursor = await db.execute(
+            f"""
+            SELECT * FROM {Database.GARDEN_EVENT_TABLE}
+            INNER JOIN {Database.EVENT_TABLE} ON {Database.EVENT_ID_COL} = {Database.GARDEN_EVENT_ID_COL}
+            WHERE {Database.GARDEN_EVENT_GARDEN_ID_COL} = ?
+            ORDER BY {Database.EVENT_TIMESTAMP_COL} DESC, {Database.EVENT_ID_COL} DESC;
+            """,
+            (garden_id,),
+        )
+        headings = [column[0] for column in cursor.description]
+        rows = [
+            dict(zip(headings, row, strict=True)) for row in await cursor.fetchall()
+        ]
+        await cursor.close()
+    events = [GardenEvent.from_db_row(row) for row in rows]
+    if len(events) <= 0:
+        return plots
+
+    plants = {}
+    water_events = {}
+    last_fertilized = {}
+    flash_bean_events = []
+    notified = set()
+    done = set()
+    for event in events:
+        plot_id = event.plot_id
+        event_type = GardenEventType(event.garden_event_type)
+        if (
+            event_type == GardenEventType.HARVEST
+            and event.payload == PlantType.YELLOW_BEAN
+            and plot_id not in last_fertilized
+        ):
+            last_fertilized[plot_id] = event
+        if (
+            event_type in [GardenEventType.PLANT, GardenEventType.REMOVE]
+            and event.payload == PlantType.FLASH_BEAN
+        ):
+            flash_bean_events.append(event)
+        if plot_id in done:
+            continue
+        match event_type:
+            case GardenEventType.PLANT:
+                plants[plot_id] = event
+                done.add(plot_id)
+            case GardenEventType.WATER:
+                water_events.setdefault(plot_id, []).append(event)
+            case GardenEventType.REMOVE | GardenEventType.HARVEST:
+                done.add(plot_id)
+            case GardenEventType.NOTIFICATION:
+                notified.add(plot_id)
+
+    now = datetime.datetime.now()
+    for plot in plots:
+        if plot.id in plants:
+            plot.plant_datetime = plants[plot.id].datetime
+            plot.plant = UserGarden.get_plant_by_type(plants[plot.id].payload)
+        plot.notified = plot.id in notified
+        plot.modifiers = PlotModifiers(
+            water_events=water_events.get(plot.id),
+            flash_bean_events=flash_bean_events,
+        )
+        if plot.id in last_fertilized:
+            delta = now - last_fertilized[plot.id].datetime
+            plot.modifiers.last_fertilized = delta.total_seconds() / Plot.TIME_MODIFIER
+    return plots
+
+
+async def legacy_guild_gardens(
+    database: Database, guild_id: int, garden_plots: dict[int, tuple[int, list]]
+) -> list[UserGarden]:
+    # one events query per garden, replayed in full
+    gardens = []
+    for garden_id, (member_id, positions) in garden_plots.items():
+        plots = [Plot(plot_id, garden_id, x, y) for plot_id, x, y in positions]
+        plots = await legacy_garden_plots(database, garden_id, plots)
+        gardens.append(UserGarden(garden_id, guild_id, member_id, plots, {}))
+    return gardens
+
+
+async def main() -> int:
+    rng = random.Random(0)
+    mismatches = 0
+    with tempfile.TemporaryDirectory() as directory:
+        database = Database(
+            None, GearLogger(), os.path.join(directory, "garden.sqlite")
+        )
+        await database.create_tables()
+        await DBPatcher(database).migrate()
+        try:
+            garden_ids, event_count = await seed(database, rng)
+
+            start = time.perf_counter()
+            legacy = [
+                await legacy_guild_gardens(database, guild_id, garden_ids[guild_id])
+                for guild_id in range(1, GUILDS + 1)
+            ]
+            legacy_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            loaded = [
+                await database.get_guild_gardens(guild_id)
+                for guild_id in range(1, GUILDS + 1)
+            ]
+            loaded_time = time.perf_counter() - start
+        finally:
+            await database.close()
+
+    for expected, actual in zip(legacy, loaded, strict=True):
+        expected_keys = sorted(garden_key(garden) for garden in expected)
+        actual_keys = sorted(garden_key(garden) for garden in actual)
+        for expected_key, actual_key in zip(expected_keys, actual_keys, strict=True):
+            if expected_key != actual_key:
+                mismatches += 1
+                print(f"mismatch for garden {expected_key[0]}")
+
+    pending = sum(
+        1
+        for gardens in loaded
+        for garden in gardens
+        if len(garden.notification_pending_plots()) > 0
+    )
+    print(f"{GUILDS * GARDENS} gardens, {event_count} garden events")
+    print(f"full replay per garden: {legacy_time * 1000:.0f}ms")
+    print(f"guild loader:           {loaded_time * 1000:.0f}ms")
+    print(f"{pending} gardens pending notification, {mismatches} mismatches")
+    return 1 if mismatches > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,167 @@
+import asyncio
+import os
+import random
+import sys
+import tempfile
+
+from benchmarks.gear_loading import GearLogger, gear_key, seed
+from combat.gear.types import GearModifierType, Rarity
+from datalayer.database import Database
+from datalayer.gear_cache import GearCache
+
+ROUNDS = 3000
+CONCURRENCY = 4
+CACHE_SIZE = 128
+
+
+def enchantment_key(enchantment):
+    if enchantment is None:
+        return None
+    return (
+        enchantment.id,
+        enchantment.type,
+        enchantment.rarity,
+        enchantment.level,
+        enchantment.locked,
+    )
+
+
+async def mutate(
+    database: Database,
+    rng: random.Random,
+    gear_ids: list[int],
+    gear_locks: dict[int, asyncio.Lock],
+):
+    gear_id = rng.choice(gear_ids)
+    # rewriting the modifiers is a delete followed by inserts, two workers
+    # interleaving them on one gear would insert every modifier twice
+    async with gear_locks[gear_id]:
+        await mutate_gear(database, rng, gear_id)
+
+
+async def mutate_gear(database: Database, rng: random.Random, gear_id: int):
+    match rng.randrange(6):
+        case 0:
+            await database.update_lock_gear_by_id(gear_id, rng.random() < 0.5)
+        case 1:
+            await database.update_gear_rarity(gear_id, rng.choice(list(Rarity)))
+        case 2:
+            gear = await database.get_gear_by_id(gear_id)
+            if gear is None:
+                return
+            gear.modifiers[GearModifierType.ATTACK] = rng.randint(0, 100)
+            await database.delete_user_gear_modifiers(gear_id)
+            await database.log_user_gear_modifiers(gear_id, gear)
+        case 3:
+            gear = await database.get_gear_by_id(gear_id)
+            if gear is None or len(gear.enchantments) <= 0:
+                return
+            await database.log_user_gear_enchantment(gear, gear.enchantments[:1])
+        case 4:
+            # changes the enchantment row only, cached gear embeds it
+            gear = await database.get_gear_by_id(gear_id)
+            if gear is None or len(gear.enchantments) <= 0:
+                return
+            enchantment = rng.choice(gear.enchantments)
+            if rng.random() < 0.5:
+                await database.update_lock_gear_by_id(
+                    enchantment.id, not enchantment.locked
+                )
+            else:
+                await database.update_gear_rarity(
+                    enchantment.id, rng.choice(list(Rarity))
+                )
+        case 5:
+            if rng.random() < 0.1:
+                await database.delete_gear_by_ids([gear_id])
+
+
+async def check(
+    database: Database,
+    reference: Database,
+    rng: random.Random,
+    gear_ids: list[int],
+) -> int:
+    ids = rng.sample(gear_ids, rng.randint(1, 8))
+    cached = await database.get_gear_by_ids(ids)
+    expected = await reference.get_gear_by_ids(ids)
+
+    failures = 0
+    if {id: gear_key(gear) for id, gear in cached.items()} != {
+        id: gear_key(gear) for id, gear in expected.items()
+    }:
+        failures += 1
+
+    for id, gear in cached.items():
+        if [enchantment_key(enchantment) for enchantment in gear.enchantments] != [
+            enchantment_key(enchantment) for enchantment in expected[id].enchantments
+        ]:
+            failures += 1
+
+    for gear in cached.values():
+        # scribbling on returned objects must never leak into the cache
+        gear.modifiers.clear()
+        gear.enchantments.clear()
+        gear.rarity = Rarity.DEFAULT
+
+        for enchantment in expected[gear.id].enchantments:
+            cached_enchantment = await database.get_enchantment_by_id(enchantment.id)
+            if enchantment_key(cached_enchantment) != enchantment_key(enchantment):
+                failures += 1
+
+    return failures
+
+
+async def worker(
+    database: Database,
+    reference: Database,
+    seed_value: int,
+    gear_ids: list[int],
+    gear_locks: dict[int, asyncio.Lock],
+) -> int:
+    rng = random.Random(seed_value)
+    failures = 0
+    for _ in range(ROUNDS // CONCURRENCY):
+        if rng.random() < 0.3:
+            await mutate(database, rng, gear_ids, gear_locks)
+        else:
+            # reads racing writes from other workers can legitimately see
+            # either side of a write, so only compare once writes settle
+            await asyncio.sleep(0)
+            async with database.pool.write_lock:
+                failures += await check(database, reference, rng, gear_ids)
+    return failures
+
+
+async def main() -> int:
+    with tempfile.TemporaryDirectory() as directory:
+        db_file = os.path.join(directory, "fuzz.sqlite")
+        database = Database(None, GearLogger(), db_file)
+        database.gear_cache = GearCache(CACHE_SIZE)
+        reference = Database(None, GearLogger(), db_file)
+        reference.gear_cache = GearCache(0)
+        await database.create_tables()
+
+        try:
+            gear_ids = await seed(database)
+            gear_locks = {gear_id: asyncio.Lock() for gear_id in gear_ids}
+            results = await asyncio.gather(
+                *[
+                    worker(database, reference, index, gear_ids, gear_locks)
+                    for index in range(CONCURRENCY)
+                ]
+            )
+        finally:
+            await database.close()
+            await reference.close()
+
+    failures = sum(results)
+    cache = database.gear_cache
+    print(
+        f"{ROUNDS} rounds, {failures} incoherent reads, hit rate {cache.hit_rate:.1%}, {cache.invalidations} invalidations"
+    )
+    return 1 if failures > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,163 @@
+import asyncio
+import os
+import tempfile
+import time
+
+from combat.enchantments.types import EnchantmentType
+from combat.gear.types import Base, GearBaseType, GearModifierType, Rarity
+from combat.skills.types import SkillType
+from datalayer.database import Database
+
+GUILD_ID = 1
+MEMBER_ID = 2
+ARMORY_SIZE = 600
+
+GEAR_TYPES = [GearBaseType.STICK_T0, GearBaseType.STICK_T1, GearBaseType.STICK_T2]
+MODIFIER_TYPES = [
+    GearModifierType.WEAPON_DAMAGE_MIN,
+    GearModifierType.WEAPON_DAMAGE_MAX,
+    GearModifierType.ATTACK,
+]
+ENCHANTMENT_TYPES = [EnchantmentType.CHAOS, EnchantmentType.DIVINE]
+
+
+class GearLogger:
+
+    def log(self, *args, **kwargs):
+        pass
+
+    def error(self, *args, **kwargs):
+        print(*args)
+
+    def debug(self, *args, **kwargs):
+        pass
+
+
+async def seed(database: Database) -> list[int]:
+    gear_ids = []
+    async with database.pool.writer() as db:
+        for index in range(ARMORY_SIZE):
+            cursor = await db.execute(
+                f"""
+                INSERT INTO {Database.USER_GEAR_TABLE} (
+                {Database.USER_GEAR_GUILD_ID_COL}, {Database.USER_GEAR_MEMBER_ID_COL},
+                {Database.USER_GEAR_NAME_COL}, {Database.USER_GEAR_BASE_TYPE_COL},
+                {Database.USER_GEAR_TYPE_COL}, {Database.USER_GEAR_LEVEL_COL},
+                {Database.USER_GEAR_RARITY_COL}, {Database.USER_GEAR_IS_SCRAPPED_COL},
+                {Database.USER_GEAR_IS_LOCKED_COL})
+                VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?);
+                """,
+                (
+                    GUILD_ID,
+                    MEMBER_ID,
+                    f"Stick {index}",
+                    Base.GEAR.value,
+                    GEAR_TYPES[index % len(GEAR_TYPES)].value,
+                    index % 12 + 1,
+                    Rarity.RARE.value,
+                    index % 2,
+                ),
+            )
+            gear_id = cursor.lastrowid
+            gear_ids.append(gear_id)
+
+            for modifier_type in MODIFIER_TYPES:
+                await db.execute(
+                    f"INSERT INTO {Database.USER_GEAR_MODIFIER_TABLE} VALUES (?, ?, ?);",
+                    (gear_id, modifier_type.value, index),
+                )
+            await db.execute(
+                f"INSERT INTO {Database.USER_GEAR_SKILL_TABLE} VALUES (?, ?);",
+                (gear_id, SkillType.NORMAL_ATTACK.value),
+            )
+
+            for enchantment_type in ENCHANTMENT_TYPES[: index % 3]:
+                cursor = await db.execute(
+                    f"""
+                    INSERT INTO {Database.USER_GEAR_TABLE} (
+                    {Database.USER_GEAR_GUILD_ID_COL}, {Database.USER_GEAR_MEMBER_ID_COL},
+                    {Database.USER_GEAR_BASE_TYPE_COL}, {Database.USER_GEAR_TYPE_COL},
+                    {Database.USER_GEAR_LEVEL_COL}, {Database.USER_GEAR_RARITY_COL},
+                    {Database.USER_GEAR_IS_SCRAPPED_COL}, {Database.USER_GEAR_IS_LOCKED_COL})
+                    VALUES (?, ?, ?, ?, 1, ?, 0, 0);
+                    """,
+                    (
+                        -1,
+                        -1,
+                        Base.ENCHANTMENT.value,
+                        enchantment_type.value,
+                        Rarity.RARE.value,
+                    ),
+                )
+                await db.execute(
+                    f"INSERT INTO {Database.USER_GEAR_ENCHANTMENTS_TABLE} VALUES (?, ?);",
+                    (gear_id, cursor.lastrowid),
+                )
+        await db.commit()
+    return gear_ids
+
+
+def gear_key(gear):
+    return (
+        gear.id,
+        gear.name,
+        gear.base.type,
+        gear.rarity,
+        gear.level,
+        gear.locked,
+        tuple(gear.modifiers.items()),
+        tuple(gear.skills),
+        tuple((enchantment.id, enchantment.type) for enchantment in gear.enchantments),
+    )
+
+
+async def timed(database: Database, statements: list[str], coroutine):
+    statements.clear()
+    start = time.perf_counter()
+    result = await coroutine
+    return result, time.perf_counter() - start, len(statements)
+
+
+async def per_id_armory(database: Database, gear_ids: list[int]):
+    return [await database.get_gear_by_id(gear_id) for gear_id in gear_ids]
+
+
+async def main():
+    with tempfile.TemporaryDirectory() as directory:
+        database = Database(None, GearLogger(), os.path.join(directory, "gear.sqlite"))
+        await database.create_tables()
+        try:
+            gear_ids = await seed(database)
+
+            statements = []
+            for reader in database.pool.reader_connections:
+                await reader.set_trace_callback(statements.append)
+
+            single, single_time, single_queries = await timed(
+                database, statements, per_id_armory(database, gear_ids)
+            )
+            database.gear_cache.clear()
+            bulk, bulk_time, bulk_queries = await timed(
+                database, statements, database.get_user_armory(GUILD_ID, MEMBER_ID)
+            )
+            cached, cached_time, cached_queries = await timed(
+                database, statements, database.get_user_armory(GUILD_ID, MEMBER_ID)
+            )
+
+            for reader in database.pool.reader_connections:
+                await reader.set_trace_callback(None)
+        finally:
+            await database.close()
+
+    assert [gear_key(gear) for gear in single] == [gear_key(gear) for gear in bulk]
+    assert [gear_key(gear) for gear in bulk] == [gear_key(gear) for gear in cached]
+
+    print(
+        f"per id: {single_time * 1000:.0f}ms, {single_queries} queries for {ARMORY_SIZE} items"
+    )
+    print(f"bulk:   {bulk_time * 1000:.0f}ms, {bulk_queries} queries")
+    print(f"cached: {cached_time * 1000:.0f}ms, {cached_queries} queries")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
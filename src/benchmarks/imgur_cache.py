@@ -0,0 +1,84 @@
+import asyncio
+import time
+
+from imgurpython.imgur.models.image import Image
+
+from combat.encounter import Encounter
+from combat.enemies.types import EnemyType
+from control.imgur_manager import ImgurManager
+
+ENCOUNTER_COUNT = 1000
+REQUEST_DELAY = 0.2
+IMAGES_PER_ALBUM = 20
+
+
+class StubImgurClient:
+
+    def __init__(self, albums: dict[str, list[Image]], delay: float = 0):
+        self.albums = albums
+        self.delay = delay
+        self.requests = 0
+
+    def get_album_images(self, album_id: str) -> list[Image]:
+        self.requests += 1
+        if self.delay > 0:
+            time.sleep(self.delay)
+        return list(self.albums.get(album_id, []))
+
+
+class ImgurLogger:
+
+    def log(self, *args, **kwargs):
+        pass
+
+    def error(self, *args, **kwargs):
+        print(*args)
+
+
+async def watch_loop_lag(stop: asyncio.Event) -> float:
+    max_lag = 0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        max_lag = max(max_lag, time.perf_counter() - start - 0.01)
+    return max_lag
+
+
+async def main():
+    albums = {
+        album_id: [
+            Image({"id": f"{album_id}{index}", "link": f"{album_id}/{index}.png"})
+            for index in range(IMAGES_PER_ALBUM)
+        ]
+        for album_id in ImgurManager.ENCOUNTER_ALBUMS[EnemyType.SCRIBBLER]
+    }
+    manager = ImgurManager(None, ImgurLogger(), None, None)
+    manager.client = StubImgurClient(albums, delay=REQUEST_DELAY)
+
+    stop = asyncio.Event()
+    watcher = asyncio.create_task(watch_loop_lag(stop))
+
+    start = time.perf_counter()
+    await manager.prefetch_albums()
+    prefetch = time.perf_counter() - start
+
+    start = time.perf_counter()
+    choices = {}
+    for encounter_id in range(ENCOUNTER_COUNT):
+        encounter = Encounter(1, EnemyType.SCRIBBLER, 1, 100, id=encounter_id % 100)
+        image = await manager.get_random_encounter_image(encounter)
+        if encounter.id in choices:
+            assert choices[encounter.id] is image
+        choices[encounter.id] = image
+    lookups = time.perf_counter() - start
+
+    stop.set()
+    max_lag = await watcher
+
+    print(f"prefetch: {prefetch:.2f}s, {manager.client.requests} album requests")
+    print(f"{ENCOUNTER_COUNT / lookups:.0f} encounter image lookups/s")
+    print(f"max event loop lag: {max_lag * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,144 @@
+import asyncio
+import hashlib
+import os
+import random
+import sys
+import tempfile
+
+from benchmarks.gear_loading import GearLogger
+from combat.gear.base_index import DroppableBaseIndex
+from combat.gear.gear import Gear
+from combat.gear.types import EquipmentSlot
+from control.combat.combat_gear_manager import CombatGearManager
+from control.combat.object_factory import ObjectFactory
+from control.controller import Controller
+from control.service import Service
+from control.settings_manager import SettingsManager
+from datalayer.database import Database
+
+GUILD_LEVELS = {1: 1, 2: 4, 3: 8, 4: 12}
+SLOTS = [None, EquipmentSlot.SKILL, EquipmentSlot.WEAPON, EquipmentSlot.ACCESSORY]
+SEEDS = 40
+SHOPS = 25
+
+# digest of the seeded drops produced by the generator before it moved to
+# per-call rng streams, seeded output must never change
+GOLDEN_DIGEST = "8f68713b1bf67536ba7dad5f7d29a3492ba99d8b1d1b0ae91622cfa3718c6d48"
+
+
+class LootGenerator(CombatGearManager):
+    # only the services drop generation touches, the full manager would
+    # also pull in the skill and ai managers
+    def __init__(self, database: Database):
+        Service.__init__(self, None, GearLogger(), database)
+        self.controller = Controller(None, self.logger, database)
+        self.log_name = "Combat Loot"
+        self.settings_manager = self.controller.get_service(SettingsManager)
+        self.factory = self.controller.get_service(ObjectFactory)
+        self.base_index = DroppableBaseIndex(
+            skill_drop_chance=self.SKILL_DROP_CHANCE,
+            enchantment_drop_chance=self.ENCHANTMENT_DROP_CHANCE,
+            mob_loot_bonus_scaling=self.MOB_LOOT_BONUS_SCALING,
+            mob_loot_unique_scaling=self.MOB_LOOT_UNIQUE_SCALING,
+        )
+
+
+def drop_key(drop) -> tuple:
+    key = (drop.base.type, drop.rarity, drop.level)
+    if isinstance(drop, Gear):
+        key += (tuple((k, round(v, 6)) for k, v in drop.modifiers.items()),)
+    return key
+
+
+def cases() -> list[tuple]:
+    result = []
+    for guild_id, level in GUILD_LEVELS.items():
+        for slot in SLOTS:
+            for exclude_skills in [False, True]:
+                for index in range(SEEDS):
+                    seed = f"20240101{guild_id}{slot}{exclude_skills}{index}"
+                    result.append((guild_id, level, slot, exclude_skills, seed))
+    return result
+
+
+async def generate(gear_manager: CombatGearManager, case: tuple):
+    guild_id, level, slot, exclude_skills, seed = case
+    return await gear_manager.generate_drop(
+        member_id=None,
+        guild_id=guild_id,
+        item_level=level,
+        exclude_skills=exclude_skills,
+        gear_slot=slot,
+        random_seed=seed,
+    )
+
+
+def digest(drops: list) -> str:
+    keys = [None if drop is None else drop_key(drop) for drop in drops]
+    return hashlib.sha256(repr(keys).encode()).hexdigest()
+
+
+async def main() -> int:
+    with tempfile.TemporaryDirectory() as directory:
+        database = Database(None, GearLogger(), os.path.join(directory, "loot.sqlite"))
+        await database.create_tables()
+        try:
+            for guild_id, level in GUILD_LEVELS.items():
+                await database.get_guild_level(guild_id)
+                await database.set_guild_level(guild_id, level)
+
+            gear_manager = LootGenerator(database)
+
+            all_cases = cases()
+
+            random.seed(0)
+            global_state = random.getstate()
+            sequential = [await generate(gear_manager, case) for case in all_cases]
+            concurrent = await asyncio.gather(
+                *[generate(gear_manager, case) for case in all_cases]
+            )
+            global_untouched = random.getstate() == global_state
+
+            shops = await asyncio.gather(
+                *[
+                    gear_manager.get_member_daily_items(member_id, guild_id)
+                    for guild_id in GUILD_LEVELS
+                    for member_id in range(SHOPS)
+                ]
+            )
+            shops_again = await asyncio.gather(
+                *[
+                    gear_manager.get_member_daily_items(member_id, guild_id)
+                    for guild_id in GUILD_LEVELS
+                    for member_id in range(SHOPS)
+                ]
+            )
+        finally:
+            await database.close()
+
+    sequential_digest = digest(sequential)
+    concurrent_digest = digest(concurrent)
+
+    print(f"{len(all_cases)} seeded drops, {len(shops)} daily shops")
+    print(f"sequential: {sequential_digest}")
+    print(f"concurrent: {concurrent_digest}")
+
+    failed = False
+    if sequential_digest != GOLDEN_DIGEST:
+        print("sequential drops differ from the golden output")
+        failed = True
+    if concurrent_digest != sequential_digest:
+        print("concurrent drops differ from sequential drops")
+        failed = True
+    shop_keys = [[drop_key(item) for item in shop] for shop in shops]
+    if shop_keys != [[drop_key(item) for item in shop] for shop in shops_again]:
+        print("daily shops are not reproducible")
+        failed = True
+    if not global_untouched:
+        print("seeded drops changed the global random state")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,154 @@
+import itertools
+import random
+import sys
+import time
+
+from combat.enchantments.enchantments import *  # noqa: F403
+from combat.enchantments.types import EnchantmentType
+from combat.enemies import *  # noqa: F403
+from combat.enemies.types import EnemyType
+from combat.gear.base_index import DroppableBaseIndex
+from combat.gear.bases import *  # noqa: F403
+from combat.gear.types import Base, EquipmentSlot, GearBaseType
+from combat.gear.uniques import *  # noqa: F403
+from combat.gear.uniques import Unique
+from combat.skills.skills import *  # noqa: F403
+from combat.skills.types import SkillType
+from control.combat.combat_gear_manager import CombatGearManager
+
+LEVELS = range(1, 13)
+SLOTS = [None, EquipmentSlot.SKILL, EquipmentSlot.WEAPON, EquipmentSlot.ACCESSORY]
+ROLLS = 2000
+
+
+def naive_random_base(
+    item_level, enemy, exclude_skills, enchantments, crafting, gear_slot, rng
+):
+    # the drop roll as it used to be: build every base class on every call
+    base_types = list(GearBaseType)
+    if not exclude_skills:
+        base_types += list(SkillType)
+    base_types += [
+        base_type
+        for base_type in EnchantmentType
+        if (enchantments and not EnchantmentType.is_crafting(base_type))
+        or (crafting and EnchantmentType.is_crafting(base_type))
+    ]
+
+    bases = []
+    for base_type in base_types:
+        base = globals()[base_type]()
+        if not base.droppable or issubclass(base.__class__, Unique):
+            continue
+        if gear_slot is not None and base.slot != gear_slot:
+            continue
+        if base.min_level <= item_level <= base.max_level:
+            bases.append(base)
+
+    if len(bases) <= 0:
+        return None
+
+    if enemy is not None:
+        if not enemy.random_loot:
+            bases = []
+        for base_type in enemy.gear_loot_table + enemy.skill_loot_table:
+            bases.append(globals()[base_type]())
+
+    totals = {Base.SKILL: 0, Base.GEAR: 0, Base.ENCHANTMENT: 0}
+    for base in bases:
+        totals[base.base_type] += base.weight
+    total = sum(totals.values())
+
+    skill_mod = 0
+    enchantment_mod = 0
+    if not exclude_skills and totals[Base.SKILL] > 0:
+        skill_mod = CombatGearManager.SKILL_DROP_CHANCE * total / totals[Base.SKILL]
+    if totals[Base.ENCHANTMENT] > 0:
+        enchantment_mod = (
+            CombatGearManager.ENCHANTMENT_DROP_CHANCE * total / totals[Base.ENCHANTMENT]
+        )
+
+    weights = []
+    for base in bases:
+        weight = base.weight
+        if enemy is not None and (
+            base.type in enemy.skill_loot_table or base.type in enemy.gear_loot_table
+        ):
+            scaling = CombatGearManager.MOB_LOOT_BONUS_SCALING
+            if issubclass(base.__class__, Unique):
+                scaling *= CombatGearManager.MOB_LOOT_UNIQUE_SCALING
+            weight *= scaling
+        match base.base_type:
+            case Base.SKILL:
+                weight *= skill_mod
+            case Base.ENCHANTMENT:
+                weight *= enchantment_mod
+            case Base.GEAR:
+                weight *= 1 - (skill_mod + enchantment_mod)
+        weights.append(weight)
+
+    sum_weights = sum(weights)
+    chances = [v / sum_weights for v in weights]
+    return rng.choices(bases, weights=chances)[0].type
+
+
+def indexed_random_base(
+    index, item_level, enemy, exclude_skills, enchantments, crafting, gear_slot, rng
+):
+    table = index.get_table(
+        item_level,
+        enemy=enemy,
+        exclude_skills=exclude_skills,
+        enchantments_unlocked=enchantments,
+        crafting_unlocked=crafting,
+        gear_slot=gear_slot,
+    )
+    if table is None:
+        return None
+    return table.choose(rng).type
+
+
+def main() -> int:
+    index = DroppableBaseIndex(
+        skill_drop_chance=CombatGearManager.SKILL_DROP_CHANCE,
+        enchantment_drop_chance=CombatGearManager.ENCHANTMENT_DROP_CHANCE,
+        mob_loot_bonus_scaling=CombatGearManager.MOB_LOOT_BONUS_SCALING,
+        mob_loot_unique_scaling=CombatGearManager.MOB_LOOT_UNIQUE_SCALING,
+    )
+    enemies = [None] + [globals()[enemy_type]() for enemy_type in EnemyType]
+
+    cases = list(
+        itertools.product(
+            LEVELS, enemies, [False, True], [False, True], [False, True], SLOTS
+        )
+    )
+    mismatches = 0
+    for case_index, case in enumerate(cases):
+        seed = f"golden{case_index}"
+        expected = naive_random_base(*case, random.Random(seed))
+        actual = indexed_random_base(index, *case, random.Random(seed))
+        if expected != actual:
+            mismatches += 1
+            print(f"mismatch for {case}: {expected} != {actual}")
+
+    rng = random.Random(0)
+    case_sample = [rng.choice(cases) for _ in range(ROLLS)]
+
+    start = time.perf_counter()
+    for case in case_sample:
+        naive_random_base(*case, rng)
+    naive = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for case in case_sample:
+        indexed_random_base(index, *case, rng)
+    indexed = time.perf_counter() - start
+
+    print(f"{len(cases)} seeded cases compared, {mismatches} mismatches")
+    print(f"naive:   {ROLLS / naive:.0f} rolls/s")
+    print(f"indexed: {ROLLS / indexed:.0f} rolls/s")
+    return 1 if mismatches > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
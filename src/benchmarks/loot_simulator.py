@@ -0,0 +1,370 @@
+import argparse
+import asyncio
+import math
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+
+from benchmarks.gear_loading import GearLogger
+from benchmarks.loot_determinism import LootGenerator
+from combat.enchantments.enchantment import BaseEnchantment
+from combat.enchantments.enchantments import SkillStacks
+from combat.enchantments.types import EnchantmentType
+from combat.enemies import *  # noqa: F403
+from combat.enemies.enemy import Enemy
+from combat.enemies.types import EnemyType
+from combat.gear.droppable import DroppableBase
+from combat.gear.gear import GearBase
+from combat.gear.types import Base, EquipmentSlot, GearModifierType, Rarity
+from combat.gear.uniques import Unique
+from combat.types import UnlockableFeature
+from config import Config
+from control.combat.combat_gear_manager import CombatGearManager
+from datalayer.database import Database
+
+
+@dataclass
+class LootReport:
+    item_level: int
+    drops: int = 0
+    seconds: float = 0
+    rarities: Counter = field(default_factory=Counter)
+    categories: Counter = field(default_factory=Counter)
+    slots: Counter = field(default_factory=Counter)
+    modifiers: dict[GearModifierType, array] = field(default_factory=dict)
+
+    def merge(self, other: "LootReport"):
+        self.drops += other.drops
+        self.seconds += other.seconds
+        self.rarities.update(other.rarities)
+        self.categories.update(other.categories)
+        self.slots.update(other.slots)
+        for modifier_type, values in other.modifiers.items():
+            self.modifiers.setdefault(modifier_type, array("d")).extend(values)
+
+
+class LootSimulator:
+
+    def __init__(self, gear_manager: CombatGearManager, rng: random.Random):
+        self.gear_manager = gear_manager
+        self.rng = rng
+        self.bases: dict[str, DroppableBase] = {}
+
+    async def get_base(self, base_type) -> DroppableBase:
+        if base_type not in self.bases:
+            self.bases[base_type] = await self.gear_manager.factory.get_base(base_type)
+        return self.bases[base_type]
+
+    async def simulate(
+        self,
+        item_level: int,
+        drops: int,
+        enemy: Enemy = None,
+        exclude_skills: bool = False,
+    ) -> LootReport:
+        if enemy is None or not enemy.is_boss:
+            return await self.simulate_level(item_level, drops, enemy, exclude_skills)
+
+        # bosses roll one level higher some of the time, see generate_encounter_drop
+        chance = self.gear_manager.BOSS_PLUS_LEVEL_CHANCE
+        plus_level = sum(1 for _ in range(drops) if self.rng.random() < chance)
+        report = await self.simulate_level(
+            item_level, drops - plus_level, enemy, exclude_skills
+        )
+        report.merge(
+            await self.simulate_level(item_level + 1, plus_level, enemy, exclude_skills)
+        )
+        return report
+
+    async def simulate_level(
+        self,
+        item_level: int,
+        drops: int,
+        enemy: Enemy = None,
+        exclude_skills: bool = False,
+    ) -> LootReport:
+        start = time.perf_counter()
+        report = LootReport(item_level)
+
+        # simulated guilds are exactly at the item level
+        unlocked = [
+            feature
+            for feature, level in Config.UNLOCK_LEVELS.items()
+            if level <= item_level
+        ]
+        table = self.gear_manager.base_index.get_table(
+            item_level,
+            enemy=enemy,
+            exclude_skills=exclude_skills,
+            enchantments_unlocked=UnlockableFeature.ENCHANTMENTS in unlocked,
+            crafting_unlocked=UnlockableFeature.CRAFTING in unlocked,
+        )
+        if table is None or drops <= 0:
+            return report
+
+        chances = await self.gear_manager.get_rarity_chances(item_level)
+        max_rarity = await self.gear_manager.get_max_rarity(item_level)
+
+        # one batched draw per dimension, then resolve each distinct
+        # (base, rarity) combination once instead of once per drop
+        entry_indices = self.rng.choices(
+            range(len(table.entries)), cum_weights=table.cumulative_weights, k=drops
+        )
+        rarities = self.rng.choices(
+            list(chances.keys()), weights=list(chances.values()), k=drops
+        )
+
+        groups = Counter(zip(entry_indices, rarities, strict=True))
+        for (entry_index, rarity), count in groups.items():
+            base = await self.get_base(table.entries[entry_index].type)
+
+            if rarity == Rarity.UNIQUE:
+                if len(base.uniques) <= 0:
+                    rarity = max_rarity
+                else:
+                    picks = Counter(self.rng.choices(base.uniques, k=count))
+                    for unique_type, unique_count in picks.items():
+                        unique = await self.get_base(unique_type)
+                        await self.add_drops(
+                            report, item_level, unique, rarity, unique_count
+                        )
+                    continue
+
+            if issubclass(base.__class__, Unique):
+                rarity = Rarity.UNIQUE
+
+            await self.add_drops(report, item_level, base, rarity, count)
+
+        report.seconds = time.perf_counter() - start
+        return report
+
+    async def add_drops(
+        self,
+        report: LootReport,
+        item_level: int,
+        base: DroppableBase,
+        rarity: Rarity,
+        count: int,
+    ):
+        match base.base_type:
+            case Base.ENCHANTMENT:
+                base_enchantment: BaseEnchantment = base
+                if base_enchantment.enchantment_type == EnchantmentType.SKILL_STACKS:
+                    base_enchantment = SkillStacks(item_level, rng=self.rng)
+                rarity = await self.gear_manager.get_enchantment_rarity(
+                    base_enchantment, rarity
+                )
+            case Base.GEAR:
+                await self.add_modifiers(report, item_level, base, rarity, count)
+
+        report.drops += count
+        report.rarities[rarity] += count
+        report.categories[base.base_type] += count
+        report.slots[base.slot] += count
+
+    async def add_modifiers(
+        self,
+        report: LootReport,
+        item_level: int,
+        base: GearBase,
+        rarity: Rarity,
+        count: int,
+    ):
+        gear_manager = self.gear_manager
+
+        if isinstance(base, Unique):
+            unique: Unique = base
+            for modifier_type, scaling in unique.unique_modifiers.items():
+                effective_base = base
+                if base.slot == EquipmentSlot.WEAPON and modifier_type in [
+                    GearModifierType.WEAPON_DAMAGE_MIN,
+                    GearModifierType.WEAPON_DAMAGE_MAX,
+                ]:
+                    effective_base = gear_manager.UNIQE_BASE_UPSCALE[item_level]
+
+                min_roll, max_roll = await gear_manager.get_modifier_boundaries(
+                    effective_base, item_level, modifier_type
+                )
+                self.add_values(
+                    report,
+                    modifier_type,
+                    min_roll * 0.9,
+                    max_roll * 1.1,
+                    count,
+                    scaling,
+                )
+            return
+
+        allowed_modifiers = base.get_allowed_modifiers()
+        modifier_count = gear_manager.MODIFIER_COUNT[rarity]
+
+        picked = Counter()
+        for _ in range(count):
+            picked.update(self.rng.sample(allowed_modifiers, k=modifier_count))
+        for modifier_type in base.modifiers:
+            picked[modifier_type] += count
+
+        for modifier_type, modifier_count in picked.items():
+            min_roll, max_roll = await gear_manager.get_modifier_boundaries(
+                base, item_level, modifier_type
+            )
+            self.add_values(report, modifier_type, min_roll, max_roll, modifier_count)
+
+    def add_values(
+        self,
+        report: LootReport,
+        modifier_type: GearModifierType,
+        min_roll: float,
+        max_roll: float,
+        count: int,
+        scaling: float = 1,
+    ):
+        values = report.modifiers.setdefault(modifier_type, array("d"))
+        width = max_roll - min_roll
+        draw = self.rng.random
+
+        # same value as uniform(min_roll, max_roll) in roll_modifier_value
+        if modifier_type in self.gear_manager.INT_MODIFIERS:
+            values.extend(
+                int((min_roll + width * draw()) * scaling) for _ in range(count)
+            )
+        else:
+            values.extend((min_roll + width * draw()) * scaling for _ in range(count))
+
+
+def print_report(report: LootReport):
+    drops = max(1, report.drops)
+    speed = report.drops / report.seconds if report.seconds > 0 else 0
+    print(
+        f"level {report.item_level}: {report.drops} drops in {report.seconds:.2f}s ({speed:,.0f} drops/s)"
+    )
+
+    def shares(counter: Counter) -> str:
+        return "  ".join(
+            f"{key.value} {count / drops:.2%}" for key, count in counter.most_common()
+        )
+
+    print(f"  rarity:   {shares(report.rarities)}")
+    print(f"  category: {shares(report.categories)}")
+    print(f"  slot:     {shares(report.slots)}")
+
+    if len(report.modifiers) <= 0:
+        return
+
+    print(
+        f"  {'modifier':<20}{'rolls':>10}{'mean':>10}{'p5':>10}{'p50':>10}{'p95':>10}"
+    )
+    for modifier_type in GearModifierType:
+        values = report.modifiers.get(modifier_type)
+        if values is None or len(values) < 2:
+            continue
+        quantiles = statistics.quantiles(values, n=20)
+        print(
+            f"  {modifier_type.value:<20}{len(values):>10}{statistics.fmean(values):>10.2f}"
+            f"{quantiles[0]:>10.2f}{quantiles[9]:>10.2f}{quantiles[18]:>10.2f}"
+        )
+
+
+async def compare_pipeline(
+    simulator: LootSimulator, levels: list[int], drops: int
+) -> float:
+    # rolls drops through generate_drop and checks the simulator agrees
+    worst = 0
+    with tempfile.TemporaryDirectory() as directory:
+        database = Database(None, GearLogger(), os.path.join(directory, "sim.sqlite"))
+        await database.create_tables()
+        try:
+            gear_manager = LootGenerator(database)
+            for level in levels:
+                await database.get_guild_level(level)
+                await database.set_guild_level(level, level)
+
+                start = time.perf_counter()
+                rarities = Counter()
+                for _ in range(drops):
+                    drop = await gear_manager.generate_drop(None, level, level)
+                    if drop is not None:
+                        rarities[drop.rarity] += 1
+                pipeline_seconds = time.perf_counter() - start
+
+                report = await simulator.simulate_level(level, drops)
+                total = max(1, sum(rarities.values()))
+                difference = max(
+                    abs(rarities[rarity] / total - report.rarities[rarity] / drops)
+                    for rarity in Rarity
+                )
+                worst = max(worst, difference)
+                print(
+                    f"level {level}: pipeline {drops / pipeline_seconds:,.0f} drops/s, "
+                    f"simulator {drops / report.seconds:,.0f} drops/s, "
+                    f"max rarity share difference {difference:.2%}"
+                )
+        finally:
+            await database.close()
+    return worst
+
+
+def parse_levels(text: str) -> list[int]:
+    levels = []
+    for part in text.split(","):
+        if "-" in part:
+            first, last = part.split("-")
+            levels.extend(range(int(first), int(last) + 1))
+        else:
+            levels.append(int(part))
+    return levels
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.loot_simulator",
+        description="Simulate loot drops offline and report their distributions.",
+    )
+    parser.add_argument("--levels", default="1-12", help="e.g. 1-12 or 3,5,7")
+    parser.add_argument("--drops", type=int, default=200_000, help="drops per level")
+    parser.add_argument("--enemy", choices=[enemy.value for enemy in EnemyType])
+    parser.add_argument("--exclude-skills", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--compare",
+        type=int,
+        default=0,
+        metavar="DROPS",
+        help="also roll DROPS drops per level through generate_drop and compare",
+    )
+    args = parser.parse_args()
+
+    levels = parse_levels(args.levels)
+    simulator = LootSimulator(LootGenerator(None), random.Random(args.seed))
+
+    enemy = None
+    if args.enemy is not None:
+        enemy = globals()[EnemyType(args.enemy)]()
+        print(
+            f"{enemy.name}: {enemy.min_level}-{enemy.max_level}, bonus loot {enemy.bonus_loot_chance:.0%}"
+        )
+
+    for level in levels:
+        report = await simulator.simulate(
+            level, args.drops, enemy=enemy, exclude_skills=args.exclude_skills
+        )
+        print_report(report)
+
+    if args.compare > 0:
+        # rarity shares of two independent samples, so allow four standard
+        # errors of their difference
+        worst = await compare_pipeline(simulator, levels, args.compare)
+        if worst > 4 * math.sqrt(0.5 / args.compare):
+            print("simulator and pipeline disagree")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,47 @@
+import datetime
+import random
+import time
+
+from datalayer.police_list import PoliceList
+
+MESSAGE_COUNT = 200000
+USER_COUNT = 50
+SPAMMER_COUNT = 5
+MESSAGE_LIMIT = 4
+MESSAGE_LIMIT_INTERVAL = 10
+
+
+def main():
+    rng = random.Random(0)
+    user_list = PoliceList()
+    spammers = set(range(SPAMMER_COUNT))
+    timestamp = datetime.datetime.now(datetime.UTC)
+    spam_increases = 0
+
+    start = time.perf_counter()
+    for _ in range(MESSAGE_COUNT):
+        # spammers keep posting bursts that stay inside the rate limit window
+        author_id = rng.randrange(USER_COUNT)
+        if rng.random() < 0.8:
+            author_id = rng.choice(tuple(spammers))
+        timestamp += datetime.timedelta(milliseconds=rng.randint(1, 400))
+
+        if not user_list.has_user(author_id):
+            user_list.add_user(author_id)
+        user_node = user_list.get_user(author_id)
+
+        user_list.track_spam_message(author_id, timestamp)
+        if user_node.check_spam_score_increase(MESSAGE_LIMIT_INTERVAL, MESSAGE_LIMIT):
+            spam_increases += 1
+
+        user_list.track_timeout_message(author_id, timestamp)
+        user_node.timeout_check(MESSAGE_LIMIT_INTERVAL, MESSAGE_LIMIT)
+
+    duration = time.perf_counter() - start
+    print(
+        f"{MESSAGE_COUNT / duration:.0f} messages/s ({duration:.2f}s, {spam_increases} spam score increases)"
+    )
+
+
+if __name__ == "__main__":
+    main()
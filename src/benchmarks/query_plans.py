@@ -0,0 +1,107 @@
+import asyncio
+import os
+import sys
+import tempfile
+
+from datalayer.database import Database
+from datalayer.patches.patch import DBPatcher
+from items.types import ItemType
+
+GUILD_ID = 1
+MEMBER_ID = 2
+
+# tables that grow with every event and must never be scanned in full
+HOT_TABLES = [
+    Database.EVENT_TABLE,
+    Database.BEANS_EVENT_TABLE,
+    Database.INVENTORY_EVENT_TABLE,
+    Database.ENCOUNTER_EVENT_TABLE,
+    Database.COMBAT_EVENT_TABLE,
+    Database.STATUS_EFFECT_EVENT_TABLE,
+    Database.GARDEN_EVENT_TABLE,
+    Database.PLOT_TABLE,
+    Database.INTERACTION_EVENT_TABLE,
+    Database.JAIL_EVENT_TABLE,
+    Database.TIMEOUT_EVENT_TABLE,
+    Database.SPAM_EVENT_TABLE,
+    Database.KARMA_EVENT_TABLE,
+    Database.USER_GEAR_TABLE,
+]
+
+
+class PlanLogger:
+
+    def log(self, *args, **kwargs):
+        pass
+
+    def error(self, *args, **kwargs):
+        print(*args)
+
+    def debug(self, *args, **kwargs):
+        pass
+
+
+async def hot_queries(database: Database):
+    await database.get_member_beans(GUILD_ID, MEMBER_ID, season=1)
+    await database.get_guild_beans(GUILD_ID, season=1)
+    await database.get_item_counts_by_user(
+        GUILD_ID, MEMBER_ID, item_types=[ItemType.BAT, ItemType.LOTTERY_TICKET]
+    )
+    await database.get_encounter_events_by_encounter_id(1)
+    await database.get_combat_events_by_encounter_id(1)
+    await database.get_status_effects_by_encounter(1)
+    await database.get_garden_plots(GUILD_ID, 1)
+    await database.get_guild_gardens(GUILD_ID)
+    await database.get_interaction_events_by_user(MEMBER_ID)
+    await database.get_interaction_events_affecting_user(MEMBER_ID)
+    await database.get_timeout_events_by_user(MEMBER_ID)
+    await database.get_spam_events_by_user(MEMBER_ID)
+    await database.get_user_stats(MEMBER_ID)
+    await database.get_user_armory(GUILD_ID, MEMBER_ID)
+
+
+async def main() -> int:
+    with tempfile.TemporaryDirectory() as directory:
+        database = Database(None, PlanLogger(), os.path.join(directory, "plan.sqlite"))
+        await database.create_tables()
+        await DBPatcher(database).migrate()
+        # guild wide garden reads stop early without any garden
+        await database.create_user_garden(GUILD_ID, MEMBER_ID)
+
+        statements = []
+        failures = 0
+        try:
+            for reader in database.pool.reader_connections:
+                await reader.set_trace_callback(statements.append)
+
+            await hot_queries(database)
+
+            for reader in database.pool.reader_connections:
+                await reader.set_trace_callback(None)
+
+            async with database.pool.reader() as db:
+                for statement in statements:
+                    if not statement.lstrip().upper().startswith("SELECT"):
+                        continue
+                    async with db.execute(f"EXPLAIN QUERY PLAN {statement}") as cursor:
+                        plan = [row[3] for row in await cursor.fetchall()]
+
+                    scans = [
+                        step
+                        for step in plan
+                        if step.startswith("SCAN") and step.split()[1] in HOT_TABLES
+                    ]
+                    if len(scans) > 0:
+                        failures += 1
+                        print(" ".join(statement.split()))
+                        for step in plan:
+                            print(f"    {step}")
+        finally:
+            await database.close()
+
+    print(f"checked {len(statements)} statements, {failures} with full table scans")
+    return 1 if failures > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,194 @@
+import asyncio
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmarks.gear_loading import GearLogger
+from control.ranking_manager import RankingManager
+from datalayer.database import Database
+from datalayer.jail import UserJail
+from datalayer.ranking import RankingAggregate
+from datalayer.types import UserInteraction
+from events.beans_event import BeansEvent
+from events.bot_event import BotEvent
+from events.interaction_event import InteractionEvent
+from events.jail_event import JailEvent
+from events.karma_event import KarmaEvent
+from events.spam_event import SpamEvent
+from events.timeout_event import TimeoutEvent
+from events.types import BeansEventType, JailEventType
+
+GUILD_ID = 1
+MEMBERS = 60
+HISTORY = 20000
+LIVE = 3000
+LIMIT = 10_000
+
+
+async def random_event(database: Database, rng: random.Random, jails: list[int]):
+    timestamp = datetime.datetime.now() - datetime.timedelta(seconds=5)
+    member = rng.randrange(MEMBERS)
+    other = rng.randrange(MEMBERS)
+    match rng.randrange(7):
+        case 0 | 1:
+            return InteractionEvent(
+                timestamp, GUILD_ID, rng.choice(list(UserInteraction)), member, other
+            )
+        case 2:
+            return TimeoutEvent(timestamp, GUILD_ID, member, rng.randint(30, 600))
+        case 3:
+            return SpamEvent(timestamp, GUILD_ID, member)
+        case 4:
+            return KarmaEvent(timestamp, GUILD_ID, rng.choice([-1, 1]), member, other)
+        case 5:
+            if len(jails) <= 0 or rng.random() < 0.2:
+                jail = await database.log_jail_sentence(
+                    UserJail(GUILD_ID, member, timestamp)
+                )
+                jails.append(jail.id)
+                return JailEvent(
+                    timestamp, GUILD_ID, JailEventType.JAIL, other, 30, jail.id
+                )
+            return JailEvent(
+                timestamp,
+                GUILD_ID,
+                rng.choice([JailEventType.SLAP, JailEventType.PET, JailEventType.FART]),
+                other,
+                rng.randint(-10, 10),
+                rng.choice(jails),
+            )
+        case 6:
+            if rng.random() < 0.5:
+                return BeansEvent(
+                    timestamp, GUILD_ID, BeansEventType.GAMBA_COST, member, -10
+                )
+            return BeansEvent(
+                timestamp,
+                GUILD_ID,
+                BeansEventType.GAMBA_PAYOUT,
+                member,
+                rng.choice([0, 0, 20, 30]),
+            )
+
+
+async def log_event(
+    database: Database, managers: list[RankingManager], event: BotEvent
+):
+    # mirrors EventManager.listen_for_event: log, then feed the rankings
+    event_id = await database.log_event(event)
+    for manager in managers:
+        await manager.add_event(event, event_id)
+
+
+async def log_events(
+    database: Database,
+    managers: list[RankingManager],
+    rng: random.Random,
+    jails: list[int],
+    count: int,
+):
+    events = [await random_event(database, rng, jails) for _ in range(count)]
+    await asyncio.gather(*[log_event(database, managers, event) for event in events])
+
+
+async def timed_writes(
+    database: Database,
+    managers: list[RankingManager],
+    rng: random.Random,
+    jails: list[int],
+    count: int = None,
+    backfill: asyncio.Task = None,
+) -> list[float]:
+    # a backfill must not hold back the bot's other writes
+    latencies = []
+    while (count is not None and len(latencies) < count) or (
+        backfill is not None and not backfill.done()
+    ):
+        event = await random_event(database, rng, jails)
+        start = time.perf_counter()
+        await log_event(database, managers, event)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def all_rankings(manager: RankingManager) -> dict:
+    return {
+        ranking_type: sorted(
+            await manager.get_rankings(GUILD_ID, ranking_type, None, LIMIT),
+            key=str,
+        )
+        for ranking_type in RankingAggregate.RANKING_TYPES
+    }
+
+
+async def main() -> int:
+    rng = random.Random(0)
+    jails = []
+    with tempfile.TemporaryDirectory() as directory:
+        database = Database(None, GearLogger(), os.path.join(directory, "rank.sqlite"))
+        await database.create_tables()
+        try:
+            manager = RankingManager(None, GearLogger(), database, None)
+            await log_events(database, [manager], rng, jails, HISTORY)
+
+            start = time.perf_counter()
+            await manager.get_rankings(
+                GUILD_ID, RankingAggregate.RANKING_TYPES[0], None, 29
+            )
+            backfill_time = time.perf_counter() - start
+
+            # live events race a second backfill of the same history
+            racing = RankingManager(None, GearLogger(), database, None)
+            await asyncio.gather(
+                log_events(database, [manager, racing], rng, jails, LIVE),
+                racing.get_aggregate(GUILD_ID, None),
+            )
+
+            idle_latencies = await timed_writes(
+                database, [manager, racing], rng, jails, count=20
+            )
+            writing = RankingManager(None, GearLogger(), database, None)
+            backfill = asyncio.create_task(writing.get_aggregate(GUILD_ID, None))
+            latencies = await timed_writes(
+                database, [manager, racing, writing], rng, jails, backfill=backfill
+            )
+
+            start = time.perf_counter()
+            for ranking_type in RankingAggregate.RANKING_TYPES:
+                await manager.get_rankings(GUILD_ID, ranking_type, None, 29)
+            page_time = (time.perf_counter() - start) / len(
+                RankingAggregate.RANKING_TYPES
+            )
+
+            fresh = RankingManager(None, GearLogger(), database, None)
+            expected = await all_rankings(fresh)
+            live = await all_rankings(manager)
+            raced = await all_rankings(racing)
+            written = await all_rankings(writing)
+        finally:
+            await database.close()
+
+    mismatches = [
+        ranking_type.name
+        for ranking_type in RankingAggregate.RANKING_TYPES
+        if live[ranking_type] != expected[ranking_type]
+        or raced[ranking_type] != expected[ranking_type]
+        or written[ranking_type] != expected[ranking_type]
+    ]
+
+    print(f"{HISTORY} historic and {LIVE} live events")
+    print(f"backfill: {backfill_time * 1000:.0f}ms for all ranking types")
+    print(f"page:     {page_time * 1000:.3f}ms per ranking type from memory")
+    print(
+        f"writes: max {max(idle_latencies) * 1000:.1f}ms idle, "
+        f"max {max(latencies) * 1000:.1f}ms during a backfill ({len(latencies)} writes)"
+    )
+    print(f"mismatching rankings: {mismatches}")
+    return 1 if len(mismatches) > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,182 @@
+import asyncio
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmarks.gear_loading import GearLogger
+from benchmarks.ranking_aggregates import MEMBERS, log_events
+from datalayer.database import Database
+from datalayer.patches.patch import DBPatcher
+from datalayer.stats import UserStats
+from datalayer.types import UserInteraction
+from events.interaction_event import InteractionEvent
+from events.types import JailEventType
+
+HISTORY = 20000
+STAT_FIELDS = [
+    "count_in",
+    "count_out",
+    "user_count_in",
+    "user_count_out",
+    "jail_total_duration",
+    "jail_count",
+    "timeout_total_duration",
+    "timeout_count",
+    "min_fart",
+    "max_fart",
+    "spam_score",
+    "total_added_to_others",
+    "total_added_to_self",
+    "total_reduced_from_others",
+    "total_reduced_from_self",
+]
+
+
+async def legacy_user_stats(database: Database, user_id: int) -> UserStats:
+    # the per-event statistics EventManager used to compute
+    user_stats = UserStats()
+    jail_interactions = [JailEventType.FART, JailEventType.PET, JailEventType.SLAP]
+
+    count_out = {interaction_type: 0 for interaction_type in UserInteraction}
+    user_count_out = {}
+    for event in await database.get_interaction_events_by_user(user_id):
+        count_out[event.interaction_type] += 1
+        counts = user_count_out.setdefault(
+            event.to_user_id,
+            {interaction_type: 0 for interaction_type in UserInteraction},
+        )
+        counts[event.interaction_type] += 1
+    user_stats.set_count_out(count_out)
+    user_stats.set_user_count_out(user_count_out)
+
+    count_in = {interaction_type: 0 for interaction_type in UserInteraction}
+    user_count_in = {}
+    for event in await database.get_interaction_events_affecting_user(user_id):
+        count_in[event.interaction_type] += 1
+        counts = user_count_in.setdefault(
+            event.from_user_id,
+            {interaction_type: 0 for interaction_type in UserInteraction},
+        )
+        counts[event.interaction_type] += 1
+    user_stats.set_count_in(count_in)
+    user_stats.set_user_count_in(user_count_in)
+
+    jail_total = 0
+    jail_stays = set()
+    added_to_self = 0
+    reduced_from_self = 0
+    for event in await database.get_jail_events_affecting_user(user_id):
+        if event.jail_event_type in jail_interactions:
+            if event.duration >= 0:
+                added_to_self += event.duration
+            else:
+                reduced_from_self += event.duration
+        jail_total += event.duration
+        jail_stays.add(event.jail_id)
+    user_stats.set_jail_total(jail_total)
+    user_stats.set_jail_amount(len(jail_stays))
+
+    added_to_others = 0
+    reduced_from_others = 0
+    farts = []
+    for event in await database.get_jail_events_by_user(None, user_id):
+        if event.jail_event_type in jail_interactions:
+            if event.duration >= 0:
+                added_to_others += event.duration
+            else:
+                reduced_from_others += event.duration
+        if event.jail_event_type == JailEventType.FART:
+            farts.append(event.duration)
+    user_stats.set_total_added_others(added_to_others)
+    user_stats.set_total_added_self(added_to_self)
+    user_stats.set_total_reduced_from_others(abs(reduced_from_others))
+    user_stats.set_total_reduced_from_self(abs(reduced_from_self))
+    user_stats.set_fart_stats(
+        max(farts) if len(farts) > 0 else None, min(farts) if len(farts) > 0 else None
+    )
+
+    timeout_events = await database.get_timeout_events_by_user(user_id)
+    user_stats.set_timeout_total(sum(event.duration for event in timeout_events))
+    user_stats.set_timeout_amount(len(timeout_events))
+    user_stats.set_spam_score(len(await database.get_spam_events_by_user(user_id)))
+    return user_stats
+
+
+def differences(expected: UserStats, actual: UserStats) -> list[str]:
+    return [
+        name for name in STAT_FIELDS if getattr(expected, name) != getattr(actual, name)
+    ]
+
+
+async def main() -> int:
+    rng = random.Random(0)
+    jails = []
+    mismatches = []
+    with tempfile.TemporaryDirectory() as directory:
+        database = Database(None, GearLogger(), os.path.join(directory, "stats.sqlite"))
+        await database.create_tables()
+        await DBPatcher(database).migrate()
+        try:
+            await log_events(database, [], rng, jails, HISTORY)
+
+            start = time.perf_counter()
+            expected = [
+                await legacy_user_stats(database, user) for user in range(MEMBERS)
+            ]
+            legacy_time = (time.perf_counter() - start) / MEMBERS
+
+            start = time.perf_counter()
+            actual = [await database.get_user_stats(user) for user in range(MEMBERS)]
+            aggregated_time = (time.perf_counter() - start) / MEMBERS
+
+            start = time.perf_counter()
+            cached = [await database.get_user_stats(user) for user in range(MEMBERS)]
+            cached_time = (time.perf_counter() - start) / MEMBERS
+
+            for user in range(MEMBERS):
+                for stats in [actual[user], cached[user]]:
+                    mismatches.extend(
+                        f"user {user}: {name}"
+                        for name in differences(expected[user], stats)
+                    )
+
+            # new events have to evict the snapshots of everyone they touch
+            await log_events(database, [], rng, jails, 500)
+            await database.log_event(
+                InteractionEvent(
+                    datetime.datetime.now() - datetime.timedelta(seconds=5),
+                    1,
+                    UserInteraction.SLAP,
+                    0,
+                    1,
+                )
+            )
+            for user in range(MEMBERS):
+                mismatches.extend(
+                    f"user {user} after invalidation: {name}"
+                    for name in differences(
+                        await legacy_user_stats(database, user),
+                        await database.get_user_stats(user),
+                    )
+                )
+            cache = database.user_stats_cache
+        finally:
+            await database.close()
+
+    print(f"{HISTORY} events, {MEMBERS} members")
+    print(f"legacy:     {legacy_time * 1000:.2f}ms per user")
+    print(f"aggregated: {aggregated_time * 1000:.2f}ms per user")
+    print(f"cached:     {cached_time * 1000:.3f}ms per user")
+    print(
+        f"cache: {cache.hits} hits, {cache.misses} misses, {cache.invalidations} invalidations"
+    )
+    for mismatch in mismatches[:20]:
+        print(f"mismatch: {mismatch}")
+    return 1 if len(mismatches) > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
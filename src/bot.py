@@ -5,7 +5,9 @@ from discord.ext import commands
 
 from control.controller import Controller
 from control.logger import BotLogger
+from control.settings_manager import SettingsManager
 from datalayer.database import Database
+from datalayer.patches.patch import DBPatcher
 
 
 class CrunchyBot(commands.Bot):
@@ -24,6 +26,8 @@ class CrunchyBot(commands.Bot):
         self.controller = Controller(self, self.logger, self.database)
 
         await self.database.create_tables()
+        await DBPatcher(self.database).migrate()
+        await self.controller.get_service(SettingsManager).load_settings()
 
         await self.load_extension("cogs.police")
         await self.load_extension("cogs.jail")
@@ -37,6 +41,11 @@ class CrunchyBot(commands.Bot):
         await self.load_extension("cogs.chat")
         await self.load_extension("cogs.combat")
 
+    async def close(self) -> None:
+        await super().close()
+        if hasattr(self, "database"):
+            await self.database.close()
+
     async def on_guild_join(self, guild):
         self.logger.log(guild.id, "new guild registered.")
 
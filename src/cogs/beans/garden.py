@@ -1,4 +1,6 @@
+import asyncio
 import datetime
+import time
 import traceback
 
 import discord
@@ -9,6 +11,7 @@ from bot import CrunchyBot
 from cogs.beans.beans_group import BeansGroup
 from control.ai_manager import AIManager
 from control.types import AIVersion
+from datalayer.garden import Plot, UserGarden
 from error import ErrorHandler
 from events.garden_event import GardenEvent
 from events.types import GardenEventType, UIEventType
@@ -20,6 +23,8 @@ from view.garden.view import GardenView
 
 class Garden(BeansGroup):
 
+    NOTIFICATION_WORKERS = 8
+
     def __init__(self, bot: CrunchyBot) -> None:
         super().__init__(bot)
         self.ai_manager: AIManager = self.controller.get_service(AIManager)
@@ -94,52 +99,99 @@ class Garden(BeansGroup):
             "sys", "Garden notification task started.", cog=self.__cog_name__
         )
         try:
+            start = time.perf_counter()
+            garden_count = 0
+            pending = []
             for guild in self.bot.guilds:
                 gardens = await self.database.get_guild_gardens(guild.id)
+                garden_count += len(gardens)
                 for garden in gardens:
                     plots = garden.notification_pending_plots()
                     if len(plots) > 0:
-                        user = self.bot.get_user(garden.member_id)
-                        for plot in plots:
-                            event = GardenEvent(
-                                datetime.datetime.now(),
-                                guild.id,
-                                plot.garden_id,
-                                plot.id,
-                                garden.member_id,
-                                GardenEventType.NOTIFICATION,
-                            )
-                            await self.controller.dispatch_event(event)
-                        if user is not None:
-                            self.logger.log(
-                                "sys",
-                                f"Sending garden notification to {user.display_name}",
-                                cog=self.__cog_name__,
-                            )
-                            # message = (
-                            #     f"Hey there, some of your plants on {guild.name} are ready to be harvested.\n"
-                            #     "Make sure to drop by and visit your */beans garden* to not miss out on your rewards!"
-                            # )
-
-                            prompt = (
-                                f"Please create a short notification message adressed to a user named {user.display_name}. "
-                                f"Inform them about their beans garden on server {guild.name} having some plants that are ready for harvest. "
-                                "Also mention that they should come visit their garden soon to take care of them so they wont miss out on the rewards. "
-                            )
-
-                            message = await self.ai_manager.prompt(
-                                guild_id=guild.id,
-                                name=user.display_name,
-                                text_prompt=prompt,
-                                ai_version=AIVersion.GPT4_O_MINI,
-                            )
-
-                            await user.send(message)
+                        pending.append((guild, garden, plots))
+            load_time = time.perf_counter() - start
+
+            # prompts and DMs are network bound, run a few at a time so one
+            # slow user doesn't hold up everyone else in the sweep
+            semaphore = asyncio.Semaphore(self.NOTIFICATION_WORKERS)
+            results = await asyncio.gather(
+                *[
+                    self.__send_garden_notification(semaphore, guild, garden, plots)
+                    for guild, garden, plots in pending
+                ],
+                return_exceptions=True,
+            )
+            sweep_time = time.perf_counter() - start
+
+            sent = len([result for result in results if result is True])
+            errors = [result for result in results if isinstance(result, Exception)]
+            self.logger.log(
+                "sys",
+                f"Garden notifications: {garden_count} gardens loaded in {load_time:.2f}s, {sent}/{len(pending)} users notified, {len(errors)} failed, {sweep_time:.2f}s total.",
+                cog=self.__cog_name__,
+            )
+            if sweep_time > self.garden_notifications.minutes * 60:
+                self.logger.error(
+                    "sys",
+                    f"Garden notification sweep took {sweep_time:.0f}s and overran its interval.",
+                    cog=self.__cog_name__,
+                )
+            if len(errors) > 0:
+                raise errors[0]
         except Exception as e:
             print(traceback.format_exc())
             error_handler = ErrorHandler(self.bot)
             await error_handler.post_error(e)
 
+    async def __send_garden_notification(
+        self,
+        semaphore: asyncio.Semaphore,
+        guild: discord.Guild,
+        garden: UserGarden,
+        plots: list[Plot],
+    ) -> bool:
+        async with semaphore:
+            user = self.bot.get_user(garden.member_id)
+            for plot in plots:
+                event = GardenEvent(
+                    datetime.datetime.now(),
+                    guild.id,
+                    plot.garden_id,
+                    plot.id,
+                    garden.member_id,
+                    GardenEventType.NOTIFICATION,
+                )
+                await self.controller.dispatch_event(event)
+
+            if user is None:
+                return False
+
+            self.logger.log(
+                "sys",
+                f"Sending garden notification to {user.display_name}",
+                cog=self.__cog_name__,
+            )
+            # message = (
+            #     f"Hey there, some of your plants on {guild.name} are ready to be harvested.\n"
+            #     "Make sure to drop by and visit your */beans garden* to not miss out on your rewards!"
+            # )
+
+            prompt = (
+                f"Please create a short notification message adressed to a user named {user.display_name}. "
+                f"Inform them about their beans garden on server {guild.name} having some plants that are ready for harvest. "
+                "Also mention that they should come visit their garden soon to take care of them so they wont miss out on the rewards. "
+            )
+
+            message = await self.ai_manager.prompt(
+                guild_id=guild.id,
+                name=user.display_name,
+                text_prompt=prompt,
+                ai_version=AIVersion.GPT4_O_MINI,
+            )
+
+            await user.send(message)
+            return True
+
     @app_commands.command(name="garden", description="Plant beans in your garden.")
     @app_commands.guild_only()
     async def garden(self, interaction: discord.Interaction):
@@ -1,19 +1,14 @@
-import datetime
 import os
-import traceback
 from typing import Literal
 
 import discord
 from discord import app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 from bot import CrunchyBot
 from cogs.beans.beans_group import BeansGroup
 from control.settings_manager import SettingsManager
 from datalayer.types import PredictionState
-from error import ErrorHandler
-from events.prediction_event import PredictionEvent
-from events.types import PredictionEventType
 
 
 class Predictions(BeansGroup):
@@ -87,83 +82,19 @@ class Predictions(BeansGroup):
 
     @commands.Cog.listener("on_ready")
     async def on_ready_prediction(self) -> None:
-        self.prediction_timeout_check.start()
-
         for guild in self.bot.guilds:
             await self.prediction_manager.init_existing_prediction_messages(guild.id)
 
-        self.logger.log("init", "Predictions loaded.", cog=self.__cog_name__)
+            active_predictions = await self.database.get_predictions_by_guild(
+                guild.id, [PredictionState.APPROVED]
+            )
+            if active_predictions is None:
+                continue
 
-    @tasks.loop(seconds=60)
-    async def prediction_timeout_check(self):
-        self.logger.debug(
-            "sys", "prediction timeout check task started", cog=self.__cog_name__
-        )
+            for prediction in active_predictions:
+                self.prediction_manager.schedule_lock(prediction)
 
-        try:
-            for guild in self.bot.guilds:
-                guild_id = guild.id
-                self.logger.debug(
-                    guild_id,
-                    f"prediction timeout for guild {guild.name}.",
-                    cog=self.__cog_name__,
-                )
-
-                active_predictions = await self.database.get_predictions_by_guild(
-                    guild_id, [PredictionState.APPROVED]
-                )
-
-                if active_predictions is None:
-                    continue
-
-                for prediction in active_predictions:
-                    time_now = datetime.datetime.now()
-                    lock_in_datetime = prediction.lock_datetime
-
-                    if lock_in_datetime is None:
-                        continue
-
-                    remainder = lock_in_datetime - time_now
-                    remainder = int(max(remainder.total_seconds() / 60, 0))
-
-                    self.logger.debug(
-                        guild_id,
-                        f"prediction timeout check for {prediction.content}. Remaining: {remainder}",
-                        cog=self.__cog_name__,
-                    )
-
-                    if time_now > lock_in_datetime:
-
-                        prediction.state = PredictionState.LOCKED
-                        prediction.lock_datetime = None
-                        await self.database.update_prediction(prediction)
-
-                        event = PredictionEvent(
-                            datetime.datetime.now(),
-                            guild_id,
-                            prediction.id,
-                            self.bot.user.id,
-                            PredictionEventType.LOCK,
-                        )
-                        await self.controller.dispatch_event(event)
-
-                        bean_channels = (
-                            await self.settings_manager.get_beans_notification_channels(
-                                guild_id
-                            )
-                        )
-                        announcement = (
-                            f"**This prediction has been locked in!**\n> {prediction.content}\nNo more bets will be accepted. "
-                            "The winners will be paid out once an outcome is achieved. Good luck!\nYou can also submit your own "
-                            "prediction ideas in the overview channel or in the `/shop`."
-                        )
-                        for channel_id in bean_channels:
-                            channel = guild.get_channel(channel_id)
-                            await channel.send(announcement)
-        except Exception as e:
-            print(traceback.format_exc())
-            error_handler = ErrorHandler(self.bot)
-            await error_handler.post_error(e)
+        self.logger.log("init", "Predictions loaded.", cog=self.__cog_name__)
 
     @app_commands.command(
         name="prediction", description="Bet your beans on various predictions."
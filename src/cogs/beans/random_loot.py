@@ -6,11 +6,13 @@ import traceback
 
 import discord
 from discord import app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 from bot import CrunchyBot
 from cogs.beans.beans_group import BeansGroup
+from control.deadline_scheduler import DeadlineScheduler
 from control.settings_manager import SettingsManager
+from control.types import TimerType
 from error import ErrorHandler
 from events.types import LootBoxEventType
 from view.settings_modal import SettingsModal
@@ -23,6 +25,9 @@ class RandomLoot(BeansGroup):
     def __init__(self, bot: CrunchyBot) -> None:
         super().__init__(bot)
         self.lootbox_timers: dict[int, datetime.datetime] = {}
+        self.deadline_scheduler: DeadlineScheduler = self.controller.get_service(
+            DeadlineScheduler
+        )
 
     @staticmethod
     async def __has_permission(interaction: discord.Interaction) -> bool:
@@ -53,10 +58,19 @@ class RandomLoot(BeansGroup):
             minutes=next_drop_delay
         )
         self.lootbox_timers[guild_id] = next_drop
+        self.__schedule_lootbox_check(guild_id, next_drop)
+
+    def __schedule_lootbox_check(self, guild_id: int, deadline: datetime.datetime):
+        async def check():
+            await self.__run_lootbox_check(guild_id)
+
+        self.deadline_scheduler.schedule(
+            TimerType.LOOTBOX_DROP, guild_id, guild_id, deadline, check
+        )
 
     @commands.Cog.listener("on_ready")
     async def on_ready_randomloot(self):
-        self.loot_box_task.start()
+        await self.__init_lootbox_timers()
         self.logger.log("init", "RandomLoot loaded.", cog=self.__cog_name__)
 
     @commands.Cog.listener("on_guild_join")
@@ -69,89 +83,98 @@ class RandomLoot(BeansGroup):
     @commands.Cog.listener("on_guild_remove")
     async def on_guild_remove_randomloot(self, guild):
         del self.lootbox_timers[guild.id]
+        self.deadline_scheduler.cancel(TimerType.LOOTBOX_DROP, guild.id)
 
-    @tasks.loop(minutes=1)
-    async def loot_box_task(self):
-        self.logger.debug("sys", "Lootbox task started.", cog=self.__cog_name__)
+    async def __run_lootbox_check(self, guild_id: int):
+        guild = self.bot.get_guild(guild_id)
+        if guild is None:
+            return
 
+        next_check = datetime.datetime.now() + datetime.timedelta(minutes=1)
         try:
-            for guild in self.bot.guilds:
+            next_check = await self.__check_lootbox(guild)
+        except Exception as e:
+            print(traceback.format_exc())
+            error_handler = ErrorHandler(self.bot)
+            await error_handler.post_error(e)
 
-                if not await self.settings_manager.get_beans_enabled(guild.id):
-                    continue
+        self.__schedule_lootbox_check(guild_id, next_check)
 
-                loot_box_event = None
+    async def __check_lootbox(self, guild: discord.Guild) -> datetime.datetime:
+        self.logger.debug(guild.id, "Lootbox check started.", cog=self.__cog_name__)
 
-                timeout = self.lootbox_timers[guild.id]
+        if not await self.settings_manager.get_beans_enabled(guild.id):
+            return self.deadline_scheduler.next_full_hour()
 
-                last_loot_box = await self.database.get_last_loot_box_drop(guild.id)
-                if last_loot_box is not None:
-                    if last_loot_box.has_mimic() and timeout is None:
-                        self.logger.log(
-                            guild.id,
-                            "Last lootbox was mimic, applying new timer.",
-                            cog=self.__cog_name__,
-                        )
-                        await self.__reevaluate_next_lootbox(guild.id)
-                        continue
+        loot_box_event = None
 
-                    lootbox_events = await self.database.get_loot_box_events_by_lootbox(
-                        last_loot_box.id
-                    )
-                    if len(lootbox_events) > 0:
-                        loot_box_event = lootbox_events[0]
+        timeout = self.lootbox_timers.get(guild.id)
 
-                if loot_box_event is None and timeout is None:
-                    self.logger.log(
-                        guild.id,
-                        "No previous lootbox found. applying timer.",
-                        cog=self.__cog_name__,
-                    )
-                    await self.__reevaluate_next_lootbox(guild.id)
-                    continue
-
-                if timeout is None:
-                    if loot_box_event.loot_box_event_type == LootBoxEventType.DROP:
-                        difference = datetime.datetime.now() - loot_box_event.datetime
-                        if difference.total_seconds() > self.LOOTBOX_TIMEOUT:
-                            self.logger.log(
-                                guild.id,
-                                "Lootbox not claimed after 10 hours, resetting timer.",
-                                cog=self.__cog_name__,
-                            )
-                            await self.__reevaluate_next_lootbox(guild.id)
-                        continue
+        last_loot_box = await self.database.get_last_loot_box_drop(guild.id)
+        if last_loot_box is not None:
+            if last_loot_box.has_mimic() and timeout is None:
+                self.logger.log(
+                    guild.id,
+                    "Last lootbox was mimic, applying new timer.",
+                    cog=self.__cog_name__,
+                )
+                await self.__reevaluate_next_lootbox(guild.id)
+                return self.lootbox_timers[guild.id]
 
+            lootbox_events = await self.database.get_loot_box_events_by_lootbox(
+                last_loot_box.id
+            )
+            if len(lootbox_events) > 0:
+                loot_box_event = lootbox_events[0]
+
+        if loot_box_event is None and timeout is None:
+            self.logger.log(
+                guild.id,
+                "No previous lootbox found. applying timer.",
+                cog=self.__cog_name__,
+            )
+            await self.__reevaluate_next_lootbox(guild.id)
+            return self.lootbox_timers[guild.id]
+
+        if timeout is None:
+            if loot_box_event.loot_box_event_type == LootBoxEventType.DROP:
+                difference = datetime.datetime.now() - loot_box_event.datetime
+                if difference.total_seconds() > self.LOOTBOX_TIMEOUT:
                     self.logger.log(
                         guild.id,
-                        "Lootbox claimed, applying new timeouit.",
+                        "Lootbox not claimed after 10 hours, resetting timer.",
                         cog=self.__cog_name__,
                     )
                     await self.__reevaluate_next_lootbox(guild.id)
-                    continue
+                    return self.lootbox_timers[guild.id]
+                # claiming the box moves this check up
+                return loot_box_event.datetime + datetime.timedelta(
+                    seconds=self.LOOTBOX_TIMEOUT + 1
+                )
 
-                if datetime.datetime.now() < timeout:
-                    continue
+            self.logger.log(
+                guild.id,
+                "Lootbox claimed, applying new timeouit.",
+                cog=self.__cog_name__,
+            )
+            await self.__reevaluate_next_lootbox(guild.id)
+            return self.lootbox_timers[guild.id]
 
-                bean_channels = await self.settings_manager.get_beans_channels(guild.id)
-                if len(bean_channels) == 0:
-                    continue
-                self.logger.log(
-                    guild.id, "Lootbox timeout reached.", cog=self.__cog_name__
-                )
-                await self.item_manager.drop_loot_box(
-                    guild, secrets.choice(bean_channels)
-                )
+        if datetime.datetime.now() < timeout:
+            return timeout
 
-                self.lootbox_timers[guild.id] = None
-        except Exception as e:
-            print(traceback.format_exc())
-            error_handler = ErrorHandler(self.bot)
-            await error_handler.post_error(e)
+        bean_channels = await self.settings_manager.get_beans_channels(guild.id)
+        if len(bean_channels) == 0:
+            return self.deadline_scheduler.next_full_hour()
+        self.logger.log(guild.id, "Lootbox timeout reached.", cog=self.__cog_name__)
+        await self.item_manager.drop_loot_box(guild, secrets.choice(bean_channels))
+
+        self.lootbox_timers[guild.id] = None
+        # mimics reset the timer right away, everything else waits for a claim
+        return datetime.datetime.now() + datetime.timedelta(minutes=1)
 
-    @loot_box_task.before_loop
-    async def loot_box_task_before(self):
-        self.logger.log("sys", "Lootbox before loop started.", cog=self.__cog_name__)
+    async def __init_lootbox_timers(self):
+        self.logger.log("sys", "Lootbox timers initializing.", cog=self.__cog_name__)
 
         try:
             for guild in self.bot.guilds:
@@ -207,6 +230,7 @@ class RandomLoot(BeansGroup):
                 )
 
                 self.lootbox_timers[guild.id] = next_drop
+                self.__schedule_lootbox_check(guild.id, next_drop)
         except Exception as e:
             print(traceback.format_exc())
             error_handler = ErrorHandler(self.bot)
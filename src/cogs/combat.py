@@ -7,7 +7,7 @@ from typing import Literal
 
 import discord
 from discord import app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 from bot import CrunchyBot
 from combat.enchantments.types import EnchantmentType
@@ -23,10 +23,11 @@ from control.combat.discord_manager import DiscordManager
 from control.combat.encounter_manager import EncounterManager
 from control.combat.object_factory import ObjectFactory
 from control.controller import Controller
+from control.deadline_scheduler import DeadlineScheduler
 from control.imgur_manager import ImgurManager
 from control.logger import BotLogger
 from control.settings_manager import SettingsManager
-from control.types import UserSettingType
+from control.types import TimerType, UserSettingType
 from control.user_settings_manager import UserSettingsManager
 from datalayer.database import Database
 from error import ErrorHandler
@@ -73,6 +74,9 @@ class Combat(commands.Cog):
         self.discord: DiscordManager = self.controller.get_service(DiscordManager)
         self.imgur_manager: ImgurManager = self.controller.get_service(ImgurManager)
         self.factory: ObjectFactory = self.controller.get_service(ObjectFactory)
+        self.deadline_scheduler: DeadlineScheduler = self.controller.get_service(
+            DeadlineScheduler
+        )
         self.enemy_timers = {}
         self.enemy_timers_low_lvl = {}
 
@@ -142,6 +146,7 @@ class Combat(commands.Cog):
             minutes=next_spawn_delay
         )
         self.enemy_timers[guild_id] = next_spawn
+        self.__schedule_encounter_check(guild_id)
 
     async def __reevaluate_next_low_lvl_enemy(self, guild_id: int) -> None:
         next_spawn_delay = random.randint(
@@ -156,13 +161,53 @@ class Combat(commands.Cog):
             minutes=next_spawn_delay
         )
         self.enemy_timers_low_lvl[guild_id] = next_spawn
+        self.__schedule_low_lvl_encounter_check(guild_id)
+
+    def __schedule_encounter_check(self, guild_id: int):
+        if guild_id not in self.enemy_timers:
+            return
+
+        # disabled guilds and spawns outside the max lvl hours retry hourly
+        deadline = self.enemy_timers[guild_id]
+        if deadline <= datetime.datetime.now():
+            deadline = self.deadline_scheduler.next_full_hour()
+
+        async def check():
+            await self.__run_encounter_check(guild_id)
+
+        self.deadline_scheduler.schedule(
+            TimerType.ENCOUNTER_SPAWN, guild_id, guild_id, deadline, check
+        )
+
+    def __schedule_low_lvl_encounter_check(self, guild_id: int):
+        if guild_id not in self.enemy_timers_low_lvl:
+            return
+
+        deadline = self.enemy_timers_low_lvl[guild_id]
+        if deadline <= datetime.datetime.now():
+            deadline = self.deadline_scheduler.next_full_hour()
+
+        async def check():
+            await self.__run_low_lvl_encounter_check(guild_id)
+
+        self.deadline_scheduler.schedule(
+            TimerType.LOW_LVL_ENCOUNTER_SPAWN, guild_id, guild_id, deadline, check
+        )
 
     @commands.Cog.listener("on_ready")
     async def on_ready_combat(self):
+        await self.imgur_manager.prefetch_albums()
         for guild in self.bot.guilds:
             await self.discord.refresh_combat_messages(guild.id, purge=True)
-        self.random_encounter_task.start()
-        self.random_low_lvl_encounter_task.start()
+
+        await self.__init_encounter_timers()
+        for guild_id in self.enemy_timers:
+            self.__schedule_encounter_check(guild_id)
+
+        await self.__init_low_lvl_encounter_timers()
+        for guild_id in self.enemy_timers_low_lvl:
+            self.__schedule_low_lvl_encounter_check(guild_id)
+
         self.logger.log("init", "Combat loaded.", cog=self.__cog_name__)
 
     @commands.Cog.listener("on_guild_join")
@@ -177,118 +222,121 @@ class Combat(commands.Cog):
     async def on_guild_remove_combat(self, guild):
         del self.enemy_timers[guild.id]
         del self.enemy_timers_low_lvl[guild.id]
+        self.deadline_scheduler.cancel(TimerType.ENCOUNTER_SPAWN, guild.id)
+        self.deadline_scheduler.cancel(TimerType.LOW_LVL_ENCOUNTER_SPAWN, guild.id)
+
+    async def __run_encounter_check(self, guild_id: int):
+        guild = self.bot.get_guild(guild_id)
+        if guild is None:
+            return
+
+        try:
+            await self.__check_encounter(guild)
+        except Exception as e:
+            print(traceback.format_exc())
+            error_handler = ErrorHandler(self.bot)
+            await error_handler.post_error(e)
 
-    @tasks.loop(minutes=1)
-    async def random_encounter_task(self):
+        self.__schedule_encounter_check(guild_id)
+
+    async def __check_encounter(self, guild: discord.Guild):
         self.logger.debug(
-            "sys", "Random Encounter task started.", cog=self.__cog_name__
+            guild.id, "Random Encounter check started.", cog=self.__cog_name__
         )
 
-        try:
-            for guild in self.bot.guilds:
-                if guild.id not in self.enemy_timers:
-                    continue
+        if guild.id not in self.enemy_timers:
+            return
 
-                if not await self.settings_manager.get_combat_enabled(guild.id):
-                    continue
+        if not await self.settings_manager.get_combat_enabled(guild.id):
+            return
 
-                current_time = datetime.datetime.now()
-                if current_time < self.enemy_timers[guild.id]:
-                    continue
+        current_time = datetime.datetime.now()
+        if current_time < self.enemy_timers[guild.id]:
+            return
 
-                start_hour = await self.settings_manager.get_combat_max_lvl_start(
-                    guild.id
-                )
-                end_hour = await self.settings_manager.get_combat_max_lvl_end(guild.id)
-
-                current_hour = current_time.hour
-
-                post_start = start_hour <= current_hour
-                pre_end = current_hour < end_hour
-
-                if start_hour < end_hour:
-                    if current_time.weekday() in [4, 5] and not pre_end:
-                        pre_end = True
-                    if current_time.weekday() in [5, 6] and not post_start:
-                        post_start = True
-                    if not (post_start and pre_end):
-                        continue
-                else:
-                    if current_time.weekday() in [5, 6] and not pre_end:
-                        pre_end = True
-                    if current_time.weekday() in [5, 6] and not post_start:
-                        post_start = True
-                    if not (post_start or pre_end):
-                        continue
-
-                self.logger.log("sys", "Enemy timeout reached.", cog=self.__cog_name__)
-                await self.__reevaluate_next_enemy(guild.id)
-
-                combat_channels = await self.settings_manager.get_combat_channels(
-                    guild.id
-                )
-                if len(combat_channels) == 0:
-                    continue
+        start_hour = await self.settings_manager.get_combat_max_lvl_start(guild.id)
+        end_hour = await self.settings_manager.get_combat_max_lvl_end(guild.id)
 
-                encounter_level = await self.database.get_guild_level(guild.id)
+        current_hour = current_time.hour
 
-                await self.encounter_manager.spawn_encounter(
-                    guild, level=encounter_level
-                )
+        post_start = start_hour <= current_hour
+        pre_end = current_hour < end_hour
+
+        if start_hour < end_hour:
+            if current_time.weekday() in [4, 5] and not pre_end:
+                pre_end = True
+            if current_time.weekday() in [5, 6] and not post_start:
+                post_start = True
+            if not (post_start and pre_end):
+                return
+        else:
+            if current_time.weekday() in [5, 6] and not pre_end:
+                pre_end = True
+            if current_time.weekday() in [5, 6] and not post_start:
+                post_start = True
+            if not (post_start or pre_end):
+                return
+
+        self.logger.log("sys", "Enemy timeout reached.", cog=self.__cog_name__)
+        await self.__reevaluate_next_enemy(guild.id)
+
+        combat_channels = await self.settings_manager.get_combat_channels(guild.id)
+        if len(combat_channels) == 0:
+            return
+
+        encounter_level = await self.database.get_guild_level(guild.id)
+
+        await self.encounter_manager.spawn_encounter(guild, level=encounter_level)
+
+    async def __run_low_lvl_encounter_check(self, guild_id: int):
+        guild = self.bot.get_guild(guild_id)
+        if guild is None:
+            return
+
+        try:
+            await self.__check_low_lvl_encounter(guild)
         except Exception as e:
             print(traceback.format_exc())
             error_handler = ErrorHandler(self.bot)
             await error_handler.post_error(e)
 
-    @tasks.loop(minutes=1)
-    async def random_low_lvl_encounter_task(self):
+        self.__schedule_low_lvl_encounter_check(guild_id)
+
+    async def __check_low_lvl_encounter(self, guild: discord.Guild):
         self.logger.debug(
-            "sys", "Random low lvl Encounter task started.", cog=self.__cog_name__
+            guild.id, "Random low lvl Encounter check started.", cog=self.__cog_name__
         )
 
-        try:
-            for guild in self.bot.guilds:
-                if guild.id not in self.enemy_timers_low_lvl:
-                    continue
+        if guild.id not in self.enemy_timers_low_lvl:
+            return
 
-                max_encounter_level = await self.database.get_guild_level(guild.id) - 1
-                max_encounter_level = max(1, max_encounter_level)
+        max_encounter_level = await self.database.get_guild_level(guild.id) - 1
+        max_encounter_level = max(1, max_encounter_level)
 
-                if max_encounter_level <= 0:
-                    continue
+        if max_encounter_level <= 0:
+            return
 
-                if datetime.datetime.now() < self.enemy_timers_low_lvl[guild.id]:
-                    continue
+        if datetime.datetime.now() < self.enemy_timers_low_lvl[guild.id]:
+            return
 
-                if not await self.settings_manager.get_combat_enabled(guild.id):
-                    continue
+        if not await self.settings_manager.get_combat_enabled(guild.id):
+            return
 
-                self.logger.log(
-                    "sys", "Low Lvl Enemy timeout reached.", cog=self.__cog_name__
-                )
-                await self.__reevaluate_next_low_lvl_enemy(guild.id)
+        self.logger.log("sys", "Low Lvl Enemy timeout reached.", cog=self.__cog_name__)
+        await self.__reevaluate_next_low_lvl_enemy(guild.id)
 
-                combat_channels = await self.settings_manager.get_combat_channels(
-                    guild.id
-                )
-                if len(combat_channels) == 0:
-                    continue
+        combat_channels = await self.settings_manager.get_combat_channels(guild.id)
+        if len(combat_channels) == 0:
+            return
 
-                encounter_level = random.randint(1, max_encounter_level)
+        encounter_level = random.randint(1, max_encounter_level)
 
-                await self.encounter_manager.spawn_encounter(
-                    guild, level=encounter_level
-                )
-        except Exception as e:
-            print(traceback.format_exc())
-            error_handler = ErrorHandler(self.bot)
-            await error_handler.post_error(e)
+        await self.encounter_manager.spawn_encounter(guild, level=encounter_level)
 
-    @random_encounter_task.before_loop
-    async def random_encounter_task_before(self):
+    async def __init_encounter_timers(self):
         try:
             self.logger.log(
-                "sys", "Random Encounter before loop started.", cog=self.__cog_name__
+                "sys", "Random Encounter timers initializing.", cog=self.__cog_name__
             )
             for guild in self.bot.guilds:
                 if not await self.settings_manager.get_combat_enabled(guild.id):
@@ -347,29 +395,10 @@ class Combat(commands.Cog):
             error_handler = ErrorHandler(self.bot)
             await error_handler.post_error(e)
 
-    @random_encounter_task.after_loop
-    async def on_task_cancel(self):
-        if self.random_encounter_task.is_being_cancelled():
-            self.logger.error(
-                "sys",
-                f"Encounter Loop forcefully stopped. next iteration: {self.random_encounter_task.next_iteration}",
-                cog=self.__cog_name__,
-            )
-
-    @random_low_lvl_encounter_task.after_loop
-    async def on_low_lvl_task_cancel(self):
-        if self.random_low_lvl_encounter_task.is_being_cancelled():
-            self.logger.error(
-                "sys",
-                f"Low lvl encounter Loop forcefully stopped. next iteration: {self.random_low_lvl_encounter_task.next_iteration}",
-                cog=self.__cog_name__,
-            )
-
-    @random_low_lvl_encounter_task.before_loop
-    async def random_low_lvl_encounter_task_before(self):
+    async def __init_low_lvl_encounter_timers(self):
         self.logger.log(
             "sys",
-            "Random low lvl Encounter before loop started.",
+            "Random low lvl Encounter timers initializing.",
             cog=self.__cog_name__,
         )
         try:
@@ -262,11 +262,7 @@ class Police(commands.Cog):
 
         user_list.track_spam_message(author_id, message.created_at)
 
-        if user_node.spam_check(
-            message_limit_interval, message_limit
-        ) and user_node.check_spam_score_increase(
-            message_limit_interval, message_limit
-        ):
+        if user_node.check_spam_score_increase(message_limit_interval, message_limit):
             event = SpamEvent(datetime.datetime.now(), guild_id, author_id)
             await self.controller.dispatch_event(event)
 
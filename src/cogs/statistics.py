@@ -11,6 +11,7 @@ from bot import CrunchyBot
 from config import Config
 from control.combat.discord_manager import DiscordManager
 from control.controller import Controller
+from control.deadline_scheduler import DeadlineScheduler
 from control.event_manager import EventManager
 from control.logger import BotLogger
 from control.settings_manager import SettingsManager
@@ -31,6 +32,9 @@ class Statistics(commands.Cog):
         self.controller: Controller = bot.controller
         self.discord: DiscordManager = self.controller.get_service(DiscordManager)
         self.event_manager: EventManager = self.controller.get_service(EventManager)
+        self.deadline_scheduler: DeadlineScheduler = self.controller.get_service(
+            DeadlineScheduler
+        )
         self.settings_manager: SettingsManager = self.controller.get_service(
             SettingsManager
         )
@@ -66,6 +70,60 @@ class Statistics(commands.Cog):
                 f"Controller stats: {service_count} services, {view_controller_count} view controllers, {new_view_count} views",
                 cog=self.__cog_name__,
             )
+            self.logger.log(
+                "sys",
+                f"Season cache saved {self.database.season_cache_saved_queries} queries.",
+                cog=self.__cog_name__,
+            )
+            self.logger.log(
+                "sys",
+                f"Settings cache: {self.settings_manager.cache_hits} hits, {self.settings_manager.cache_misses} misses.",
+                cog=self.__cog_name__,
+            )
+            gear_cache = self.database.gear_cache
+            self.logger.log(
+                "sys",
+                f"Gear cache: {len(gear_cache.items)} items, {gear_cache.hits} hits, {gear_cache.misses} misses ({gear_cache.hit_rate:.1%}), {gear_cache.invalidations} invalidations.",
+                cog=self.__cog_name__,
+            )
+            user_stats_cache = self.database.user_stats_cache
+            self.logger.log(
+                "sys",
+                f"User stats cache: {len(user_stats_cache.stats)} users, {user_stats_cache.hits} hits, {user_stats_cache.misses} misses ({user_stats_cache.hit_rate:.1%}), {user_stats_cache.invalidations} invalidations.",
+                cog=self.__cog_name__,
+            )
+            self.logger.log(
+                "sys",
+                f"Combat messages: {len(self.discord.combat_messages)} threads tracked, {self.discord.tracked_message_hits} tracked hits, {self.discord.history_scans} history scans.",
+                cog=self.__cog_name__,
+            )
+            edit_scheduler = self.discord.edit_scheduler
+            self.logger.log(
+                "sys",
+                f"Combat embed edits: {edit_scheduler.scheduled} scheduled, {edit_scheduler.sent} sent, {edit_scheduler.coalesced} coalesced.",
+                cog=self.__cog_name__,
+            )
+            self.logger.log(
+                "sys",
+                f"Event dispatch: {self.controller.dispatched_events} events, {self.controller.scheduled_listeners} listener calls.",
+                cog=self.__cog_name__,
+            )
+            slowest_listeners = sorted(
+                self.controller.listener_stats.items(),
+                key=lambda item: item[1].total_time,
+                reverse=True,
+            )
+            for name, stats in slowest_listeners[:5]:
+                self.logger.log(
+                    "sys",
+                    f"Listener {name}: {stats.calls} calls, {stats.average_time * 1000:.2f}ms avg, {stats.max_time * 1000:.0f}ms max.",
+                    cog=self.__cog_name__,
+                )
+            self.logger.log(
+                "sys",
+                f"Timers: {len(self.deadline_scheduler.timers)} pending, {self.deadline_scheduler.fired} fired, {self.deadline_scheduler.max_lateness * 1000:.0f}ms max lateness.",
+                cog=self.__cog_name__,
+            )
         except Exception as e:
             print(traceback.format_exc())
             error_handler = ErrorHandler(self.bot)
@@ -129,6 +187,22 @@ class Statistics(commands.Cog):
 
         await ctx.send(f"Synced the tree to {ret}/{len(guilds)}.")
 
+    @commands.command()
+    @commands.guild_only()
+    async def timers(self, ctx: commands.Context) -> None:
+        sync_permission_ids = os.environ.get(CrunchyBot.SYNC_PERMISSIONS).split(",")
+        sync_permission_ids.append(os.environ.get(CrunchyBot.ADMIN_ID))
+
+        if ctx.author.id not in [int(id) for id in sync_permission_ids]:
+            raise commands.NotOwner("You do not own this bot.")
+
+        pending_timers = self.deadline_scheduler.get_pending_timers(ctx.guild.id)
+        output = f"{len(pending_timers)} pending timers:"
+        for timer in pending_timers[:20]:
+            output += f"\n{timer.timer_type.value} `{timer.target_id}`: <t:{int(timer.deadline.timestamp())}:R>"
+
+        await ctx.send(output)
+
     # @app_commands.command(
     #     name="stats", description="See your or other peoples statistics."
     # )
@@ -255,6 +329,33 @@ class Statistics(commands.Cog):
             ephemeral=False,
         )
 
+    @app_commands.command(
+        name="verify_beans_ledger",
+        description="Checks cached bean balances against the event history and rebuilds them.",
+    )
+    @app_commands.guild_only()
+    async def verify_beans_ledger(self, interaction: discord.Interaction):
+        author_id = int(os.environ.get(CrunchyBot.ADMIN_ID))
+        if interaction.user.id != author_id:
+            raise app_commands.MissingPermissions(missing_permissions=[])
+        await interaction.response.defer()
+
+        mismatches = await self.database.verify_beans_ledger(interaction.guild_id)
+        if len(mismatches) > 0:
+            await self.database.rebuild_beans_ledger(interaction.guild_id)
+            self.logger.log(
+                interaction.guild_id,
+                f"Beans ledger was out of sync for {len(mismatches)} members: {mismatches}",
+                self.__cog_name__,
+            )
+
+        await self.bot.command_response(
+            self.__cog_name__,
+            interaction,
+            f"Beans ledger verified. Rebuilt {len(mismatches)} out of sync balances.",
+            ephemeral=False,
+        )
+
     @app_commands.command(
         name="st_status_toggle",
         description="Enable or disable display of FFXIV server time as status.",
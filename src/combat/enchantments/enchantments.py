@@ -262,6 +262,7 @@ class SkillStacks(SkillStacksProxy):
         self,
         level: int,
         skill_type: SkillType | None = None,
+        rng: random.Random = random,
     ):
         super().__init__()
 
@@ -277,7 +278,7 @@ class SkillStacks(SkillStacksProxy):
                 if level >= base.min_level and level <= base.max_level:
                     available.append(base)
 
-            base_skill = random.choice(available)
+            base_skill = rng.choice(available)
         else:
             base_class = globals()[skill_type]
             base_skill: BaseSkill = base_class()
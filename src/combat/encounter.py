@@ -7,6 +7,7 @@ import discord
 from combat.actors import Actor, Character, Opponent
 from combat.effects.effect import EmbedDataCollection
 from combat.enemies.types import EnemyType
+from combat.event_log import CombatEventLog, EncounterEventLog, StatusEffectLog
 from combat.skills.skill import Skill, SkillInstance
 from combat.status_effects.status_effect import StatusEffect
 from combat.status_effects.types import StatusEffectType
@@ -58,18 +59,71 @@ class Encounter:
         )
 
 
+class EncounterSnapshot:
+
+    def __init__(self, loaded_event_id: int = 0):
+        self.health_deltas: dict[int, int] = {}
+        self.target_events: dict[int, list[int]] = {}
+        self.status_stacks: dict[int, int] = {}
+        # newest event of the history the snapshot was loaded from, events
+        # dispatched later arrive in any order and are tracked by id
+        self.loaded_event_id = loaded_event_id
+        self.live_event_ids: set[int] = set()
+
+    def add_combat_event(self, event: CombatEvent, health_delta: int):
+        if event.id is None:
+            return
+        if event.id > self.loaded_event_id:
+            self.live_event_ids.add(event.id)
+
+        if event.combat_event_type == CombatEventType.STATUS_EFFECT:
+            self.status_stacks[event.skill_id] = (
+                self.status_stacks.get(event.skill_id, 0) + event.skill_value
+            )
+
+        if health_delta == 0:
+            return
+
+        self.health_deltas[event.id] = health_delta
+        if event.target_id not in self.target_events:
+            self.target_events[event.target_id] = [event.id]
+        else:
+            self.target_events[event.target_id].append(event.id)
+
+    def contains(self, event: CombatEvent) -> bool:
+        if event.id is None:
+            return False
+        return event.id <= self.loaded_event_id or event.id in self.live_event_ids
+
+    def get_health_delta(self, event: CombatEvent) -> int | None:
+        if not self.contains(event):
+            return None
+        return self.health_deltas.get(event.id, 0)
+
+    def get_current_hp(self, actor_id: int, max_hp: int) -> int:
+        health = max_hp
+        for event_id in self.target_events.get(actor_id, []):
+            health += self.health_deltas[event_id]
+            health = max(0, min(health, max_hp))
+        return int(health)
+
+    def get_remaining_stacks(self, event: StatusEffectEvent) -> int:
+        return event.stacks + self.status_stacks.get(event.id, 0)
+
+
 class EncounterContext:
 
     def __init__(
         self,
         encounter: Encounter,
         opponent: Opponent,
-        encounter_events: list[EncounterEvent],
-        combat_events: list[CombatEvent],
-        status_effects: dict[int, list[StatusEffectEvent]],
+        encounter_events: EncounterEventLog,
+        combat_events: CombatEventLog,
+        status_effects: dict[int, StatusEffectLog],
         combatants: list[Character],
         thread: discord.Thread,
         owner_id: int | None = None,
+        snapshot: EncounterSnapshot | None = None,
     ):
         self.encounter = encounter
         self.opponent = opponent
@@ -79,6 +133,7 @@ class EncounterContext:
         self.combatants = combatants
         self.thread = thread
         self.owner_id = owner_id
+        self.snapshot = snapshot if snapshot is not None else EncounterSnapshot()
 
         self.initiative: list[Actor] = None
         self.beginning_actor = None
@@ -94,12 +149,9 @@ class EncounterContext:
             for actor in self.combatants
             if actor.defeated and not actor.is_out and actor.ready
         ]
-        self.round_number: int = 0
-        for event in self.encounter_events:
-            if event.encounter_event_type in [
-                EncounterEventType.NEW_ROUND,
-            ]:
-                self.round_number += 1
+        self.round_number: int = len(
+            list(self.encounter_events.of_type(EncounterEventType.NEW_ROUND))
+        )
 
         self._current_actor: Actor = None
         self._last_actor: Actor = None
@@ -123,17 +175,16 @@ class EncounterContext:
         match event.type:
             case EventType.ENCOUNTER:
                 event: EncounterEvent = event
-                self.encounter_events.insert(0, event)
+                self.encounter_events.append(event)
             case EventType.COMBAT:
                 event: CombatEvent = event
-                self.combat_events.insert(0, event)
+                self.combat_events.append(event)
             case EventType.STATUS_EFFECT:
                 event: StatusEffectEvent = event
                 member_id = event.actor_id
                 if member_id not in self.status_effects:
-                    self.status_effects[member_id] = [event]
-                else:
-                    self.status_effects[member_id].insert(0, event)
+                    self.status_effects[member_id] = StatusEffectLog()
+                self.status_effects[member_id].append(event)
 
     def refresh_initiative(self, reset: bool = False):
         self.initiative = []
@@ -172,8 +223,8 @@ class EncounterContext:
         if actor_id not in self.status_effects:
             return count
 
-        for event in self.status_effects[actor_id]:
-            if event.status_type == status_type and event.stacks > 0:
+        for event in self.status_effects[actor_id].of_type(status_type):
+            if event.stacks > 0:
                 if count_stacks:
                     count = +event.stacks
                 else:
@@ -185,41 +236,28 @@ class EncounterContext:
         if self._last_actor is not None:
             return self._last_actor
 
-        new_round_event_id = None
         # Reset initiative after boss phase change
-        for event in self.encounter_events:
-            if event.encounter_event_type in [
-                EncounterEventType.NEW_ROUND,
-            ]:
-                new_round_event_id = event.id
-                break
-            if event.encounter_event_type in [
-                EncounterEventType.ENEMY_PHASE_CHANGE,
-            ]:
-                return None
-
-        relevant_combat_events = self.combat_events
-        if new_round_event_id is not None:
-            relevant_combat_events = [
-                event for event in self.combat_events if event.id > new_round_event_id
-            ]
-
-        if len(relevant_combat_events) <= 0:
+        event = self.encounter_events.latest(
+            "type",
+            EncounterEventType.NEW_ROUND,
+            EncounterEventType.ENEMY_PHASE_CHANGE,
+        )
+        if (
+            event is not None
+            and event.encounter_event_type == EncounterEventType.ENEMY_PHASE_CHANGE
+        ):
             return None
 
-        last_actor = None
-
-        for event in relevant_combat_events:
-            if event.combat_event_type in [
-                CombatEventType.ENEMY_END_TURN,
-                CombatEventType.MEMBER_END_TURN,
-            ]:
-                last_actor = event.member_id
-                break
-
-        if last_actor is None:
+        end_turn = self.combat_events.latest(
+            "type",
+            CombatEventType.ENEMY_END_TURN,
+            CombatEventType.MEMBER_END_TURN,
+        )
+        if end_turn is None or (event is not None and end_turn.id <= event.id):
             return None
 
+        last_actor = end_turn.member_id
+
         for actor in self.initiative:
             if actor.id == last_actor:
                 self._last_actor = actor
@@ -259,21 +297,18 @@ class EncounterContext:
     @property
     def initiated(self) -> bool:
         if self._initiated is None:
-            for event in self.encounter_events:
-                if event.encounter_event_type == EncounterEventType.INITIATE:
-                    self._initiated = True
-                    return self._initiated
-            self._initiated = False
+            self._initiated = (
+                self.encounter_events.latest("type", EncounterEventType.INITIATE)
+                is not None
+            )
         return self._initiated
 
     @property
     def concluded(self) -> bool:
         if self._concluded is None:
-            for event in self.encounter_events:
-                if event.encounter_event_type == EncounterEventType.END:
-                    self._concluded = True
-                    return self._concluded
-                self._concluded = False
+            self._concluded = (
+                self.encounter_events.latest("type", EncounterEventType.END) is not None
+            )
         return self._concluded
 
 
@@ -118,6 +118,7 @@ class CommonService(Service):
             context.encounter_events,
             context.combat_events,
             context.status_effects,
+            context.snapshot,
         )
         context.combatants.append(combatant)
 
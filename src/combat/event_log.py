@@ -0,0 +1,101 @@
+import heapq
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from typing import Any
+
+from events.bot_event import BotEvent
+from events.combat_event import CombatEvent
+from events.encounter_event import EncounterEvent
+from events.status_effect_event import StatusEffectEvent
+
+
+class EventLog:
+
+    INDEXES: dict[str, Callable[[Any], Hashable]] = {}
+
+    def __init__(self, events: Iterable[BotEvent] = ()):
+        # stored oldest first, iteration is newest first like the database lists
+        self.events: list[BotEvent] = []
+        self.indexes: dict[str, dict[Hashable, list[int]]] = {
+            name: {} for name in self.INDEXES
+        }
+
+        for event in reversed(list(events)):
+            self.append(event)
+
+    def append(self, event: BotEvent):
+        position = len(self.events)
+        self.events.append(event)
+
+        for name, key in self.INDEXES.items():
+            index = self.indexes[name]
+            value = key(event)
+            if value not in index:
+                index[value] = [position]
+            else:
+                index[value].append(position)
+
+    def select(self, index: str, *keys: Hashable) -> Iterator[BotEvent]:
+        positions = [
+            reversed(self.indexes[index][key])
+            for key in keys
+            if key in self.indexes[index]
+        ]
+        if len(positions) == 1:
+            return (self.events[position] for position in positions[0])
+        return (
+            self.events[position] for position in heapq.merge(*positions, reverse=True)
+        )
+
+    def latest(self, index: str, *keys: Hashable) -> BotEvent | None:
+        return next(self.select(index, *keys), None)
+
+    def __iter__(self) -> Iterator[BotEvent]:
+        return reversed(self.events)
+
+    def __reversed__(self) -> Iterator[BotEvent]:
+        return iter(self.events)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+
+class EncounterEventLog(EventLog):
+
+    INDEXES = {
+        "type": lambda event: event.encounter_event_type,
+        "member": lambda event: event.member_id,
+    }
+
+    def of_type(self, *event_types) -> Iterator[EncounterEvent]:
+        return self.select("type", *event_types)
+
+    def by_member(self, member_id: int) -> Iterator[EncounterEvent]:
+        return self.select("member", member_id)
+
+
+class CombatEventLog(EventLog):
+
+    INDEXES = {
+        "type": lambda event: event.combat_event_type,
+        "member": lambda event: event.member_id,
+        "target": lambda event: event.target_id,
+    }
+
+    def of_type(self, *event_types) -> Iterator[CombatEvent]:
+        return self.select("type", *event_types)
+
+    def by_member(self, member_id: int) -> Iterator[CombatEvent]:
+        return self.select("member", member_id)
+
+    def by_target(self, target_id: int) -> Iterator[CombatEvent]:
+        return self.select("target", target_id)
+
+
+class StatusEffectLog(EventLog):
+
+    INDEXES = {
+        "type": lambda event: event.status_type,
+    }
+
+    def of_type(self, *status_types) -> Iterator[StatusEffectEvent]:
+        return self.select("type", *status_types)
@@ -0,0 +1,252 @@
+import bisect
+import itertools
+import random
+from dataclasses import dataclass
+
+from combat.enchantments.enchantments import *  # noqa: F403
+from combat.enchantments.types import EnchantmentType
+from combat.enemies.enemy import Enemy
+from combat.gear.bases import *  # noqa: F403
+from combat.gear.droppable import DroppableBase
+from combat.gear.types import Base, EquipmentSlot, GearBaseType
+from combat.gear.uniques import *  # noqa: F403
+from combat.gear.uniques import Unique
+from combat.skills.skills import *  # noqa: F403
+from combat.skills.types import SkillType
+
+
+@dataclass(frozen=True)
+class DroppableBaseEntry:
+    type: GearBaseType | SkillType | EnchantmentType
+    base_type: Base
+    slot: EquipmentSlot
+    min_level: int
+    max_level: int
+    weight: int
+    droppable: bool
+    unique: bool
+
+    @staticmethod
+    def from_base(base: DroppableBase) -> "DroppableBaseEntry":
+        return DroppableBaseEntry(
+            type=base.type,
+            base_type=base.base_type,
+            slot=base.slot,
+            min_level=base.min_level,
+            max_level=base.max_level,
+            weight=base.weight,
+            droppable=base.droppable,
+            unique=issubclass(base.__class__, Unique),
+        )
+
+
+@dataclass(frozen=True)
+class DroppableBaseTable:
+    entries: tuple[DroppableBaseEntry, ...]
+    cumulative_weights: tuple[float, ...]
+
+    def choose(self, rng: random.Random) -> DroppableBaseEntry:
+        # same draw as random.choices, so seeded rolls are unchanged
+        total = self.cumulative_weights[-1]
+        index = bisect.bisect(
+            self.cumulative_weights, rng.random() * total, 0, len(self.entries) - 1
+        )
+        return self.entries[index]
+
+
+class DroppableBaseIndex:
+
+    def __init__(
+        self,
+        skill_drop_chance: float,
+        enchantment_drop_chance: float,
+        mob_loot_bonus_scaling: float,
+        mob_loot_unique_scaling: float,
+    ):
+        self.skill_drop_chance = skill_drop_chance
+        self.enchantment_drop_chance = enchantment_drop_chance
+        self.mob_loot_bonus_scaling = mob_loot_bonus_scaling
+        self.mob_loot_unique_scaling = mob_loot_unique_scaling
+
+        self.entries: dict[
+            GearBaseType | SkillType | EnchantmentType, DroppableBaseEntry
+        ] = {}
+        for base_type in itertools.chain(GearBaseType, SkillType, EnchantmentType):
+            base: DroppableBase = globals()[base_type]()
+            self.entries[base_type] = DroppableBaseEntry.from_base(base)
+
+        self.gear_types = list(GearBaseType)
+        self.skill_types = list(SkillType)
+        self.enchantment_types = list(EnchantmentType)
+        self.crafting_types = [
+            base_type
+            for base_type in EnchantmentType
+            if EnchantmentType.is_crafting(base_type)
+        ]
+        self.effect_types = [
+            base_type
+            for base_type in EnchantmentType
+            if not EnchantmentType.is_crafting(base_type)
+        ]
+
+        self.tables: dict[tuple, DroppableBaseTable | None] = {}
+
+    def get_entries_by_lvl(
+        self,
+        item_level: int,
+        exclude_skills: bool = False,
+        enchantments_unlocked: bool = False,
+        crafting_unlocked: bool = False,
+        gear_slot: EquipmentSlot = None,
+    ) -> list[DroppableBaseEntry]:
+        base_types = list(self.gear_types)
+
+        if not exclude_skills:
+            base_types += self.skill_types
+
+        if enchantments_unlocked and crafting_unlocked:
+            base_types += self.enchantment_types
+        elif enchantments_unlocked:
+            base_types += self.effect_types
+        elif crafting_unlocked:
+            base_types += self.crafting_types
+
+        matching_entries = []
+        for base_type in base_types:
+            entry = self.entries[base_type]
+
+            if not entry.droppable or entry.unique:
+                continue
+
+            if gear_slot is not None and entry.slot != gear_slot:
+                continue
+
+            if entry.min_level <= item_level <= entry.max_level:
+                matching_entries.append(entry)
+
+        return matching_entries
+
+    def get_table(
+        self,
+        item_level: int,
+        enemy: Enemy = None,
+        exclude_skills: bool = False,
+        enchantments_unlocked: bool = False,
+        crafting_unlocked: bool = False,
+        gear_slot: EquipmentSlot = None,
+    ) -> DroppableBaseTable | None:
+        enemy_key = None
+        if enemy is not None:
+            enemy_key = (
+                enemy.random_loot,
+                tuple(enemy.gear_loot_table),
+                tuple(enemy.skill_loot_table),
+            )
+
+        key = (
+            item_level,
+            enemy_key,
+            exclude_skills,
+            enchantments_unlocked,
+            crafting_unlocked,
+            gear_slot,
+        )
+        if key not in self.tables:
+            self.tables[key] = self.__build_table(
+                item_level,
+                enemy,
+                exclude_skills,
+                enchantments_unlocked,
+                crafting_unlocked,
+                gear_slot,
+            )
+        return self.tables[key]
+
+    def __build_table(
+        self,
+        item_level: int,
+        enemy: Enemy,
+        exclude_skills: bool,
+        enchantments_unlocked: bool,
+        crafting_unlocked: bool,
+        gear_slot: EquipmentSlot,
+    ) -> DroppableBaseTable | None:
+        entries = self.get_entries_by_lvl(
+            item_level,
+            exclude_skills=exclude_skills,
+            enchantments_unlocked=enchantments_unlocked,
+            crafting_unlocked=crafting_unlocked,
+            gear_slot=gear_slot,
+        )
+
+        if len(entries) <= 0:
+            return None
+
+        loot_table = []
+        if enemy is not None:
+            loot_table = enemy.gear_loot_table + enemy.skill_loot_table
+
+            if not enemy.random_loot:
+                entries = []
+
+            for base_type in loot_table:
+                entries.append(self.entries[base_type])
+
+        skill_weight = 0
+        gear_weight = 0
+        enchantment_weight = 0
+
+        for entry in entries:
+            match entry.base_type:
+                case Base.SKILL:
+                    skill_weight += entry.weight
+                case Base.GEAR:
+                    gear_weight += entry.weight
+                case Base.ENCHANTMENT:
+                    enchantment_weight += entry.weight
+
+        # Forces chance of skill dropping to skill_drop_chance while keeping weights
+        skill_mod = 0
+        enchantment_mod = 0
+        if not exclude_skills and skill_weight > 0:
+            skill_mod = (
+                self.skill_drop_chance
+                * (skill_weight + gear_weight + enchantment_weight)
+                / skill_weight
+            )
+        if enchantment_weight > 0:
+            enchantment_mod = (
+                self.enchantment_drop_chance
+                * (skill_weight + gear_weight + enchantment_weight)
+                / enchantment_weight
+            )
+
+        weights = []
+        for entry in entries:
+            weight = entry.weight
+
+            if entry.type in loot_table:
+                scaling = self.mob_loot_bonus_scaling
+                if entry.unique:
+                    scaling *= self.mob_loot_unique_scaling
+                weight *= scaling
+
+            match entry.base_type:
+                case Base.SKILL:
+                    weight *= skill_mod
+                case Base.ENCHANTMENT:
+                    weight *= enchantment_mod
+                case Base.GEAR:
+                    weight *= 1 - (skill_mod + enchantment_mod)
+            weights.append(weight)
+
+        sum_weights = sum(weights)
+        if sum_weights == 0:
+            return None
+
+        chances = [v / sum_weights for v in weights]
+
+        return DroppableBaseTable(
+            entries=tuple(entries),
+            cumulative_weights=tuple(itertools.accumulate(chances)),
+        )
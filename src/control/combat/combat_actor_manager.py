@@ -6,9 +6,10 @@ from discord.ext import commands
 
 from combat.actors import Actor, Character, Opponent
 from combat.enchantments.enchantment import Enchantment
-from combat.encounter import Encounter, EncounterContext
+from combat.encounter import Encounter, EncounterContext, EncounterSnapshot
 from combat.enemies.enemy import Enemy
 from combat.enemies.types import EnemyType
+from combat.event_log import CombatEventLog, EncounterEventLog, StatusEffectLog
 from combat.gear.types import CharacterAttribute, GearModifierType
 from combat.skills.skill import Skill
 from combat.skills.types import SkillEffect, SkillType
@@ -20,6 +21,7 @@ from control.controller import Controller
 from control.imgur_manager import ImgurManager
 from control.logger import BotLogger
 from control.service import Service
+from control.types import EventSubscription
 from datalayer.database import Database
 from events.bot_event import BotEvent
 from events.combat_event import CombatEvent
@@ -30,6 +32,8 @@ from events.types import CombatEventType, EncounterEventType, EventType
 
 class CombatActorManager(Service):
 
+    EVENT_SUBSCRIPTIONS = [EventSubscription([EventType.ENCOUNTER], synchronized=True)]
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -58,13 +62,17 @@ class CombatActorManager(Service):
                         )
 
     async def get_actor_current_hp(
-        self, actor: Actor, combat_events: list[CombatEvent]
+        self,
+        actor: Actor,
+        combat_events: CombatEventLog,
+        snapshot: EncounterSnapshot = None,
     ):
+        if snapshot is not None:
+            return snapshot.get_current_hp(actor.id, actor.max_hp)
+
         health = actor.max_hp
 
-        for event in reversed(combat_events):
-            if event.target_id != actor.id:
-                continue
+        for event in reversed(list(combat_events.by_target(actor.id))):
             health += await self.get_event_health_delta(event)
             health = max(0, min(health, actor.max_hp))
 
@@ -103,6 +111,26 @@ class CombatActorManager(Service):
                 health = event.skill_value
         return health
 
+    async def get_encounter_snapshot(
+        self, combat_events: CombatEventLog
+    ) -> EncounterSnapshot:
+        loaded_event_id = max(
+            (event.id for event in combat_events if event.id is not None), default=0
+        )
+        snapshot = EncounterSnapshot(loaded_event_id)
+        for event in reversed(combat_events):
+            health = await self.get_event_health_delta(event)
+            snapshot.add_combat_event(event, health)
+        return snapshot
+
+    async def update_encounter_snapshot(
+        self, snapshot: EncounterSnapshot, event: CombatEvent
+    ):
+        if snapshot.contains(event):
+            return
+        health = await self.get_event_health_delta(event)
+        snapshot.add_combat_event(event, health)
+
     async def initialize_actor(
         self,
         member_id: int,
@@ -127,8 +155,9 @@ class CombatActorManager(Service):
     async def get_active_status_effects(
         self,
         id: int,
-        status_effects: dict[int, list[StatusEffectEvent]],
-        combat_events: list[CombatEvent],
+        status_effects: dict[int, StatusEffectLog],
+        combat_events: CombatEventLog,
+        snapshot: EncounterSnapshot = None,
     ) -> list[ActiveStatusEffect]:
         active_status_effects: dict[StatusEffectType, list[ActiveStatusEffect]] = {}
         active_status_effects = []
@@ -137,12 +166,17 @@ class CombatActorManager(Service):
             return active_status_effects
 
         actor_status_effects = status_effects[id]
-        stacks = {event.id: event.stacks for event in actor_status_effects}
 
-        for combat_event in combat_events:
-            if combat_event.combat_event_type != CombatEventType.STATUS_EFFECT:
-                continue
+        if snapshot is not None:
+            stacks = {
+                event.id: snapshot.get_remaining_stacks(event)
+                for event in actor_status_effects
+            }
+            combat_events = CombatEventLog()
+        else:
+            stacks = {event.id: event.stacks for event in actor_status_effects}
 
+        for combat_event in combat_events.of_type(CombatEventType.STATUS_EFFECT):
             status_id = combat_event.skill_id
             if status_id not in stacks:
                 continue
@@ -162,9 +196,10 @@ class CombatActorManager(Service):
         self,
         enemy: Enemy,
         encounter: Encounter,
-        encounter_events: list[EncounterEvent],
-        combat_events: list[CombatEvent],
-        status_effects: dict[int, list[StatusEffectEvent]],
+        encounter_events: EncounterEventLog,
+        combat_events: CombatEventLog,
+        status_effects: dict[int, StatusEffectLog],
+        snapshot: EncounterSnapshot = None,
     ) -> Opponent:
         enemy_level = encounter.enemy_level
         max_hp = encounter.max_hp
@@ -207,7 +242,7 @@ class CombatActorManager(Service):
             encounter_id
         )
         active_status_effects = await self.get_active_status_effects(
-            id, status_effects, combat_events
+            id, status_effects, combat_events, snapshot
         )
 
         image_url = None
@@ -232,21 +267,24 @@ class CombatActorManager(Service):
             additional_info=additional_info,
         )
 
-        opponent.current_hp = await self.get_actor_current_hp(opponent, combat_events)
+        opponent.current_hp = await self.get_actor_current_hp(
+            opponent, combat_events, snapshot
+        )
         return opponent
 
     async def get_character(
         self,
         member: discord.Member,
-        encounter_events: list[EncounterEvent] = None,
-        combat_events: list[CombatEvent] = None,
-        status_effects: dict[int, StatusEffectEvent] = None,
+        encounter_events: EncounterEventLog = None,
+        combat_events: CombatEventLog = None,
+        status_effects: dict[int, StatusEffectLog] = None,
+        snapshot: EncounterSnapshot = None,
     ) -> Character:
         if encounter_events is None:
-            encounter_events = []
+            encounter_events = EncounterEventLog()
 
         if combat_events is None:
-            combat_events = []
+            combat_events = CombatEventLog()
 
         if status_effects is None:
             status_effects = {}
@@ -331,15 +369,12 @@ class CombatActorManager(Service):
         )
 
         active_status_effects = await self.get_active_status_effects(
-            member.id, status_effects, combat_events
+            member.id, status_effects, combat_events, snapshot
         )
 
         timeout_count = 0
-        for event in combat_events:
-            if (
-                event.member_id == member.id
-                and event.combat_event_type == CombatEventType.MEMBER_TURN_SKIP
-            ):
+        for event in combat_events.by_member(member.id):
+            if event.combat_event_type == CombatEventType.MEMBER_TURN_SKIP:
                 timeout_count += 1
 
         character = Character(
@@ -359,17 +394,21 @@ class CombatActorManager(Service):
             ready=ready,
             timeout_count=timeout_count,
         )
-        character.current_hp = await self.get_actor_current_hp(character, combat_events)
+        character.current_hp = await self.get_actor_current_hp(
+            character, combat_events, snapshot
+        )
         return character
 
-    async def apply_event(self, actor: Actor, event: BotEvent):
+    async def apply_event(
+        self, actor: Actor, event: BotEvent, snapshot: EncounterSnapshot = None
+    ):
         match event.type:
             case EventType.ENCOUNTER:
                 event: EncounterEvent = event
                 await self.apply_encounter_event(actor, event)
             case EventType.COMBAT:
                 event: CombatEvent = event
-                await self.apply_combat_event(actor, event)
+                await self.apply_combat_event(actor, event, snapshot)
             case EventType.STATUS_EFFECT:
                 event: StatusEffectEvent = event
                 await self.apply_status_event(actor, event)
@@ -405,7 +444,7 @@ class CombatActorManager(Service):
 
                     actor.skills = skills
                     actor.skill_cooldowns = self.get_skill_cooldowns(
-                        actor.id, skills, []
+                        actor.id, skills, CombatEventLog()
                     )
 
                     actor.average_skill_multi = actor.get_potency_per_turn()
@@ -438,9 +477,15 @@ class CombatActorManager(Service):
             case EncounterEventType.PENALTY75:
                 pass
 
-    async def apply_combat_event(self, actor: Actor, event: CombatEvent):
+    async def apply_combat_event(
+        self, actor: Actor, event: CombatEvent, snapshot: EncounterSnapshot = None
+    ):
         if event.target_id == actor.id:
-            health = await self.get_event_health_delta(event)
+            health = None
+            if snapshot is not None:
+                health = snapshot.get_health_delta(event)
+            if health is None:
+                health = await self.get_event_health_delta(event)
             new_hp = actor.current_hp + health
             actor.current_hp = max(0, min(new_hp, actor.max_hp))
 
@@ -523,6 +568,8 @@ class CombatActorManager(Service):
     ) -> list[SkillType]:
         used_skills = []
         combat_events = context.combat_events
+        if actor_id >= 0:
+            combat_events = combat_events.by_member(actor_id)
         for event in combat_events:
             if (
                 event.member_id == actor_id or (actor_id < 0 and event.member_id < 0)
@@ -539,21 +586,20 @@ class CombatActorManager(Service):
         self,
         actor_id: int,
         enchantments: list[Enchantment],
-        combat_events: list[CombatEvent],
+        combat_events: CombatEventLog,
     ) -> dict[SkillType, int]:
         cooldowns = {}
         last_used = 0
-        for event in combat_events:
-            if event.member_id == actor_id:
-                if event.skill_id is not None:
-                    enchantment_id = event.skill_id
-                    if enchantment_id not in cooldowns:
-                        cooldowns[enchantment_id] = max(0, last_used - 1)
-                if event.combat_event_type in [
-                    CombatEventType.ENEMY_END_TURN,
-                    CombatEventType.MEMBER_END_TURN,
-                ]:
-                    last_used += 1
+        for event in combat_events.by_member(actor_id):
+            if event.skill_id is not None:
+                enchantment_id = event.skill_id
+                if enchantment_id not in cooldowns:
+                    cooldowns[enchantment_id] = max(0, last_used - 1)
+            if event.combat_event_type in [
+                CombatEventType.ENEMY_END_TURN,
+                CombatEventType.MEMBER_END_TURN,
+            ]:
+                last_used += 1
 
         round_count = last_used
 
@@ -578,21 +624,20 @@ class CombatActorManager(Service):
         return enchantment_data
 
     def get_skill_cooldowns(
-        self, actor_id: int, skills: list[Skill], combat_events: list[CombatEvent]
+        self, actor_id: int, skills: list[Skill], combat_events: CombatEventLog
     ) -> dict[SkillType, int]:
         cooldowns = {}
         last_used = 0
-        for event in combat_events:
-            if event.member_id == actor_id:
-                if event.skill_type is not None:
-                    skill_type = event.skill_type
-                    if skill_type not in cooldowns:
-                        cooldowns[skill_type] = max(0, last_used - 1)
-                if event.combat_event_type in [
-                    CombatEventType.ENEMY_END_TURN,
-                    CombatEventType.MEMBER_END_TURN,
-                ]:
-                    last_used += 1
+        for event in combat_events.by_member(actor_id):
+            if event.skill_type is not None:
+                skill_type = event.skill_type
+                if skill_type not in cooldowns:
+                    cooldowns[skill_type] = max(0, last_used - 1)
+            if event.combat_event_type in [
+                CombatEventType.ENEMY_END_TURN,
+                CombatEventType.MEMBER_END_TURN,
+            ]:
+                last_used += 1
 
         round_count = last_used
 
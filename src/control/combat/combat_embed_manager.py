@@ -647,7 +647,7 @@ class CombatEmbedManager(Service):
         yield full_embed
 
         if actor.is_enemy and skill.type not in self.actor_manager.get_used_skills(
-            actor.id, context.combat_events
+            actor.id, context
         ):
             wait = max(len(skill.description) * 0.06, 3)
             await asyncio.sleep(wait)
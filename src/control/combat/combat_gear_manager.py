@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import random
 
@@ -14,6 +15,8 @@ from combat.enchantments.enchantments import *  # noqa: F403
 from combat.enchantments.types import EnchantmentEffect, EnchantmentType
 from combat.encounter import EncounterContext
 from combat.enemies.enemy import Enemy
+from combat.event_log import EncounterEventLog
+from combat.gear.base_index import DroppableBaseIndex, DroppableBaseTable
 from combat.gear.bases import *  # noqa: F403
 from combat.gear.default_gear import (
     DefaultAccessory1,
@@ -37,7 +40,6 @@ from combat.gear.uniques import *  # noqa: F403
 from combat.gear.uniques import Unique
 from combat.skills.skill import BaseSkill, Skill
 from combat.skills.skills import *  # noqa: F403
-from combat.skills.types import SkillType
 from combat.types import UnlockableFeature
 from control.combat.combat_skill_manager import CombatSkillManager
 from control.combat.object_factory import ObjectFactory
@@ -48,7 +50,6 @@ from control.service import Service
 from control.settings_manager import SettingsManager
 from datalayer.database import Database
 from events.bot_event import BotEvent
-from events.encounter_event import EncounterEvent
 from events.inventory_event import InventoryEvent
 from events.types import EncounterEventType
 from items import BaseKey
@@ -193,66 +194,49 @@ class CombatGearManager(Service):
             CombatSkillManager
         )
         self.factory: ObjectFactory = self.controller.get_service(ObjectFactory)
+        self.base_index = DroppableBaseIndex(
+            skill_drop_chance=self.SKILL_DROP_CHANCE,
+            enchantment_drop_chance=self.ENCHANTMENT_DROP_CHANCE,
+            mob_loot_bonus_scaling=self.MOB_LOOT_BONUS_SCALING,
+            mob_loot_unique_scaling=self.MOB_LOOT_UNIQUE_SCALING,
+        )
 
     async def listen_for_event(self, event: BotEvent):
         pass
 
-    async def get_bases_by_lvl(
+    @staticmethod
+    def get_rng(random_seed=None) -> random.Random:
+        # every seeded roll gets its own stream, so concurrent drops never
+        # touch each other or the shared module rng
+        if random_seed is None:
+            return random
+        return random.Random(random_seed)
+
+    async def get_base_table(
         self,
         guild_id: int,
         item_level: int,
+        enemy: Enemy = None,
         exclude_skills: bool = False,
         exclude_enchantments: bool = False,
         gear_slot: EquipmentSlot = None,
-    ) -> list[DroppableBase]:
-        matching_bases = []
-
-        gear_base_types = [base_type for base_type in GearBaseType]
-
-        skill_base_types = []
-        enchantment_base_types = []
-
-        if not exclude_skills:
-            skill_base_types = [base_type for base_type in SkillType]
+    ) -> DroppableBaseTable | None:
+        enchantments_unlocked = False
+        crafting_unlocked = False
 
         if not exclude_enchantments:
             unlocked = await self.settings_manager.get_unlocked_features(guild_id)
             crafting_unlocked = UnlockableFeature.CRAFTING in unlocked
             enchantments_unlocked = UnlockableFeature.ENCHANTMENTS in unlocked
-            if enchantments_unlocked and crafting_unlocked:
-                enchantment_base_types = [base_type for base_type in EnchantmentType]
-            elif enchantments_unlocked:
-                enchantment_base_types = [
-                    base_type
-                    for base_type in EnchantmentType
-                    if not EnchantmentType.is_crafting(base_type)
-                ]
-            elif crafting_unlocked:
-                enchantment_base_types = [
-                    base_type
-                    for base_type in EnchantmentType
-                    if EnchantmentType.is_crafting(base_type)
-                ]
-
-        base_types = gear_base_types + skill_base_types + enchantment_base_types
-
-        for base_type in base_types:
-            base_class = globals()[base_type]
-            base: DroppableBase = base_class()
 
-            if not base.droppable:
-                continue
-
-            if issubclass(base.__class__, Unique):
-                continue
-
-            if gear_slot is not None and base.slot != gear_slot:
-                continue
-
-            if item_level >= base.min_level and item_level <= base.max_level:
-                matching_bases.append(base)
-
-        return matching_bases
+        return self.base_index.get_table(
+            item_level,
+            enemy=enemy,
+            exclude_skills=exclude_skills,
+            enchantments_unlocked=enchantments_unlocked,
+            crafting_unlocked=crafting_unlocked,
+            gear_slot=gear_slot,
+        )
 
     async def get_random_base(
         self,
@@ -265,98 +249,25 @@ class CombatGearManager(Service):
         random_seed=None,
     ) -> DroppableBase:
 
-        bases = await self.get_bases_by_lvl(
+        table = await self.get_base_table(
             guild_id=guild_id,
             item_level=item_level,
+            enemy=enemy,
             exclude_skills=exclude_skills,
             exclude_enchantments=exclude_enchantments,
             gear_slot=gear_slot,
         )
 
-        if len(bases) <= 0:
+        if table is None:
             return None
 
-        if enemy is not None:
-            skill_base_types = enemy.skill_loot_table
-            gear_base_types = enemy.gear_loot_table
-
-            table_base_types = gear_base_types + skill_base_types
-
-            if not enemy.random_loot:
-                bases = []
-
-            for base_type in table_base_types:
-                base_class = globals()[base_type]
-                base: DroppableBase = base_class()
-                bases.append(base)
-
-        skill_weight = 0
-        gear_weight = 0
-        enchantment_weight = 0
-
-        for base in bases:
-            match base.base_type:
-                case Base.SKILL:
-                    skill_weight += base.weight
-                case Base.GEAR:
-                    gear_weight += base.weight
-                case Base.ENCHANTMENT:
-                    enchantment_weight += base.weight
-
-        skill_mod = 0
-        enchantment_mod = 0
-        if not exclude_skills and skill_weight > 0:
-            skill_mod = (
-                self.SKILL_DROP_CHANCE
-                * (skill_weight + gear_weight + enchantment_weight)
-                / skill_weight
-            )
-        if enchantment_weight > 0:
-            enchantment_mod = (
-                self.ENCHANTMENT_DROP_CHANCE
-                * (skill_weight + gear_weight + enchantment_weight)
-                / enchantment_weight
-            )
-        # Forces chance of skill dropping to self.SKILL_DROP_CHANCE while keeping weights
-
-        weights = []
-        for base in bases:
-            weight = base.weight
-
-            if enemy is not None and (
-                base.type in enemy.skill_loot_table
-                or base.type in enemy.gear_loot_table
-            ):
-                scaling = self.MOB_LOOT_BONUS_SCALING
-                if issubclass(base.__class__, Unique):
-                    scaling *= self.MOB_LOOT_UNIQUE_SCALING
-                weight *= scaling
-
-            match base.base_type:
-                case Base.SKILL:
-                    weight *= skill_mod
-                case Base.ENCHANTMENT:
-                    weight *= enchantment_mod
-                case Base.GEAR:
-                    weight *= 1 - (skill_mod + enchantment_mod)
-            weights.append(weight)
-
-        sum_weights = sum(weights)
-        chances = [v / sum_weights for v in weights]
-
-        if random_seed is not None:
-            random.seed(random_seed)
-
-        result = random.choices(bases, weights=chances)[0]
-
-        if random_seed is not None:
-            random.seed(None)
+        entry = table.choose(self.get_rng(random_seed))
 
-        return result
+        return await self.factory.get_base(entry.type)
 
-    async def get_random_rarity(
-        self, item_level, random_seed=None, min_rarity: Rarity = None
-    ) -> Rarity:
+    async def get_rarity_chances(
+        self, item_level, min_rarity: Rarity = None
+    ) -> dict[Rarity, float]:
         weights = {}
 
         for rarity, weight in self.RARITY_WEIGHTS.items():
@@ -372,18 +283,46 @@ class CombatGearManager(Service):
             weights[rarity] = weight
 
         sum_weights = sum(weights.values())
-        chances = [v / sum_weights for _, v in weights.items()]
-        rarities = [k for k in weights]
+        return {k: v / sum_weights for k, v in weights.items()}
 
-        if random_seed is not None:
-            random.seed(random_seed)
+    async def get_random_rarity(
+        self, item_level, random_seed=None, min_rarity: Rarity = None
+    ) -> Rarity:
+        chances = await self.get_rarity_chances(item_level, min_rarity)
+
+        rng = self.get_rng(random_seed)
+        return rng.choices(list(chances.keys()), weights=list(chances.values()))[0]
 
-        result = random.choices(rarities, weights=chances)[0]
+    async def get_max_rarity(self, guild_level: int) -> Rarity:
+        max_rarity = Rarity.COMMON
+        for min_rarity, level in self.MIN_RARITY_LVL.items():
+            if min_rarity == Rarity.UNIQUE:
+                # only reachable through a unique base, never as a fallback
+                continue
+            if level <= guild_level:
+                max_rarity = min_rarity
+            else:
+                break
+        return max_rarity
 
-        if random_seed is not None:
-            random.seed(None)
+    async def get_enchantment_rarity(
+        self, base_enchantment: BaseEnchantment, rarity: Rarity
+    ) -> Rarity:
+        if rarity in base_enchantment.rarities:
+            return rarity
 
-        return result
+        min_weight = self.RARITY_WEIGHTS[rarity]
+        matched_rarity = None
+        for comparison_rarity, weight in self.RARITY_WEIGHTS.items():
+            if comparison_rarity not in base_enchantment.rarities:
+                continue
+
+            matched_rarity = comparison_rarity
+
+            if weight <= min_weight:
+                break
+
+        return matched_rarity
 
     async def get_random_unique_modifiers(
         self, base: GearBase, item_level: int, random_seed=None
@@ -406,15 +345,10 @@ class CombatGearManager(Service):
             min_roll *= 0.9
             max_roll *= 1.1
 
-            if random_seed is not None:
-                random.seed(random_seed)
-
-            value = random.uniform(min_roll, max_roll)
+            rng = self.get_rng(random_seed)
+            value = rng.uniform(min_roll, max_roll)
             value *= scaling
 
-            if random_seed is not None:
-                random.seed(None)
-
             if modifier_type in self.INT_MODIFIERS:
                 value = int(value)
 
@@ -433,13 +367,8 @@ class CombatGearManager(Service):
         allowed_modifiers = base.get_allowed_modifiers()
         modifier_count = self.MODIFIER_COUNT[rarity]
 
-        if random_seed is not None:
-            random.seed(random_seed)
-
-        modifier_types = random.sample(allowed_modifiers, k=modifier_count)
-
-        if random_seed is not None:
-            random.seed(None)
+        rng = self.get_rng(random_seed)
+        modifier_types = rng.sample(allowed_modifiers, k=modifier_count)
 
         modifier_types.extend(base.modifiers)
 
@@ -461,13 +390,8 @@ class CombatGearManager(Service):
             base, item_level, modifier_type
         )
 
-        if random_seed is not None:
-            random.seed(random_seed)
-
-        value = random.uniform(min_roll, max_roll)
-
-        if random_seed is not None:
-            random.seed(None)
+        rng = self.get_rng(random_seed)
+        value = rng.uniform(min_roll, max_roll)
 
         if modifier_type in self.INT_MODIFIERS:
             value = int(value)
@@ -523,41 +447,29 @@ class CombatGearManager(Service):
             member_id, guild_id
         )
 
-        seed = seed_base + "a"
-        item = await self.generate_drop(
-            member_id=None,
-            guild_id=guild_id,
-            item_level=level,
-            exclude_skills=True,
-            random_seed=seed,
-        )
-        item.id = my_hash(seed)
-        if item.id not in already_bought:
-            daily_items.append(item)
+        rolls = {
+            seed_base + "a": {"exclude_skills": True},
+            seed_base + "b": {"exclude_skills": True},
+            seed_base + "c": {"gear_slot": EquipmentSlot.SKILL},
+        }
 
-        seed = seed_base + "b"
-        item = await self.generate_drop(
-            member_id=None,
-            guild_id=guild_id,
-            item_level=level,
-            exclude_skills=True,
-            random_seed=seed,
+        items = await asyncio.gather(
+            *[
+                self.generate_drop(
+                    member_id=None,
+                    guild_id=guild_id,
+                    item_level=level,
+                    random_seed=seed,
+                    **options,
+                )
+                for seed, options in rolls.items()
+            ]
         )
-        item.id = my_hash(seed)
-        if item.id not in already_bought:
-            daily_items.append(item)
 
-        seed = seed_base + "c"
-        item = await self.generate_drop(
-            member_id=None,
-            guild_id=guild_id,
-            item_level=level,
-            gear_slot=EquipmentSlot.SKILL,
-            random_seed=seed,
-        )
-        item.id = my_hash(seed)
-        if item.id not in already_bought:
-            daily_items.append(item)
+        for seed, item in zip(rolls, items, strict=True):
+            item.id = my_hash(seed)
+            if item.id not in already_bought:
+                daily_items.append(item)
 
         return daily_items
 
@@ -607,24 +519,13 @@ class CombatGearManager(Service):
 
         if rarity == Rarity.UNIQUE:
             if len(base.uniques) <= 0:
-                max_rarity = Rarity.COMMON
                 guild_level = await self.database.get_guild_level(guild_id)
-                for min_rarity, level in self.MIN_RARITY_LVL.items():
-                    if level <= guild_level:
-                        max_rarity = min_rarity
-                    else:
-                        break
-                rarity = max_rarity
+                rarity = await self.get_max_rarity(guild_level)
             else:
-                if random_seed is not None:
-                    random.seed(random_seed)
-
-                unique_base_type = random.choices(base.uniques)[0]
+                rng = self.get_rng(random_seed)
+                unique_base_type = rng.choices(base.uniques)[0]
                 base = await self.factory.get_base(unique_base_type)
 
-                if random_seed is not None:
-                    random.seed(None)
-
         if issubclass(base.__class__, Unique):
             rarity = Rarity.UNIQUE
 
@@ -651,20 +552,10 @@ class CombatGearManager(Service):
                 base_enchantment: BaseEnchantment = base
                 match base_enchantment.enchantment_type:
                     case EnchantmentType.SKILL_STACKS:
-                        base_enchantment = SkillStacks(item_level)  # noqa: F405
-                if rarity not in base_enchantment.rarities:
-                    min_weight = self.RARITY_WEIGHTS[rarity]
-                    matched_rarity = None
-                    for comparison_rarity, weight in self.RARITY_WEIGHTS.items():
-                        if comparison_rarity not in base_enchantment.rarities:
-                            continue
-
-                        matched_rarity = comparison_rarity
-
-                        if weight <= min_weight:
-                            break
-
-                    rarity = matched_rarity
+                        base_enchantment = SkillStacks(  # noqa: F405
+                            item_level, rng=self.get_rng(random_seed)
+                        )
+                rarity = await self.get_enchantment_rarity(base_enchantment, rarity)
                 if base_enchantment.enchantment_effect == EnchantmentEffect.EFFECT:
                     enchantment = EffectEnchantment(
                         base_enchantment=base_enchantment,
@@ -741,15 +632,14 @@ class CombatGearManager(Service):
         return await self.generate_drop(member_id, guild_id, item_level, enemy)
 
     async def get_combatant_penalty(
-        self, character: Character, encounter_events: list[EncounterEvent]
+        self, character: Character, encounter_events: EncounterEventLog
     ) -> float:
-        for event in encounter_events:
-            if event.member_id == character.member.id:
-                match event.encounter_event_type:
-                    case EncounterEventType.PENALTY50:
-                        return 0.5
-                    case EncounterEventType.PENALTY75:
-                        return 0.75
+        for event in encounter_events.by_member(character.member.id):
+            match event.encounter_event_type:
+                case EncounterEventType.PENALTY50:
+                    return 0.5
+                case EncounterEventType.PENALTY75:
+                    return 0.75
         return 0
 
     async def scrap_gear(
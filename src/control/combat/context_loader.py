@@ -1,6 +1,7 @@
 from discord.ext import commands
 
 from combat.encounter import Encounter, EncounterContext
+from combat.event_log import CombatEventLog, EncounterEventLog, StatusEffectLog
 from config import Config
 from control.combat.combat_actor_manager import CombatActorManager
 from control.combat.combat_embed_manager import CombatEmbedManager
@@ -10,6 +11,7 @@ from control.combat.object_factory import ObjectFactory
 from control.controller import Controller
 from control.logger import BotLogger
 from control.service import Service
+from control.types import EventSubscription
 from datalayer.database import Database
 from events.bot_event import BotEvent
 from events.combat_event import CombatEvent
@@ -20,6 +22,13 @@ from events.types import CombatEventType, EncounterEventType, EventType
 
 class ContextLoader(Service):
 
+    EVENT_SUBSCRIPTIONS = [
+        EventSubscription(
+            [EventType.ENCOUNTER, EventType.COMBAT, EventType.STATUS_EFFECT],
+            synchronized=True,
+        )
+    ]
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -68,9 +77,15 @@ class ContextLoader(Service):
                 encounter_id = event.encounter_id
                 context = await self.load_encounter_context(encounter_id)
                 context = self.context_cache[encounter_id]
+                if context.snapshot.contains(event):
+                    # already part of the history the context was loaded from
+                    return
+                await self.actor_manager.update_encounter_snapshot(
+                    context.snapshot, event
+                )
                 context.add_event(event)
                 for actor in context.actors:
-                    await self.actor_manager.apply_event(actor, event)
+                    await self.actor_manager.apply_event(actor, event, context.snapshot)
 
             case EventType.STATUS_EFFECT:
                 event: StatusEffectEvent = event
@@ -86,15 +101,15 @@ class ContextLoader(Service):
         opponent = await self.actor_manager.get_opponent(
             enemy,
             encounter,
-            [],
-            [],
+            EncounterEventLog(),
+            CombatEventLog(),
             {},
         )
         context = EncounterContext(
             encounter=encounter,
             opponent=opponent,
-            encounter_events=[],
-            combat_events=[],
+            encounter_events=EncounterEventLog(),
+            combat_events=CombatEventLog(),
             status_effects={},
             combatants=[],
             thread=None,
@@ -119,19 +134,23 @@ class ContextLoader(Service):
             return self.context_cache[encounter_id]
 
         encounter = await self.database.get_encounter_by_encounter_id(encounter_id)
-        encounter_events = await self.database.get_encounter_events_by_encounter_id(
-            encounter_id
+        encounter_events = EncounterEventLog(
+            await self.database.get_encounter_events_by_encounter_id(encounter_id)
         )
-        combat_events = await self.database.get_combat_events_by_encounter_id(
-            encounter_id
-        )
-        status_effects = await self.database.get_status_effects_by_encounter(
-            encounter_id
+        combat_events = CombatEventLog(
+            await self.database.get_combat_events_by_encounter_id(encounter_id)
         )
+        status_effects = {
+            actor_id: StatusEffectLog(events)
+            for actor_id, events in (
+                await self.database.get_status_effects_by_encounter(encounter_id)
+            ).items()
+        }
         thread_id = await self.database.get_encounter_thread(encounter_id)
         thread = self.bot.get_channel(encounter.channel_id).get_thread(thread_id)
 
         enemy = await self.factory.get_enemy(encounter.enemy_type)
+        snapshot = await self.actor_manager.get_encounter_snapshot(combat_events)
 
         opponent = await self.actor_manager.get_opponent(
             enemy,
@@ -139,6 +158,7 @@ class ContextLoader(Service):
             encounter_events,
             combat_events,
             status_effects,
+            snapshot,
         )
 
         combatant_ids = await self.database.get_encounter_participants_by_encounter_id(
@@ -153,7 +173,7 @@ class ContextLoader(Service):
         for member in members:
 
             combatant = await self.actor_manager.get_character(
-                member, encounter_events, combat_events, status_effects
+                member, encounter_events, combat_events, status_effects, snapshot
             )
 
             combatants.append(combatant)
@@ -166,13 +186,12 @@ class ContextLoader(Service):
             status_effects=status_effects,
             combatants=combatants,
             thread=thread,
+            snapshot=snapshot,
         )
 
-        for event in encounter_events:
-            match event.encounter_event_type:
-                case EncounterEventType.NEW_ROUND:
-                    context.round_event_id_cutoff = event.id
-                    break
+        new_round = encounter_events.latest("type", EncounterEventType.NEW_ROUND)
+        if new_round is not None:
+            context.round_event_id_cutoff = new_round.id
 
         for event in combat_events:
             if (
@@ -210,3 +229,49 @@ class ContextLoader(Service):
 
         self.context_cache[encounter_id] = context
         return self.context_cache[encounter_id]
+
+    async def verify_encounter_context(self, encounter_id: int) -> int:
+        if encounter_id not in self.context_cache:
+            return 0
+
+        context = self.context_cache[encounter_id]
+        guild_id = context.encounter.guild_id
+        mismatches = 0
+
+        for actor in context.actors:
+            current_hp = await self.actor_manager.get_actor_current_hp(
+                actor, context.combat_events
+            )
+            if actor.current_hp != current_hp:
+                self.logger.error(
+                    guild_id,
+                    f"Encounter {encounter_id}: {actor.name} hp is {actor.current_hp}, replay says {current_hp}.",
+                    self.log_name,
+                )
+                actor.current_hp = current_hp
+                mismatches += 1
+
+            status_effects = await self.actor_manager.get_active_status_effects(
+                actor.id, context.status_effects, context.combat_events
+            )
+            stacks = {
+                status.event.id: status.remaining_stacks for status in status_effects
+            }
+            for status in actor.status_effects:
+                expected = stacks.get(status.event.id)
+                if expected is None or status.remaining_stacks == expected:
+                    continue
+                self.logger.error(
+                    guild_id,
+                    f"Encounter {encounter_id}: {actor.name} {status.status_effect.name} stacks are {status.remaining_stacks}, replay says {expected}.",
+                    self.log_name,
+                )
+                status.remaining_stacks = expected
+                mismatches += 1
+
+        if mismatches > 0:
+            context.snapshot = await self.actor_manager.get_encounter_snapshot(
+                context.combat_events
+            )
+
+        return mismatches
@@ -1,8 +1,9 @@
 import asyncio
 import contextlib
-import copy
 import datetime
+from collections import OrderedDict
 from collections.abc import AsyncGenerator
+from enum import Enum
 
 import discord
 from discord.ext import commands
@@ -13,19 +14,28 @@ from combat.encounter import Encounter, EncounterContext
 from combat.enemies.types import EnemyType
 from config import Config
 from control.combat.combat_embed_manager import CombatEmbedManager
+from control.combat.edit_scheduler import EditScheduler
 from control.combat.object_factory import ObjectFactory
 from control.controller import Controller
 from control.logger import BotLogger
 from control.service import Service
 from control.settings_manager import SettingsManager
+from control.types import FieldData
 from datalayer.database import Database
 from events.bot_event import BotEvent
 from view.combat.embed import EnemyOverviewEmbed
 
 
+class CombatMessageType(Enum):
+    ROUND = 0
+    ENEMY_INFO = 1
+    PLAYER_INPUT = 2
+
+
 class DiscordManager(Service):
 
     RETRY_LIMIT = 5
+    TRACKED_THREAD_LIMIT = 200
 
     def __init__(
         self,
@@ -45,6 +55,13 @@ class DiscordManager(Service):
         self.factory: ObjectFactory = self.controller.get_service(ObjectFactory)
         self.log_name = "Discord"
 
+        self.combat_messages: OrderedDict[
+            int, dict[CombatMessageType, discord.Message]
+        ] = OrderedDict()
+        self.tracked_message_hits = 0
+        self.history_scans = 0
+        self.edit_scheduler = EditScheduler(self.edit_message)
+
     async def listen_for_event(self, event: BotEvent):
         pass
 
@@ -159,42 +176,95 @@ class DiscordManager(Service):
                     if embed_title[:16] == "Combat Zone":
                         await self.edit_message(message, embed=head_embed)
 
-    async def delete_previous_combat_info(self, thread: discord.Thread | None):
-        if thread is None:
+    def __is_combat_message(
+        self, message: discord.Message, message_type: CombatMessageType
+    ) -> bool:
+        if message.author.id != self.bot.user.id or len(message.embeds) <= 0:
+            return False
+        embed = message.embeds[0]
+        match message_type:
+            case CombatMessageType.ROUND:
+                return embed.title in ["New Round", "Round Continued.."]
+            case CombatMessageType.ENEMY_INFO:
+                return (
+                    len(message.embeds) == 1
+                    and embed.image.url is not None
+                    and embed.title is not None
+                )
+            case CombatMessageType.PLAYER_INPUT:
+                return len(message.content) > 0
+        return False
+
+    def __track_message(self, message: discord.Message | None):
+        if message is None or not isinstance(message.channel, discord.Thread):
             return
+
+        thread_id = message.channel.id
+        tracked = self.combat_messages.setdefault(thread_id, {})
+        self.combat_messages.move_to_end(thread_id)
+        while len(self.combat_messages) > self.TRACKED_THREAD_LIMIT:
+            self.combat_messages.popitem(last=False)
+
+        for message_type in CombatMessageType:
+            current = tracked.get(message_type)
+            if self.__is_combat_message(message, message_type):
+                # only ever replace with a newer message, like the history scan would
+                if current is None or message.id >= current.id:
+                    tracked[message_type] = message
+            elif current is not None and current.id == message.id:
+                del tracked[message_type]
+
+    def __forget_message(self, message: discord.Message):
+        tracked = self.combat_messages.get(message.channel.id)
+        if tracked is None:
+            return
+        for message_type, current in list(tracked.items()):
+            if current.id == message.id:
+                del tracked[message_type]
+
+    async def __get_combat_message(
+        self, thread: discord.Thread, message_type: CombatMessageType
+    ) -> discord.Message | None:
+        tracked = self.combat_messages.get(thread.id)
+        if tracked is not None and message_type in tracked:
+            self.tracked_message_hits += 1
+            return tracked[message_type]
+
+        # nothing tracked yet, e.g. after a restart
+        self.history_scans += 1
         async for message in thread.history(limit=100):
-            if len(message.embeds) == 1 and message.author.id == self.bot.user.id:
-                embed = message.embeds[0]
-                if embed.image.url is not None and embed.title is not None:
-                    view = discord.ui.View.from_message(message)
-                    if view is not None:
-                        self.controller.detach_view_by_id(view.id)
-                    with contextlib.suppress(discord.NotFound):
-                        await message.delete()
-                    break
+            if self.__is_combat_message(message, message_type):
+                self.__track_message(message)
+                return message
+        return None
 
-    async def delete_active_player_input(self, thread: discord.Thread | None):
+    async def __delete_combat_message(
+        self, thread: discord.Thread | None, message_type: CombatMessageType
+    ):
         if thread is None:
             return
-        async for message in thread.history(limit=100):
-            if (  # noqa: SIM102
-                len(message.embeds) > 0 and message.author.id == self.bot.user.id
-            ):
-                if len(message.content) > 0:
-                    view = discord.ui.View.from_message(message)
-                    if view is not None:
-                        self.controller.detach_view_by_id(view.id)
-                    with contextlib.suppress(discord.NotFound):
-                        await message.delete()
-                    break
+        message = await self.__get_combat_message(thread, message_type)
+        if message is None:
+            return
+
+        view = discord.ui.View.from_message(message)
+        if view is not None:
+            self.controller.detach_view_by_id(view.id)
+        self.__forget_message(message)
+        try:
+            await message.delete()
+        except discord.NotFound:
+            # the tracked message was already removed, look for an older one
+            await self.__delete_combat_message(thread, message_type)
+
+    async def delete_previous_combat_info(self, thread: discord.Thread | None):
+        await self.__delete_combat_message(thread, CombatMessageType.ENEMY_INFO)
+
+    async def delete_active_player_input(self, thread: discord.Thread | None):
+        await self.__delete_combat_message(thread, CombatMessageType.PLAYER_INPUT)
 
     async def get_previous_enemy_info(self, thread: discord.Thread):
-        async for message in thread.history(limit=100):
-            if len(message.embeds) == 1 and message.author.id == self.bot.user.id:
-                embed = message.embeds[0]
-                if embed.image.url is not None and embed.title is not None:
-                    return message
-        return None
+        return await self.__get_combat_message(thread, CombatMessageType.ENEMY_INFO)
 
     async def update_guild_status(self, guild_id: int):
         combat_channels = await self.settings_manager.get_combat_channels(guild_id)
@@ -258,12 +328,7 @@ class DiscordManager(Service):
     async def get_previous_round_message(
         self, thread: discord.Thread
     ) -> discord.Message:
-        async for message in thread.history(limit=100):
-            if len(message.embeds) >= 1 and message.author.id == self.bot.user.id:
-                embed = message.embeds[0]
-                if embed.title == "New Round" or embed.title == "Round Continued..":
-                    return message
-        return None
+        return await self.__get_combat_message(thread, CombatMessageType.ROUND)
 
     async def refresh_round_overview(self, context: EncounterContext):
         round_message = await self.get_previous_round_message(context.thread)
@@ -290,7 +355,20 @@ class DiscordManager(Service):
 
         async for embed in generator:
             current_embeds = previous_embeds + [embed]
-            await self.edit_message(message, embeds=current_embeds)
+            self.edit_scheduler.schedule(message, embeds=current_embeds)
+
+        await self.edit_scheduler.flush(message)
+
+    def __add_fields(
+        self, base_embed: discord.Embed, fields: list[FieldData]
+    ) -> discord.Embed:
+        # to_dict is shallow, so only the field list has to be copied
+        data = base_embed.to_dict()
+        data["fields"] = data.get("fields", []) + [
+            {"name": field.name, "value": field.value, "inline": field.inline}
+            for field in fields
+        ]
+        return discord.Embed.from_dict(data)
 
     async def update_current_turn_embed_by_generator(
         self,
@@ -317,14 +395,10 @@ class DiscordManager(Service):
         current_start = 0
 
         async for field_data in generator:
-            embed = copy.deepcopy(base_embed)
-
             if embed_index is None:
-                for field in field_data[current_start:]:
-                    embed.add_field(
-                        name=field.name, value=field.value, inline=field.inline
-                    )
+                embed = self.__add_fields(base_embed, field_data[current_start:])
                 base_embed = embed
+                await self.edit_scheduler.flush(message)
                 await self.append_embed_to_round(context, embed)
                 message = await self.get_previous_round_message(thread)
                 embed_index = len(message.embeds) - 1
@@ -334,33 +408,32 @@ class DiscordManager(Service):
 
             field_count = len(field_data) - current_start
 
-            if field_count + len(embed.fields) > 25:
-                new_embed = discord.Embed(color=embed.color)
-                new_embed.set_thumbnail(url=embed.thumbnail.url)
-                new_embed.set_author(name=embed.author.name)
-                new_embed.set_thumbnail(url=embed.thumbnail.url)
+            if field_count + len(base_embed.fields) > 25:
+                new_embed = discord.Embed(color=base_embed.color)
+                new_embed.set_thumbnail(url=base_embed.thumbnail.url)
+                new_embed.set_author(name=base_embed.author.name)
                 self.embed_manager.add_text_bar(new_embed, "", "Continued ...")
                 base_embed = new_embed
 
-                embed = copy.deepcopy(base_embed)
-                await self.append_embed_to_round(context, embed)
+                await self.edit_scheduler.flush(message)
+                await self.append_embed_to_round(context, base_embed)
 
                 message = await self.get_previous_round_message(thread)
                 embed_index = len(message.embeds) - 1
                 embeds = message.embeds
                 current_start = previous_length
 
-            for field in field_data[current_start:]:
-                embed.add_field(name=field.name, value=field.value, inline=field.inline)
-
+            embed = self.__add_fields(base_embed, field_data[current_start:])
             embeds[embed_index] = embed
-            await self.edit_message(message, embeds=embeds)
+            # intermediate animation states are coalesced, the latest one always lands
+            self.edit_scheduler.schedule(message, embeds=list(embeds))
 
             if previous_length == 0:
                 base_embed = embed
 
             previous_length = len(field_data)
 
+        await self.edit_scheduler.flush(message)
         context.current_turn_embed = embed
 
     async def update_current_turn_embed(
@@ -437,14 +510,19 @@ class DiscordManager(Service):
             try:
                 new_message = await message.edit(**kwargs)
                 success = True
+            except discord.NotFound:
+                self.__forget_message(message)
+                return None
             except (discord.HTTPException, discord.DiscordServerError) as e:
                 self.logger.log(message.guild.id, e.text, self.log_name)
                 retries += 1
                 await asyncio.sleep(5)
 
         if not success:
+            self.__forget_message(message)
             self.logger.error(message.guild.id, "edit message timeout", self.log_name)
 
+        self.__track_message(new_message)
         return new_message
 
     async def send_message(self, channel: discord.channel.TextChannel, **kwargs):
@@ -463,4 +541,5 @@ class DiscordManager(Service):
         if not success:
             self.logger.error(message.guild.id, "send message timeout", self.log_name)
 
+        self.__track_message(message)
         return message
@@ -0,0 +1,82 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import discord
+
+
+@dataclass
+class ScheduledEdit:
+    message: discord.Message
+    kwargs: dict[str, Any] | None = None
+    task: asyncio.Task | None = None
+    last_edit: float | None = None
+    result: discord.Message | None = None
+
+
+class EditScheduler:
+
+    EDIT_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        edit: Callable[..., Awaitable[discord.Message | None]],
+        edit_interval: float = EDIT_INTERVAL,
+    ):
+        self.edit = edit
+        self.edit_interval = edit_interval
+        self.edits: dict[int, ScheduledEdit] = {}
+
+        self.scheduled = 0
+        self.coalesced = 0
+        self.sent = 0
+
+    def schedule(self, message: discord.Message, **kwargs):
+        self.scheduled += 1
+        edit = self.edits.get(message.id)
+        if edit is None:
+            edit = ScheduledEdit(message)
+            self.edits[message.id] = edit
+
+        if edit.kwargs is not None:
+            # the previous state was never shown, only the latest one matters
+            self.coalesced += 1
+        edit.message = message
+        edit.kwargs = kwargs
+
+        if edit.task is None or edit.task.done():
+            edit.task = asyncio.create_task(self.__run(edit))
+
+    async def flush(self, message: discord.Message) -> discord.Message | None:
+        edit = self.edits.get(message.id)
+        if edit is None or edit.task is None:
+            return None
+        await edit.task
+        return edit.result
+
+    async def __run(self, edit: ScheduledEdit):
+        loop = asyncio.get_running_loop()
+        try:
+            while edit.kwargs is not None:
+                if edit.last_edit is not None:
+                    wait = edit.last_edit + self.edit_interval - loop.time()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+
+                kwargs = edit.kwargs
+                edit.kwargs = None
+                edit.last_edit = loop.time()
+                self.sent += 1
+                result = await self.edit(edit.message, **kwargs)
+                edit.result = result
+                if result is not None:
+                    edit.message = result
+        finally:
+            loop.call_later(self.edit_interval, self.__expire, edit)
+
+    def __expire(self, edit: ScheduledEdit):
+        if edit.kwargs is not None or (edit.task is not None and not edit.task.done()):
+            return
+        if self.edits.get(edit.message.id) is edit:
+            del self.edits[edit.message.id]
@@ -26,6 +26,7 @@ from control.jail_manager import JailManager
 from control.logger import BotLogger
 from control.service import Service
 from control.settings_manager import SettingsManager
+from control.types import EventSubscription
 from control.user_settings_manager import UserSettingsManager
 from datalayer.database import Database
 from events.bot_event import BotEvent
@@ -41,6 +42,13 @@ from items.types import ItemType
 
 class EncounterManager(Service):
 
+    EVENT_SUBSCRIPTIONS = [
+        EventSubscription(
+            [EventType.ENCOUNTER, EventType.COMBAT, EventType.STATUS_EFFECT],
+            synchronized=True,
+        )
+    ]
+
     BOSS_KEY = {
         3: ItemType.DADDY_KEY,
         6: ItemType.WEEB_KEY,
@@ -236,6 +244,7 @@ class EncounterManager(Service):
                 self.engine_cache.remove(engine)
                 break
 
+        await self.context_loader.verify_encounter_context(encounter_id)
         context = await self.context_loader.load_encounter_context(encounter_id)
         engine = Engine(self.controller, context)
 
@@ -73,24 +73,23 @@ class EncounterStatistics(Service):
     async def get_highest_hit(self, context: EncounterContext):
         max_hit: CombatEvent | None = None
 
-        for event in context.combat_events:
-            if event.combat_event_type == CombatEventType.MEMBER_TURN_STEP:
-                if event.skill_value is None or event.skill_value <= 0:
-                    continue
-                skill = await self.factory.get_base_skill(event.skill_type)
-
-                if skill.skill_effect not in [
-                    SkillEffect.MAGICAL_DAMAGE,
-                    SkillEffect.PHYSICAL_DAMAGE,
-                    SkillEffect.NEUTRAL_DAMAGE,
-                    SkillEffect.EFFECT_DAMAGE,
-                ]:
-                    continue
+        for event in context.combat_events.of_type(CombatEventType.MEMBER_TURN_STEP):
+            if event.skill_value is None or event.skill_value <= 0:
+                continue
+            skill = await self.factory.get_base_skill(event.skill_type)
+
+            if skill.skill_effect not in [
+                SkillEffect.MAGICAL_DAMAGE,
+                SkillEffect.PHYSICAL_DAMAGE,
+                SkillEffect.NEUTRAL_DAMAGE,
+                SkillEffect.EFFECT_DAMAGE,
+            ]:
+                continue
 
-                if max_hit is None:
-                    max_hit = event
-                if event.display_value > max_hit.display_value:
-                    max_hit = event
+            if max_hit is None:
+                max_hit = event
+            if event.display_value > max_hit.display_value:
+                max_hit = event
 
         if max_hit is None:
             return None
@@ -103,43 +102,40 @@ class EncounterStatistics(Service):
     async def get_highest_total_damage(self, context: EncounterContext):
         damage_sum = {}
 
-        for event in context.combat_events:
-            if event.combat_event_type in [
-                CombatEventType.MEMBER_TURN_STEP,
-                CombatEventType.STATUS_EFFECT_OUTCOME,
-                CombatEventType.ENCHANTMENT_EFFECT_OUTCOME,
-            ]:
-                if event.skill_value is None or event.skill_value <= 0:
+        for event in context.combat_events.of_type(
+            CombatEventType.MEMBER_TURN_STEP,
+            CombatEventType.STATUS_EFFECT_OUTCOME,
+            CombatEventType.ENCHANTMENT_EFFECT_OUTCOME,
+        ):
+            if event.skill_value is None or event.skill_value <= 0:
+                continue
+
+            if event.skill_type in SkillType:
+                skill = await self.factory.get_base_skill(event.skill_type)
+
+                if skill.skill_effect not in [
+                    SkillEffect.MAGICAL_DAMAGE,
+                    SkillEffect.PHYSICAL_DAMAGE,
+                    SkillEffect.NEUTRAL_DAMAGE,
+                    SkillEffect.EFFECT_DAMAGE,
+                ]:
                     continue
+            if event.skill_type in StatusEffectType:
+                status_effect = await self.factory.get_status_effect(event.skill_type)
 
-                if event.skill_type in SkillType:
-                    skill = await self.factory.get_base_skill(event.skill_type)
-
-                    if skill.skill_effect not in [
-                        SkillEffect.MAGICAL_DAMAGE,
-                        SkillEffect.PHYSICAL_DAMAGE,
-                        SkillEffect.NEUTRAL_DAMAGE,
-                        SkillEffect.EFFECT_DAMAGE,
-                    ]:
-                        continue
-                if event.skill_type in StatusEffectType:
-                    status_effect = await self.factory.get_status_effect(
-                        event.skill_type
-                    )
-
-                    if status_effect.skill_effect not in [
-                        SkillEffect.MAGICAL_DAMAGE,
-                        SkillEffect.PHYSICAL_DAMAGE,
-                        SkillEffect.NEUTRAL_DAMAGE,
-                        SkillEffect.EFFECT_DAMAGE,
-                    ]:
-                        continue
-
-                if event.member_id not in damage_sum:
-                    damage_sum[event.member_id] = event.display_value
+                if status_effect.skill_effect not in [
+                    SkillEffect.MAGICAL_DAMAGE,
+                    SkillEffect.PHYSICAL_DAMAGE,
+                    SkillEffect.NEUTRAL_DAMAGE,
+                    SkillEffect.EFFECT_DAMAGE,
+                ]:
                     continue
 
-                damage_sum[event.member_id] += event.display_value
+            if event.member_id not in damage_sum:
+                damage_sum[event.member_id] = event.display_value
+                continue
+
+            damage_sum[event.member_id] += event.display_value
 
         if len(damage_sum) == 0:
             return None
@@ -159,46 +155,43 @@ class EncounterStatistics(Service):
     async def get_highest_total_damage_taken(self, context: EncounterContext):
         damage_sum = {}
 
-        for event in context.combat_events:
-            if event.combat_event_type in [
-                CombatEventType.ENEMY_TURN_STEP,
-                CombatEventType.STATUS_EFFECT_OUTCOME,
-                CombatEventType.ENCHANTMENT_EFFECT_OUTCOME,
-            ]:
-                if event.skill_value is None or event.skill_value <= 0:
-                    continue
-                if event.target_id < 0:
-                    # exclude enemies
+        for event in context.combat_events.of_type(
+            CombatEventType.ENEMY_TURN_STEP,
+            CombatEventType.STATUS_EFFECT_OUTCOME,
+            CombatEventType.ENCHANTMENT_EFFECT_OUTCOME,
+        ):
+            if event.skill_value is None or event.skill_value <= 0:
+                continue
+            if event.target_id < 0:
+                # exclude enemies
+                continue
+
+            if event.skill_type in SkillType:
+                skill = await self.factory.get_base_skill(event.skill_type)
+
+                if skill.skill_effect not in [
+                    SkillEffect.MAGICAL_DAMAGE,
+                    SkillEffect.PHYSICAL_DAMAGE,
+                    SkillEffect.NEUTRAL_DAMAGE,
+                    SkillEffect.EFFECT_DAMAGE,
+                ]:
                     continue
+            if event.skill_type in StatusEffectType:
+                status_effect = await self.factory.get_status_effect(event.skill_type)
 
-                if event.skill_type in SkillType:
-                    skill = await self.factory.get_base_skill(event.skill_type)
-
-                    if skill.skill_effect not in [
-                        SkillEffect.MAGICAL_DAMAGE,
-                        SkillEffect.PHYSICAL_DAMAGE,
-                        SkillEffect.NEUTRAL_DAMAGE,
-                        SkillEffect.EFFECT_DAMAGE,
-                    ]:
-                        continue
-                if event.skill_type in StatusEffectType:
-                    status_effect = await self.factory.get_status_effect(
-                        event.skill_type
-                    )
-
-                    if status_effect.skill_effect not in [
-                        SkillEffect.MAGICAL_DAMAGE,
-                        SkillEffect.PHYSICAL_DAMAGE,
-                        SkillEffect.NEUTRAL_DAMAGE,
-                        SkillEffect.EFFECT_DAMAGE,
-                    ]:
-                        continue
-
-                if event.target_id not in damage_sum:
-                    damage_sum[event.target_id] = event.display_value
+                if status_effect.skill_effect not in [
+                    SkillEffect.MAGICAL_DAMAGE,
+                    SkillEffect.PHYSICAL_DAMAGE,
+                    SkillEffect.NEUTRAL_DAMAGE,
+                    SkillEffect.EFFECT_DAMAGE,
+                ]:
                     continue
 
-                damage_sum[event.target_id] += event.display_value
+            if event.target_id not in damage_sum:
+                damage_sum[event.target_id] = event.display_value
+                continue
+
+            damage_sum[event.target_id] += event.display_value
 
         if len(damage_sum) == 0:
             return None
@@ -218,37 +211,34 @@ class EncounterStatistics(Service):
     async def get_highest_total_healed(self, context: EncounterContext):
         healing_sum = {}
 
-        for event in context.combat_events:
-            if event.combat_event_type in [
-                CombatEventType.MEMBER_TURN_STEP,
-                CombatEventType.STATUS_EFFECT_OUTCOME,
-                CombatEventType.ENCHANTMENT_EFFECT_OUTCOME,
-            ]:
-                if event.skill_value is None or event.skill_value <= 0:
+        for event in context.combat_events.of_type(
+            CombatEventType.MEMBER_TURN_STEP,
+            CombatEventType.STATUS_EFFECT_OUTCOME,
+            CombatEventType.ENCHANTMENT_EFFECT_OUTCOME,
+        ):
+            if event.skill_value is None or event.skill_value <= 0:
+                continue
+
+            if event.skill_type in SkillType:
+                skill = await self.factory.get_base_skill(event.skill_type)
+
+                if skill.skill_effect not in [
+                    SkillEffect.HEALING,
+                ]:
                     continue
+            if event.skill_type in StatusEffectType:
+                status_effect = await self.factory.get_status_effect(event.skill_type)
 
-                if event.skill_type in SkillType:
-                    skill = await self.factory.get_base_skill(event.skill_type)
-
-                    if skill.skill_effect not in [
-                        SkillEffect.HEALING,
-                    ]:
-                        continue
-                if event.skill_type in StatusEffectType:
-                    status_effect = await self.factory.get_status_effect(
-                        event.skill_type
-                    )
-
-                    if status_effect.skill_effect not in [
-                        SkillEffect.HEALING,
-                    ]:
-                        continue
-
-                if event.member_id not in healing_sum:
-                    healing_sum[event.member_id] = event.display_value
+                if status_effect.skill_effect not in [
+                    SkillEffect.HEALING,
+                ]:
                     continue
 
-                healing_sum[event.member_id] += event.display_value
+            if event.member_id not in healing_sum:
+                healing_sum[event.member_id] = event.display_value
+                continue
+
+            healing_sum[event.member_id] += event.display_value
 
         if len(healing_sum) == 0:
             return None
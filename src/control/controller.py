@@ -1,15 +1,17 @@
 import asyncio
 import importlib
+import time
 
 import discord
 from discord.ext import commands
 
 from control.logger import BotLogger
 from control.service import Service
-from control.types import ControllerModuleMap
+from control.types import ControllerModuleMap, EventSubscription, ListenerStats
 from control.view.view_controller import ViewController
 from datalayer.database import Database
 from events.bot_event import BotEvent
+from events.types import EventType
 from events.ui_event import UIEvent
 from view.view_menu import ViewMenu
 
@@ -30,6 +32,11 @@ class Controller:
         self.view_controllers: list[ViewController] = []
         self.views: list[ViewMenu] = []
 
+        self.event_routes: dict[EventType, list[tuple[Service, EventSubscription]]] = {}
+        self.listener_stats: dict[str, ListenerStats] = {}
+        self.dispatched_events = 0
+        self.scheduled_listeners = 0
+
     def register_view(self, view: ViewMenu):
 
         controller_types = view.controller_types
@@ -66,12 +73,50 @@ class Controller:
                 if view in self.views:
                     self.views.remove(view)
 
+    def subscribe(self, listener: Service, subscription: EventSubscription):
+        for event_type in subscription.event_types:
+            self.event_routes.setdefault(event_type, []).append(
+                (listener, subscription)
+            )
+
+    def unsubscribe(
+        self, listener: Service, subscription: EventSubscription | None = None
+    ):
+        for event_type, routes in self.event_routes.items():
+            self.event_routes[event_type] = [
+                (route_listener, route_subscription)
+                for route_listener, route_subscription in routes
+                if route_listener is not listener
+                or (subscription is not None and route_subscription is not subscription)
+            ]
+
+    def get_listeners(self, event: BotEvent) -> list[Service]:
+        listeners = []
+        for listener, subscription in self.event_routes.get(event.type, []):
+            if listener not in listeners and subscription.matches(event):
+                listeners.append(listener)
+        return listeners
+
+    async def __notify_listener(self, listener: Service, event: BotEvent):
+        start = time.perf_counter()
+        try:
+            await listener.listen_for_event(event)
+        finally:
+            # includes any dispatch the listener awaits in turn
+            name = listener.__class__.__name__
+            stats = self.listener_stats.setdefault(name, ListenerStats())
+            stats.add(time.perf_counter() - start)
+
     async def dispatch_event(self, event: BotEvent):
+        listeners = self.get_listeners(event)
+        self.dispatched_events += 1
+        self.scheduled_listeners += len(listeners)
+        if len(listeners) <= 0:
+            return
+
         tasks = []
-        for service in self.services:
-            tasks.append(asyncio.create_task(service.listen_for_event(event)))
-        for view_controller in self.view_controllers:
-            tasks.append(asyncio.create_task(view_controller.listen_for_event(event)))
+        for listener in listeners:
+            tasks.append(asyncio.create_task(self.__notify_listener(listener, event)))
         result = await asyncio.gather(*tasks, return_exceptions=True)
 
         for res in result:
@@ -99,6 +144,8 @@ class Controller:
 
         new_service = service_class(self.bot, self.logger, self.database, self)
         self.services.append(new_service)
+        for subscription in new_service.EVENT_SUBSCRIPTIONS:
+            self.subscribe(new_service, subscription)
         return new_service
 
     def get_view(self, id: int) -> ViewMenu:
@@ -114,3 +161,5 @@ class Controller:
 
         new_controller = controller(self.bot, self.logger, self.database, self)
         self.view_controllers.append(new_controller)
+        for subscription in new_controller.EVENT_SUBSCRIPTIONS:
+            self.subscribe(new_controller, subscription)
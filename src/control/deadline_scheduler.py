@@ -0,0 +1,156 @@
+import asyncio
+import contextlib
+import datetime
+import heapq
+import traceback
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from discord.ext import commands
+
+from control.controller import Controller
+from control.logger import BotLogger
+from control.service import Service
+from control.types import TimerType
+from datalayer.database import Database
+from events.bot_event import BotEvent
+
+
+@dataclass(order=True)
+class Timer:
+    deadline: datetime.datetime
+    sequence: int
+    timer_type: TimerType = field(compare=False)
+    target_id: int = field(compare=False)
+    guild_id: int = field(compare=False)
+    callback: Callable[[], Awaitable[None]] = field(compare=False, repr=False)
+    cancelled: bool = field(default=False, compare=False)
+
+    @property
+    def key(self) -> tuple[TimerType, int]:
+        return (self.timer_type, self.target_id)
+
+
+class DeadlineScheduler(Service):
+
+    def __init__(
+        self,
+        bot: commands.Bot,
+        logger: BotLogger,
+        database: Database,
+        controller: Controller,
+    ):
+        super().__init__(bot, logger, database)
+        self.controller = controller
+        self.log_name = "Timers"
+
+        self.queue: list[Timer] = []
+        self.timers: dict[tuple[TimerType, int], Timer] = {}
+        self.sequence = 0
+        self.wakeup = asyncio.Event()
+        self.runner: asyncio.Task | None = None
+        self.running: set[asyncio.Task] = set()
+
+        self.fired = 0
+        self.max_lateness = 0
+
+    async def listen_for_event(self, event: BotEvent):
+        pass
+
+    def schedule(
+        self,
+        timer_type: TimerType,
+        target_id: int,
+        guild_id: int,
+        deadline: datetime.datetime,
+        callback: Callable[[], Awaitable[None]],
+    ) -> Timer:
+        self.cancel(timer_type, target_id)
+
+        self.sequence += 1
+        timer = Timer(
+            deadline, self.sequence, timer_type, target_id, guild_id, callback
+        )
+        self.timers[timer.key] = timer
+        heapq.heappush(self.queue, timer)
+
+        if len(self.queue) > 2 * len(self.timers) + 64:
+            # drop the cancelled entries lazy deletion left behind
+            self.queue = [timer for timer in self.queue if not timer.cancelled]
+            heapq.heapify(self.queue)
+
+        if self.queue[0] is timer:
+            self.wakeup.set()
+        if self.runner is None or self.runner.done():
+            self.runner = asyncio.create_task(self.__run())
+        return timer
+
+    def reschedule(
+        self, timer_type: TimerType, target_id: int, deadline: datetime.datetime
+    ) -> Timer | None:
+        timer = self.get_timer(timer_type, target_id)
+        if timer is None:
+            return None
+        return self.schedule(
+            timer_type, target_id, timer.guild_id, deadline, timer.callback
+        )
+
+    def cancel(self, timer_type: TimerType, target_id: int) -> bool:
+        timer = self.timers.pop((timer_type, target_id), None)
+        if timer is None:
+            return False
+        timer.cancelled = True
+        return True
+
+    def get_timer(self, timer_type: TimerType, target_id: int) -> Timer | None:
+        return self.timers.get((timer_type, target_id))
+
+    @staticmethod
+    def next_full_hour() -> datetime.datetime:
+        now = datetime.datetime.now()
+        return now.replace(minute=0, second=0, microsecond=0) + datetime.timedelta(
+            hours=1
+        )
+
+    def get_pending_timers(self, guild_id: int | None = None) -> list[Timer]:
+        return sorted(
+            timer
+            for timer in self.timers.values()
+            if guild_id is None or timer.guild_id == guild_id
+        )
+
+    async def __run(self):
+        while True:
+            while len(self.queue) > 0 and self.queue[0].cancelled:
+                heapq.heappop(self.queue)
+
+            self.wakeup.clear()
+            if len(self.queue) <= 0:
+                await self.wakeup.wait()
+                continue
+
+            wait = (self.queue[0].deadline - datetime.datetime.now()).total_seconds()
+            if wait > 0:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self.wakeup.wait(), timeout=wait)
+                continue
+
+            timer = heapq.heappop(self.queue)
+            del self.timers[timer.key]
+            self.fired += 1
+            self.max_lateness = max(self.max_lateness, -wait)
+
+            task = asyncio.create_task(self.__fire(timer))
+            self.running.add(task)
+            task.add_done_callback(self.running.discard)
+
+    async def __fire(self, timer: Timer):
+        try:
+            await timer.callback()
+        except Exception:
+            print(traceback.format_exc())
+            self.logger.error(
+                timer.guild_id,
+                f"{timer.timer_type.value} timer for {timer.target_id} failed.",
+                self.log_name,
+            )
@@ -1,5 +1,8 @@
+import asyncio
 import os
 import random
+import time
+from collections import OrderedDict
 from typing import Any
 
 from discord.ext import commands
@@ -20,6 +23,13 @@ class ImgurManager(Service):
     KEY = "IMGUR_API_KEY"
     SECRET = "IMGUR_API_SECRET"
 
+    ALBUM_TTL = 60 * 60
+    IMAGE_CACHE_SIZE = 512
+
+    ENCOUNTER_ALBUMS = {
+        EnemyType.SCRIBBLER: ["f4pqgvP", "Wygs1pV"],
+    }
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -35,19 +45,94 @@ class ImgurManager(Service):
 
         self.secret = os.environ.get(self.SECRET)
 
-        self.client = ImgurClient(self.token, self.secret)
-
-        self.image_cache: dict[Any, str] = {}
+        # ImgurClient fetches its rate limits on construction, so it is
+        # created lazily off the event loop.
+        self.client: ImgurClient | None = None
+        if self.token is None:
+            self.logger.error(
+                "init",
+                f"{self.KEY} is not set, encounters will have no images.",
+                self.log_name,
+            )
+
+        self.client_lock = asyncio.Lock()
+        self.album_cache: dict[str, tuple[float, list[Image]]] = {}
+        self.album_locks: dict[str, asyncio.Lock] = {}
+        self.image_cache: OrderedDict[Any, Image] = OrderedDict()
 
     async def listen_for_event(self, event: BotEvent) -> str:
         pass
 
-    async def get_random_encounter_image(self, encounter: Encounter):
-        match encounter.enemy_type:
-            case EnemyType.SCRIBBLER:
-                return await self.get_random_album_image(
-                    ["f4pqgvP", "Wygs1pV"], encounter.id
+    async def __get_client(self) -> ImgurClient:
+        async with self.client_lock:
+            if self.client is None:
+                loop = asyncio.get_running_loop()
+                self.client = await loop.run_in_executor(
+                    None, ImgurClient, self.token, self.secret
                 )
+        return self.client
+
+    async def get_album_images(self, album_id: str) -> list[Image]:
+        cached = self.album_cache.get(album_id)
+        if cached is not None and time.monotonic() - cached[0] < self.ALBUM_TTL:
+            return cached[1]
+
+        if self.client is None and self.token is None:
+            return []
+
+        if album_id not in self.album_locks:
+            self.album_locks[album_id] = asyncio.Lock()
+
+        async with self.album_locks[album_id]:
+            cached = self.album_cache.get(album_id)
+            if cached is not None and time.monotonic() - cached[0] < self.ALBUM_TTL:
+                return cached[1]
+
+            try:
+                client = await self.__get_client()
+                loop = asyncio.get_running_loop()
+                images = await loop.run_in_executor(
+                    None, client.get_album_images, album_id
+                )
+            except Exception as e:
+                self.logger.error(
+                    "imgur", f"Failed to fetch album {album_id}: {e}", self.log_name
+                )
+                if cached is not None:
+                    # serve the stale listing until imgur is reachable again
+                    return cached[1]
+                return []
+
+            if images is None:
+                images = []
+            self.album_cache[album_id] = (time.monotonic(), images)
+            return images
+
+    async def prefetch_albums(self):
+        album_ids = {
+            album_id
+            for album_ids in self.ENCOUNTER_ALBUMS.values()
+            for album_id in album_ids
+        }
+        await asyncio.gather(
+            *[self.get_album_images(album_id) for album_id in album_ids]
+        )
+        image_count = sum(
+            len(self.album_cache[album_id][1])
+            for album_id in album_ids
+            if album_id in self.album_cache
+        )
+        self.logger.log(
+            "init",
+            f"Prefetched {image_count} images from {len(album_ids)} albums.",
+            self.log_name,
+        )
+
+    async def get_random_encounter_image(self, encounter: Encounter):
+        if encounter.enemy_type in self.ENCOUNTER_ALBUMS:
+            return await self.get_random_album_image(
+                self.ENCOUNTER_ALBUMS[encounter.enemy_type], encounter.id
+            )
         return None
 
     async def get_random_album_image(self, album_ids: list[str], seed: Any):
@@ -55,18 +140,19 @@ class ImgurManager(Service):
             seed = random.randint(-9999, -1)
 
         if seed in self.image_cache:
+            self.image_cache.move_to_end(seed)
             return self.image_cache[seed]
+
         images: list[Image] = []
-        try:
-            for album_id in album_ids:
-                images.extend(self.client.get_album_images(album_id))
-        except:  # noqa: E722
-            return None
+        for album_id in album_ids:
+            images.extend(await self.get_album_images(album_id))
 
-        if images is None or len(images) <= 0:
+        if len(images) <= 0:
             return None
 
         choice = random.choice(images)
 
         self.image_cache[seed] = choice
+        if len(self.image_cache) > self.IMAGE_CACHE_SIZE:
+            self.image_cache.popitem(last=False)
         return choice
@@ -8,9 +8,11 @@ from discord.ext import commands
 from bot_util import BotUtil
 from config import Config
 from control.controller import Controller
+from control.deadline_scheduler import DeadlineScheduler
 from control.logger import BotLogger
 from control.service import Service
 from control.settings_manager import SettingsManager
+from control.types import EventSubscription, TimerType
 from datalayer.database import Database
 from datalayer.inventory import UserInventory
 from datalayer.lootbox import LootBox
@@ -21,7 +23,7 @@ from events.inventory_batchevent import InventoryBatchEvent
 from events.inventory_event import InventoryEvent
 from events.lootbox_event import LootBoxEvent
 from events.notification_event import NotificationEvent
-from events.types import BeansEventType, LootBoxEventType
+from events.types import BeansEventType, EventType, LootBoxEventType
 
 # needed for global access
 from items import *  # noqa: F403
@@ -34,6 +36,8 @@ from view.shop.user_select_view import ShopUserSelectView
 
 class ItemManager(Service):
 
+    EVENT_SUBSCRIPTIONS = [EventSubscription([EventType.LOOTBOX])]
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -46,10 +50,26 @@ class ItemManager(Service):
         self.settings_manager: SettingsManager = self.controller.get_service(
             SettingsManager
         )
+        self.deadline_scheduler: DeadlineScheduler = self.controller.get_service(
+            DeadlineScheduler
+        )
         self.log_name = "Items"
 
     async def listen_for_event(self, event: BotEvent):
-        pass
+        match event.type:
+            case EventType.LOOTBOX:
+                loot_box_event: LootBoxEvent = event
+                match loot_box_event.loot_box_event_type:
+                    case LootBoxEventType.CLAIM | LootBoxEventType.OPEN:
+                        # the drop timer waits for the open box, recheck it soon
+                        timer = self.deadline_scheduler.get_timer(
+                            TimerType.LOOTBOX_DROP, event.guild_id
+                        )
+                        check = datetime.datetime.now() + datetime.timedelta(minutes=1)
+                        if timer is not None and timer.deadline > check:
+                            self.deadline_scheduler.reschedule(
+                                TimerType.LOOTBOX_DROP, event.guild_id, check
+                            )
 
     async def get_item(self, guild_id: int, item_type: ItemType) -> Item:
 
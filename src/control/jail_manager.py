@@ -6,9 +6,11 @@ from discord.ext import commands
 
 from bot_util import BotUtil
 from control.controller import Controller
+from control.deadline_scheduler import DeadlineScheduler
 from control.logger import BotLogger
 from control.service import Service
 from control.settings_manager import SettingsManager
+from control.types import EventSubscription, TimerType
 from datalayer.database import Database
 from datalayer.jail import UserJail
 from events.bot_event import BotEvent
@@ -23,6 +25,8 @@ from items.types import ItemType
 
 class JailManager(Service):
 
+    EVENT_SUBSCRIPTIONS = [EventSubscription([EventType.INVENTORY, EventType.JAIL])]
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -35,6 +39,9 @@ class JailManager(Service):
         self.settings_manager: SettingsManager = self.controller.get_service(
             SettingsManager
         )
+        self.deadline_scheduler: DeadlineScheduler = self.controller.get_service(
+            DeadlineScheduler
+        )
         self.log_name = "Jail"
 
     async def listen_for_event(self, event: BotEvent):
@@ -48,6 +55,9 @@ class JailManager(Service):
                             await self.random_jailing(
                                 guild, event.get_causing_user_id()
                             )
+            case EventType.JAIL:
+                jail_event: JailEvent = event
+                await self.update_release(jail_event)
 
     async def get_active_jail(self, guild_id: int, user: discord.Member) -> UserJail:
         affected_jails = await self.database.get_active_jails_by_member(
@@ -75,6 +85,86 @@ class JailManager(Service):
         remainder = release_timestamp - datetime.datetime.now()
         return max(remainder.total_seconds() / 60, 0)
 
+    async def update_release(self, event: JailEvent):
+        if event.jail_event_type == JailEventType.RELEASE:
+            self.deadline_scheduler.cancel(TimerType.JAIL_RELEASE, event.jail_id)
+            return
+
+        timer = self.deadline_scheduler.get_timer(TimerType.JAIL_RELEASE, event.jail_id)
+        if timer is not None:
+            deadline = timer.deadline + datetime.timedelta(minutes=event.duration)
+            self.deadline_scheduler.reschedule(
+                TimerType.JAIL_RELEASE, event.jail_id, deadline
+            )
+            return
+
+        jail = await self.database.get_jail(event.jail_id)
+        if jail is None or jail.released_on is not None:
+            return
+        # the event might not be logged yet, the release check corrects this
+        deadline = max(
+            await self.get_release_deadline(jail),
+            event.datetime + datetime.timedelta(minutes=event.duration),
+        )
+        self.schedule_release(jail, deadline)
+
+    async def get_release_deadline(self, jail: UserJail) -> datetime.datetime:
+        remaining = await self.get_jail_remaining(jail)
+        return datetime.datetime.now() + datetime.timedelta(minutes=remaining)
+
+    def schedule_release(self, jail: UserJail, deadline: datetime.datetime):
+        async def release():
+            await self.check_release(jail.id)
+
+        self.deadline_scheduler.schedule(
+            TimerType.JAIL_RELEASE, jail.id, jail.guild_id, deadline, release
+        )
+
+    async def check_release(self, jail_id: int):
+        jail = await self.database.get_jail(jail_id)
+        if jail is None or jail.released_on is not None:
+            return
+
+        guild_id = jail.guild_id
+        duration = await self.get_jail_duration(jail)
+        remaining = await self.get_jail_remaining(jail)
+
+        if remaining > 0:
+            self.schedule_release(jail, await self.get_release_deadline(jail))
+            return
+
+        guild = self.bot.get_guild(guild_id)
+        member = guild.get_member(jail.member_id) if guild is not None else None
+
+        if member is not None:
+            jail_role = await self.settings_manager.get_jail_role(guild_id)
+            await member.remove_roles(member.get_role(jail_role))
+
+        self.logger.log(
+            guild_id,
+            f"User {jail.member_id} was released from jail after {BotUtil.strfdelta(duration, inputtype='minutes')}.",
+            cog=self.log_name,
+        )
+
+        time_now = datetime.datetime.now()
+        event = JailEvent(
+            time_now,
+            guild_id,
+            JailEventType.RELEASE,
+            self.bot.user.id,
+            0,
+            jail.id,
+        )
+        await self.controller.dispatch_event(event)
+
+        if guild is None:
+            return
+
+        await self.announce(
+            guild,
+            f"<@{jail.member_id}> was released from jail after {BotUtil.strfdelta(duration, inputtype='minutes')}.",
+        )
+
     async def announce(
         self, guild: discord.Guild, message: str, *args, **kwargs
     ) -> str:
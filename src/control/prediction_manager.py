@@ -1,7 +1,9 @@
 import asyncio
+import datetime
 
 import discord
 from datalayer.database import Database
+from datalayer.prediction import Prediction
 from datalayer.types import PredictionState, PredictionStateSort
 from discord.ext import commands
 from events.bot_event import BotEvent
@@ -19,13 +21,17 @@ from view.prediction.overview_view import PredictionOverviewView
 from view.prediction.view import PredictionView
 
 from control.controller import Controller
+from control.deadline_scheduler import DeadlineScheduler
 from control.logger import BotLogger
 from control.service import Service
 from control.settings_manager import SettingsManager
+from control.types import EventSubscription, TimerType
 
 
 class PredictionManager(Service):
 
+    EVENT_SUBSCRIPTIONS = [EventSubscription([EventType.PREDICTION])]
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -38,6 +44,9 @@ class PredictionManager(Service):
         self.settings_manager: SettingsManager = self.controller.get_service(
             SettingsManager
         )
+        self.deadline_scheduler: DeadlineScheduler = self.controller.get_service(
+            DeadlineScheduler
+        )
         self.log_name = "Predictions"
 
     async def listen_for_event(self, event: BotEvent):
@@ -45,6 +54,15 @@ class PredictionManager(Service):
             case EventType.PREDICTION:
                 prediction_event: PredictionEvent = event
 
+                if (
+                    prediction_event.prediction_event_type
+                    != PredictionEventType.PLACE_BET
+                ):
+                    prediction = await self.database.get_prediction_by_id(
+                        prediction_event.prediction_id
+                    )
+                    self.schedule_lock(prediction)
+
                 match prediction_event.prediction_event_type:
                     case (
                         PredictionEventType.APPROVE
@@ -73,6 +91,69 @@ class PredictionManager(Service):
                         )
                         await self.controller.dispatch_ui_event(event)
 
+    def schedule_lock(self, prediction: Prediction):
+        if (
+            prediction.state != PredictionState.APPROVED
+            or prediction.lock_datetime is None
+        ):
+            self.deadline_scheduler.cancel(TimerType.PREDICTION_LOCK, prediction.id)
+            return
+
+        async def lock():
+            await self.check_lock(prediction.id)
+
+        self.deadline_scheduler.schedule(
+            TimerType.PREDICTION_LOCK,
+            prediction.id,
+            prediction.guild_id,
+            prediction.lock_datetime,
+            lock,
+        )
+
+    async def check_lock(self, prediction_id: int):
+        prediction = await self.database.get_prediction_by_id(prediction_id)
+
+        if (
+            prediction is None
+            or prediction.state != PredictionState.APPROVED
+            or prediction.lock_datetime is None
+        ):
+            return
+
+        if datetime.datetime.now() < prediction.lock_datetime:
+            self.schedule_lock(prediction)
+            return
+
+        guild_id = prediction.guild_id
+        prediction.state = PredictionState.LOCKED
+        prediction.lock_datetime = None
+        await self.database.update_prediction(prediction)
+
+        event = PredictionEvent(
+            datetime.datetime.now(),
+            guild_id,
+            prediction.id,
+            self.bot.user.id,
+            PredictionEventType.LOCK,
+        )
+        await self.controller.dispatch_event(event)
+
+        guild = self.bot.get_guild(guild_id)
+        if guild is None:
+            return
+
+        bean_channels = await self.settings_manager.get_beans_notification_channels(
+            guild_id
+        )
+        announcement = (
+            f"**This prediction has been locked in!**\n> {prediction.content}\nNo more bets will be accepted. "
+            "The winners will be paid out once an outcome is achieved. Good luck!\nYou can also submit your own "
+            "prediction ideas in the overview channel or in the `/shop`."
+        )
+        for channel_id in bean_channels:
+            channel = guild.get_channel(channel_id)
+            await channel.send(announcement)
+
     async def refresh_prediction_messages(self, guild_id: int):
         prediction_channels = await self.settings_manager.get_predictions_channels(
             guild_id
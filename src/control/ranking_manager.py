@@ -0,0 +1,205 @@
+import asyncio
+from typing import Any
+
+from discord.ext import commands
+
+from control.controller import Controller
+from control.logger import BotLogger
+from control.service import Service
+from datalayer.database import Database
+from datalayer.ranking import RankingAggregate
+from datalayer.types import UserInteraction
+from events.beans_event import BeansEvent
+from events.bot_event import BotEvent
+from events.interaction_event import InteractionEvent
+from events.jail_event import JailEvent
+from events.karma_event import KarmaEvent
+from events.spam_event import SpamEvent
+from events.timeout_event import TimeoutEvent
+from events.types import BeansEventType, EventType
+from view.types import RankingType
+
+
+class RankingManager(Service):
+
+    def __init__(
+        self,
+        bot: commands.Bot,
+        logger: BotLogger,
+        database: Database,
+        controller: Controller,
+    ):
+        super().__init__(bot, logger, database)
+        self.controller = controller
+        self.log_name = "Rankings"
+
+        self.aggregates: dict[tuple[int, int], RankingAggregate] = {}
+        self.backfill_locks: dict[tuple[int, int], asyncio.Lock] = {}
+        self.pending_events: dict[tuple[int, int], list[tuple[int, BotEvent]]] = {}
+        self.jail_members: dict[int, int] = {}
+
+    async def listen_for_event(self, event: BotEvent):
+        pass
+
+    async def add_event(self, event: BotEvent, event_id: int):
+        if event.type not in [
+            EventType.INTERACTION,
+            EventType.TIMEOUT,
+            EventType.JAIL,
+            EventType.SPAM,
+            EventType.KARMA,
+            EventType.BEANS,
+        ]:
+            return
+
+        guild_id = event.guild_id
+        season = await self.database.get_guild_current_season_number(guild_id)
+        key = (guild_id, season)
+        aggregate = self.aggregates.get(key)
+
+        if aggregate is None:
+            # a running backfill may or may not see this event, it sorts
+            # that out once its snapshot is read
+            if key in self.pending_events:
+                self.pending_events[key].append((event_id, event))
+            # otherwise nothing to update until the season is first
+            # requested, the backfill will read this event then
+            return
+
+        if event_id <= aggregate.last_event_id:
+            return
+
+        await self.__add_to_aggregate(aggregate, event)
+
+    async def __add_to_aggregate(self, aggregate: RankingAggregate, event: BotEvent):
+        match event.type:
+            case EventType.INTERACTION:
+                aggregate.add_interaction_event(event)
+            case EventType.TIMEOUT:
+                aggregate.add_timeout_event(event)
+            case EventType.JAIL:
+                jail_event: JailEvent = event
+                user_id = await self.__get_jail_member(jail_event.jail_id)
+                if user_id is not None:
+                    aggregate.add_jail_event(jail_event, user_id)
+            case EventType.SPAM:
+                aggregate.add_spam_event(event)
+            case EventType.KARMA:
+                aggregate.add_karma_event(event)
+            case EventType.BEANS:
+                aggregate.add_beans_event(event)
+
+    async def __get_jail_member(self, jail_id: int) -> int | None:
+        if jail_id not in self.jail_members:
+            jail = await self.database.get_jail(jail_id)
+            if jail is None:
+                return None
+            self.jail_members[jail_id] = jail.member_id
+        return self.jail_members[jail_id]
+
+    async def get_aggregate(self, guild_id: int, season: int) -> RankingAggregate:
+        if season is None:
+            season = await self.database.get_guild_current_season_number(guild_id)
+
+        key = (guild_id, season)
+        if key in self.aggregates:
+            return self.aggregates[key]
+
+        if key not in self.backfill_locks:
+            self.backfill_locks[key] = asyncio.Lock()
+
+        async with self.backfill_locks[key]:
+            if key not in self.aggregates:
+                await self.backfill(guild_id, season)
+
+        return self.aggregates[key]
+
+    async def backfill(self, guild_id: int, season: int):
+        key = (guild_id, season)
+        self.pending_events[key] = []
+
+        # loads the season cache, the snapshot queries must not wait for a
+        # second reader connection
+        await self.database.get_guild_current_season_number(guild_id)
+
+        try:
+            # every query reads the same snapshot, so the backfill holds exactly
+            # the events up to last_event_id and newer ones are pending
+            async with self.database.read_snapshot() as db:
+                aggregate = RankingAggregate(await self.database.get_last_event_id(db))
+
+                events: list[InteractionEvent] = []
+                for interaction_type in [
+                    UserInteraction.SLAP,
+                    UserInteraction.PET,
+                    UserInteraction.FART,
+                ]:
+                    events.extend(
+                        await self.database.get_guild_interaction_events(
+                            guild_id, interaction_type, season, db
+                        )
+                    )
+                timeout_events: list[TimeoutEvent] = (
+                    await self.database.get_timeout_events_by_guild(
+                        guild_id, season, db
+                    )
+                )
+                jail_data = await self.database.get_jail_events_by_guild(
+                    guild_id, season, db
+                )
+                spam_events: list[SpamEvent] = (
+                    await self.database.get_spam_events_by_guild(guild_id, season, db)
+                )
+                karma_events: list[KarmaEvent] = (
+                    await self.database.get_karma_events_by_guild(
+                        guild_id, season, db=db
+                    )
+                )
+                beans_events: list[BeansEvent] = (
+                    await self.database.get_guild_beans_events(
+                        guild_id,
+                        [BeansEventType.GAMBA_COST, BeansEventType.GAMBA_PAYOUT],
+                        season,
+                        db,
+                    )
+                )
+
+            for event in events:
+                aggregate.add_interaction_event(event)
+            for event in timeout_events:
+                aggregate.add_timeout_event(event)
+            for jail, jail_events in jail_data.items():
+                self.jail_members[jail.id] = jail.member_id
+                for event in jail_events:
+                    aggregate.add_jail_event(event, jail.member_id)
+            for event in spam_events:
+                aggregate.add_spam_event(event)
+            for event in karma_events:
+                aggregate.add_karma_event(event)
+            for event in beans_events:
+                aggregate.add_beans_event(event)
+
+            # events logged while reading, in id order for the gamba streaks
+            pending = self.pending_events[key]
+            while len(pending) > 0:
+                batch = sorted(pending, key=lambda item: item[0])
+                pending.clear()
+                for event_id, event in batch:
+                    if event_id > aggregate.last_event_id:
+                        await self.__add_to_aggregate(aggregate, event)
+
+            self.aggregates[key] = aggregate
+        finally:
+            del self.pending_events[key]
+
+        self.logger.log(
+            guild_id,
+            f"Backfilled rankings for season {season} up to event {aggregate.last_event_id}.",
+            self.log_name,
+        )
+
+    async def get_rankings(
+        self, guild_id: int, ranking_type: RankingType, season: int, limit: int
+    ) -> list[tuple[int, Any]]:
+        aggregate = await self.get_aggregate(guild_id, season)
+        return aggregate.get_top(ranking_type, limit)
@@ -7,6 +7,7 @@ from control.controller import Controller
 from control.logger import BotLogger
 from control.service import Service
 from control.settings_manager import SettingsManager
+from control.types import EventSubscription
 from datalayer.database import Database
 from events.bot_event import BotEvent
 from events.inventory_event import InventoryEvent
@@ -16,6 +17,8 @@ from items.types import ItemType
 
 class RoleManager(Service):
 
+    EVENT_SUBSCRIPTIONS = [EventSubscription([EventType.INVENTORY])]
+
     LOTTERY_ROLE_NAME = "Lottery"
     TIMEOUT_ROLE_NAME = "Timeout"
 
@@ -5,10 +5,14 @@ from discord.ext import commands
 from events.bot_event import BotEvent
 
 from control.logger import BotLogger
+from control.types import EventSubscription
 
 
 class Service(ABC):
 
+    # the events the controller routes to listen_for_event
+    EVENT_SUBSCRIPTIONS: list[EventSubscription] = []
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -1,3 +1,7 @@
+import copy
+import json
+from typing import Any
+
 from discord.ext import commands
 
 from combat.types import UnlockableFeature
@@ -114,6 +118,10 @@ class SettingsManager(Service):
         self.controller = controller
         self.log_name = "Settings"
 
+        self.setting_cache: dict[int, dict[tuple[str, str], Any]] | None = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+
         # defaults
         general_settings = ModuleSettings(self.GENERAL_SUBSETTINGS_KEY, name="General")
         general_settings.add_setting(
@@ -362,16 +370,39 @@ class SettingsManager(Service):
 
         return features
 
+    async def load_settings(self) -> None:
+        self.setting_cache = await self.database.get_all_settings()
+        self.logger.log(
+            "init",
+            f"Loaded settings for {len(self.setting_cache)} guilds.",
+            self.log_name,
+        )
+
     async def update_setting(
         self, guild: int, subsetting_key: str, key: str, value
     ) -> None:
         await self.database.update_setting(guild, subsetting_key, key, value)
 
+        if self.setting_cache is None:
+            return
+        if guild not in self.setting_cache:
+            self.setting_cache[guild] = {}
+        # store what a database read would return, e.g. tuples become lists
+        self.setting_cache[guild][(subsetting_key, key)] = json.loads(json.dumps(value))
+
     async def get_setting(self, guild: int, subsetting_key: str, key: str):
-        result = await self.database.get_setting(guild, subsetting_key, key)
+        if self.setting_cache is None:
+            self.cache_misses += 1
+            await self.load_settings()
+        else:
+            self.cache_hits += 1
+
+        guild_settings = self.setting_cache.get(guild, {})
+        result = guild_settings.get((subsetting_key, key))
 
         if result is not None:
-            return result
+            # callers may modify the list settings they get back
+            return copy.copy(result) if isinstance(result, list | dict) else result
 
         return self.settings.get_default_setting(subsetting_key, key)
 
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 from enum import Enum
 
+from events.bot_event import BotEvent
+from events.types import EventType
+
 
 class UserSettingType(str, Enum):
     GAMBA_DEFAULT = "gamba_default"
@@ -91,8 +94,50 @@ class ControllerModuleMap(str, Enum):
         return map[controller_type]
 
 
+class TimerType(str, Enum):
+    JAIL_RELEASE = "jail_release"
+    PREDICTION_LOCK = "prediction_lock"
+    LOOTBOX_DROP = "lootbox_drop"
+    ENCOUNTER_SPAWN = "encounter_spawn"
+    LOW_LVL_ENCOUNTER_SPAWN = "low_lvl_encounter_spawn"
+
+
 @dataclass
 class FieldData:
     name: str
     value: str
     inline: bool
+
+
+@dataclass
+class EventSubscription:
+    event_types: list[EventType]
+    synchronized: bool | None = None
+    encounter_id: int | None = None
+
+    def matches(self, event: BotEvent) -> bool:
+        if event.type not in self.event_types:
+            return False
+        if self.synchronized is not None and event.synchronized != self.synchronized:
+            return False
+        return self.encounter_id is None or (
+            getattr(event, "encounter_id", None) == self.encounter_id
+        )
+
+
+@dataclass
+class ListenerStats:
+    calls: int = 0
+    total_time: float = 0
+    max_time: float = 0
+
+    @property
+    def average_time(self) -> float:
+        if self.calls <= 0:
+            return 0
+        return self.total_time / self.calls
+
+    def add(self, duration: float):
+        self.calls += 1
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
@@ -18,6 +18,7 @@ from control.event_manager import EventManager
 from control.item_manager import ItemManager
 from control.logger import BotLogger
 from control.settings_manager import SettingsManager
+from control.types import EventSubscription
 from control.view.view_controller import ViewController
 from datalayer.database import Database
 from events.bot_event import BotEvent
@@ -29,6 +30,8 @@ from items.item import Item
 
 class CombatViewController(ViewController):
 
+    EVENT_SUBSCRIPTIONS = [EventSubscription([EventType.ENCOUNTER], synchronized=True)]
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -184,8 +187,8 @@ class CombatViewController(ViewController):
 
             already_left = False
 
-            for event in context.encounter_events:
-                if event.member_id == member_id and event.encounter_event_type in [
+            for event in context.encounter_events.by_member(member_id):
+                if event.encounter_event_type in [
                     EncounterEventType.MEMBER_LEAVING,
                 ]:
                     already_left = True
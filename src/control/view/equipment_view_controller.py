@@ -18,6 +18,7 @@ from control.controller import Controller
 from control.event_manager import EventManager
 from control.forge_manager import ForgeManager
 from control.logger import BotLogger
+from control.types import EventSubscription
 from control.view.view_controller import ViewController
 from datalayer.database import Database
 from events.bot_event import BotEvent
@@ -40,6 +41,8 @@ from view.combat.special_shop_view import SpecialShopView
 
 class EquipmentViewController(ViewController):
 
+    EVENT_SUBSCRIPTIONS = [EventSubscription([EventType.INVENTORY])]
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -9,6 +9,7 @@ from control.controller import Controller
 from control.item_manager import ItemManager
 from control.logger import BotLogger
 from control.settings_manager import SettingsManager
+from control.types import EventSubscription
 from control.view.view_controller import ViewController
 from datalayer.database import Database
 from datalayer.garden import Plot, UserGarden
@@ -29,6 +30,8 @@ from view.garden.view import GardenView
 
 class GardenViewController(ViewController):
 
+    EVENT_SUBSCRIPTIONS = [EventSubscription([EventType.BEANS, EventType.INVENTORY])]
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -11,6 +11,7 @@ from control.controller import Controller
 from control.item_manager import ItemManager
 from control.logger import BotLogger
 from control.settings_manager import SettingsManager
+from control.types import EventSubscription
 from control.view.view_controller import ViewController
 from datalayer.database import Database
 from datalayer.inventory import UserInventory
@@ -96,6 +97,8 @@ class InventoryCombineAction(InventoryInteraction):
 
 class InventoryViewController(ViewController):
 
+    EVENT_SUBSCRIPTIONS = [EventSubscription([EventType.BEANS, EventType.INVENTORY])]
+
     def __init__(
         self,
         bot: commands.Bot,
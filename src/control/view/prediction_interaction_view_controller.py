@@ -17,11 +17,14 @@ from control.controller import Controller
 from control.event_manager import EventManager
 from control.logger import BotLogger
 from control.settings_manager import SettingsManager
+from control.types import EventSubscription
 from control.view.view_controller import ViewController
 
 
 class PredictionInteractionViewController(ViewController):
 
+    EVENT_SUBSCRIPTIONS = [EventSubscription([EventType.PREDICTION])]
+
     def __init__(
         self,
         bot: commands.Bot,
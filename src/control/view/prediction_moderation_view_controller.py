@@ -19,11 +19,14 @@ from view.shop.user_select_view import ShopUserSelectView  # noqa: F401
 
 from control.controller import Controller
 from control.logger import BotLogger
+from control.types import EventSubscription
 from control.view.view_controller import ViewController
 
 
 class PredictionModerationViewController(ViewController):
 
+    EVENT_SUBSCRIPTIONS = [EventSubscription([EventType.PREDICTION])]
+
     def __init__(
         self,
         bot: commands.Bot,
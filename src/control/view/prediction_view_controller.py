@@ -20,11 +20,14 @@ from control.controller import Controller
 from control.logger import BotLogger
 from control.prediction_manager import PredictionManager
 from control.settings_manager import SettingsManager
+from control.types import EventSubscription
 from control.view.view_controller import ViewController
 
 
 class PredictionViewController(ViewController):
 
+    EVENT_SUBSCRIPTIONS = [EventSubscription([EventType.PREDICTION, EventType.BEANS])]
+
     def __init__(
         self,
         bot: commands.Bot,
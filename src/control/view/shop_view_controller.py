@@ -7,6 +7,7 @@ from discord.ext import commands
 from control.controller import Controller
 from control.item_manager import ItemManager
 from control.logger import BotLogger
+from control.types import EventSubscription
 from control.view.view_controller import ViewController
 from datalayer.database import Database
 from events.beans_event import BeansEvent
@@ -40,6 +41,8 @@ class ShopInteraction:
 
 class ShopViewController(ViewController):
 
+    EVENT_SUBSCRIPTIONS = [EventSubscription([EventType.BEANS, EventType.INVENTORY])]
+
     def __init__(
         self,
         bot: commands.Bot,
@@ -0,0 +1,75 @@
+import bisect
+from dataclasses import dataclass, field
+
+from events.beans_event import BeansEvent
+from events.types import BeansEventType
+
+
+@dataclass
+class GuildBeansLedger:
+    guild_id: int
+    season_start: int
+    balances: dict[int, int] = field(default_factory=dict)
+    ranking_balances: dict[int, int] = field(default_factory=dict)
+    high_scores: dict[int, int] = field(default_factory=dict)
+    high_score_order: list[tuple[int, int]] = field(default_factory=list)
+
+    def set_high_scores(self, high_scores: dict[int, int]):
+        self.high_scores = high_scores
+        self.high_score_order = sorted(
+            (-score, member_id) for member_id, score in high_scores.items()
+        )
+
+    def update_high_score(self, member_id: int, score: int):
+        current = self.high_scores.get(member_id)
+        if current is not None:
+            if score <= current:
+                return
+            index = bisect.bisect_left(self.high_score_order, (-current, member_id))
+            del self.high_score_order[index]
+
+        self.high_scores[member_id] = score
+        bisect.insort(self.high_score_order, (-score, member_id))
+
+    def top_high_scores(self, limit: int) -> list[tuple[int, int]]:
+        return [
+            (member_id, -score) for score, member_id in self.high_score_order[:limit]
+        ]
+
+
+class BeansLedger:
+
+    RANKING_EXCLUDED_TYPES = [
+        BeansEventType.SHOP_PURCHASE,
+        BeansEventType.USER_TRANSFER,
+        BeansEventType.BALANCE_CHANGE,
+        BeansEventType.SHOP_BUYBACK,
+    ]
+
+    def __init__(self):
+        self.guilds: dict[int, GuildBeansLedger] = {}
+
+    def get(self, guild_id: int) -> GuildBeansLedger | None:
+        return self.guilds.get(guild_id)
+
+    def set(self, ledger: GuildBeansLedger):
+        self.guilds[ledger.guild_id] = ledger
+
+    def invalidate(self, guild_id: int):
+        self.guilds.pop(guild_id, None)
+
+    def apply(self, event: BeansEvent):
+        ledger = self.guilds.get(event.guild_id)
+        if ledger is None or event.get_timestamp() <= ledger.season_start:
+            return
+
+        member_id = event.member_id
+        ledger.balances[member_id] = ledger.balances.get(member_id, 0) + event.value
+
+        if event.beans_event_type in self.RANKING_EXCLUDED_TYPES:
+            return
+
+        ledger.ranking_balances[member_id] = (
+            ledger.ranking_balances.get(member_id, 0) + event.value
+        )
+        ledger.update_high_score(member_id, ledger.ranking_balances[member_id])
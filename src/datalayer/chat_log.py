@@ -9,10 +9,17 @@ class ChatMessage:
     USER_ROLE = "user"
     ASSISTANT_ROLE = "assistant"
 
-    def __init__(self, role: str, message: str, timestamp: datetime.datetime):
+    def __init__(
+        self,
+        role: str,
+        message: str,
+        timestamp: datetime.datetime,
+        token_count: int = 0,
+    ):
         self.role = role
         self.message = message
         self.timestamp = timestamp
+        self.token_count = token_count
 
 
 class ChatLog:
@@ -20,23 +27,36 @@ class ChatLog:
     ROLE_KEY = "role"
     CONTENT_KEY = "content"
 
+    ENCODING_MODEL = "gpt-4-turbo"
+    shared_encoding: tiktoken.Encoding | None = None
+
     def __init__(self, system_message: str):
         self.chat_log: list[ChatMessage] = []
         self.backstory = system_message
-        self.system_message = ChatMessage(
-            ChatMessage.SYSTEM_ROLE, system_message, datetime.datetime.now()
+        self.encoding = self.get_encoding()
+        self.system_message = self.__create_message(
+            ChatMessage.SYSTEM_ROLE, system_message
         )
-        self.encoding = tiktoken.encoding_for_model("gpt-4-turbo")
+        self.token_count = self.system_message.token_count
         self.summary = ""
 
-    def get_token_count(self) -> int:
-
-        total_tokens = len(self.encoding.encode(self.system_message.message))
-
-        for message in self.chat_log:
-            total_tokens += len(self.encoding.encode(message.message))
+    @classmethod
+    def get_encoding(cls) -> tiktoken.Encoding:
+        # loading the encoding is expensive, every chat log shares one
+        if cls.shared_encoding is None:
+            cls.shared_encoding = tiktoken.encoding_for_model(cls.ENCODING_MODEL)
+        return cls.shared_encoding
+
+    def __create_message(self, role: str, message: str) -> ChatMessage:
+        return ChatMessage(
+            role,
+            message,
+            datetime.datetime.now(),
+            len(self.encoding.encode(message)),
+        )
 
-        return total_tokens
+    def get_token_count(self) -> int:
+        return self.token_count
 
     def add_summary(self, message: str):
         self.summary += " " + message
@@ -47,19 +67,22 @@ class ChatLog:
             + self.summary
         )
 
-        self.system_message = ChatMessage(
-            ChatMessage.SYSTEM_ROLE, system_message, datetime.datetime.now()
+        self.token_count -= self.system_message.token_count
+        self.system_message = self.__create_message(
+            ChatMessage.SYSTEM_ROLE, system_message
         )
+        self.token_count += self.system_message.token_count
+
+    def __add_message(self, role: str, message: str):
+        chat_message = self.__create_message(role, message)
+        self.chat_log.append(chat_message)
+        self.token_count += chat_message.token_count
 
     def add_user_message(self, message: str):
-        self.chat_log.append(
-            ChatMessage(ChatMessage.USER_ROLE, message, datetime.datetime.now())
-        )
+        self.__add_message(ChatMessage.USER_ROLE, message)
 
     def add_assistant_message(self, message: str):
-        self.chat_log.append(
-            ChatMessage(ChatMessage.ASSISTANT_ROLE, message, datetime.datetime.now())
-        )
+        self.__add_message(ChatMessage.ASSISTANT_ROLE, message)
 
     def summarize(self, token_threshold: int) -> list[dict[str, str]]:
         system_message = (
@@ -74,7 +97,7 @@ class ChatLog:
 
         summary_messages = ""
 
-        total_tokens = len(self.encoding.encode(self.system_message.message))
+        total_tokens = self.system_message.token_count
 
         remaining_messages = []
 
@@ -85,7 +108,8 @@ class ChatLog:
             ):
                 remaining_messages.append(message)
                 continue
-            total_tokens += len(self.encoding.encode(message.message))
+            total_tokens += message.token_count
+            self.token_count -= message.token_count
             summary_messages += "<message>" + message.message + "</message>"
 
         self.chat_log = remaining_messages
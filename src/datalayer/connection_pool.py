@@ -0,0 +1,104 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+
+import aiosqlite
+
+
+class ConnectionPool:
+
+    DEFAULT_READERS = 4
+    TIMEOUT = 30
+    CACHED_STATEMENTS = 256
+
+    # negative cache_size is in KiB
+    CACHE_SIZE = -16000
+    MMAP_SIZE = 256 * 1024 * 1024
+
+    def __init__(
+        self,
+        db_file: str,
+        reader_count: int = DEFAULT_READERS,
+    ):
+        self.db_file = db_file
+        self.reader_count = max(1, reader_count)
+
+        self.writer_connection: aiosqlite.Connection | None = None
+        self.reader_connections: list[aiosqlite.Connection] = []
+        self.idle_readers: asyncio.Queue[aiosqlite.Connection] | None = None
+
+        self.write_lock = asyncio.Lock()
+        self.open_lock = asyncio.Lock()
+        self.is_open = False
+
+    async def __connect(self, read_only: bool = False) -> aiosqlite.Connection:
+        db = await aiosqlite.connect(
+            self.db_file,
+            timeout=self.TIMEOUT,
+            cached_statements=self.CACHED_STATEMENTS,
+        )
+        await db.execute(f"PRAGMA busy_timeout = {self.TIMEOUT * 1000};")
+        await db.execute("PRAGMA synchronous = NORMAL;")
+        await db.execute(f"PRAGMA cache_size = {self.CACHE_SIZE};")
+        await db.execute(f"PRAGMA mmap_size = {self.MMAP_SIZE};")
+        await db.execute("PRAGMA temp_store = MEMORY;")
+        if read_only:
+            await db.execute("PRAGMA query_only = ON;")
+        return db
+
+    async def open(self):
+        async with self.open_lock:
+            if self.is_open:
+                return
+
+            self.writer_connection = await self.__connect()
+            await self.writer_connection.execute("PRAGMA journal_mode = WAL;")
+            await self.writer_connection.commit()
+
+            self.idle_readers = asyncio.Queue()
+            for _ in range(self.reader_count):
+                reader = await self.__connect(read_only=True)
+                self.reader_connections.append(reader)
+                self.idle_readers.put_nowait(reader)
+
+            self.is_open = True
+
+    async def close(self):
+        async with self.open_lock:
+            if not self.is_open:
+                return
+
+            async with self.write_lock:
+                await self.writer_connection.close()
+                self.writer_connection = None
+
+            for reader in self.reader_connections:
+                await reader.close()
+            self.reader_connections = []
+            self.idle_readers = None
+
+            self.is_open = False
+
+    @contextlib.asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        if not self.is_open:
+            await self.open()
+
+        idle_readers = self.idle_readers
+        db = await idle_readers.get()
+        try:
+            yield db
+        finally:
+            idle_readers.put_nowait(db)
+
+    @contextlib.asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        if not self.is_open:
+            await self.open()
+
+        async with self.write_lock:
+            try:
+                yield self.writer_connection
+            except BaseException:
+                await self.writer_connection.rollback()
+                raise
@@ -1,6 +1,7 @@
 import contextlib
 import datetime
 import json
+from collections.abc import AsyncIterator
 from typing import Any
 
 import aiosqlite
@@ -39,12 +40,18 @@ from combat.skills.skills import *  # noqa: F403
 from combat.skills.types import SkillType
 from config import Config
 from control.logger import BotLogger
+from datalayer.beans_ledger import BeansLedger, GuildBeansLedger
+from datalayer.connection_pool import ConnectionPool
+from datalayer.event_journal import EventJournal
 from datalayer.garden import Plot, PlotModifiers, UserGarden
+from datalayer.gear_cache import GearCache
 from datalayer.jail import UserJail
 from datalayer.lootbox import LootBox
 from datalayer.prediction import Prediction
 from datalayer.prediction_stats import PredictionStats
 from datalayer.quote import Quote
+from datalayer.stats import UserStats
+from datalayer.stats_cache import UserStatsCache
 from datalayer.types import (
     PlantType,
     PredictionState,
@@ -74,6 +81,7 @@ from events.types import (
     EquipmentEventType,
     EventType,
     GardenEventType,
+    JailEventType,
     LootBoxEventType,
     PredictionEventType,
 )
@@ -729,6 +737,17 @@ class Database:
         PRIMARY KEY ({USER_SETTINGS_MEMBER_ID_COL}, {USER_SETTINGS_GUILD_ID_COL}, {USER_SETTINGS_SETTING_ID_COL})
     );"""
 
+    SCHEMA_MIGRATION_TABLE = "schemamigrations"
+    SCHEMA_MIGRATION_VERSION_COL = "scmi_version"
+    SCHEMA_MIGRATION_NAME_COL = "scmi_name"
+    SCHEMA_MIGRATION_TIMESTAMP_COL = "scmi_timestamp"
+    CREATE_SCHEMA_MIGRATION_TABLE = f"""
+    CREATE TABLE if not exists {SCHEMA_MIGRATION_TABLE} (
+        {SCHEMA_MIGRATION_VERSION_COL} INTEGER PRIMARY KEY,
+        {SCHEMA_MIGRATION_NAME_COL} TEXT,
+        {SCHEMA_MIGRATION_TIMESTAMP_COL} INTEGER
+    );"""
+
     PERMANENT_ITEMS = [
         ItemType.REACTION_SPAM,
         ItemType.LOTTERY_TICKET,
@@ -751,9 +770,21 @@ class Database:
         self.bot = bot
         self.logger = logger
         self.db_file = db_file
+        self.pool = ConnectionPool(self.db_file)
+        self.event_journal = EventJournal(self.__write_events)
+        self.beans_ledger = BeansLedger()
+        self.gear_cache = GearCache()
+        self.user_stats_cache = UserStatsCache()
+        self.season_ends: dict[int, dict[int, int]] | None = None
+        self.season_generation = 0
+        self.season_cache_saved_queries = 0
+
+    async def close(self):
+        await self.event_journal.flush()
+        await self.pool.close()
 
     async def create_tables(self):
-        async with aiosqlite.connect(self.db_file) as db:
+        async with self.pool.writer() as db:
             await db.execute(self.CREATE_SETTINGS_TABLE)
             await db.execute(self.CREATE_JAIL_TABLE)
             await db.execute(self.CREATE_EVENT_TABLE)
@@ -796,11 +827,14 @@ class Database:
             await db.execute(self.CREATE_STATUS_EFFECT_EVENT_TABLE)
             await db.execute(self.CREATE_EQUIPMENT_EVENT_TABLE)
             await db.execute(self.CREATE_USER_SETTINGS_TABLE)
+            await db.execute(self.CREATE_SCHEMA_MIGRATION_TABLE)
             await db.commit()
             self.logger.log(
                 "DB", f"Loaded DB version {aiosqlite.__version__} from {self.db_file}."
             )
 
+        await self.load_season_cache()
+
     async def __get_season_interval(self, guild_id: int, season_nr: int = None):
         start_timestamp = 0
         now = int(datetime.datetime.now().timestamp())
@@ -820,18 +854,33 @@ class Database:
 
         return start_timestamp, end_timestamp
 
-    async def __query_select(self, query: str, task=None):
-        async with aiosqlite.connect(self.db_file, timeout=30) as db:  # noqa: SIM117
-            async with db.execute(query, task) as cursor:
-                rows = await cursor.fetchall()
-                headings = [x[0] for x in cursor.description]
-                return self.__parse_rows(rows, headings)
+    async def __query_select(
+        self, query: str, task=None, db: aiosqlite.Connection | None = None
+    ):
+        if db is not None:
+            return await self.__fetch_rows(db, query, task)
+
+        async with self.pool.reader() as db:
+            return await self.__fetch_rows(db, query, task)
 
-    async def __query_insert(self, query: str, task=None) -> int:
-        async with aiosqlite.connect(self.db_file, timeout=30) as db:
+    async def __fetch_rows(self, db: aiosqlite.Connection, query: str, task=None):
+        async with db.execute(query, task) as cursor:
+            rows = await cursor.fetchall()
+            headings = [x[0] for x in cursor.description]
+            return self.__parse_rows(rows, headings)
+
+    async def __query_insert(
+        self, query: str, task=None, invalidate_gear: list[int] | None = None
+    ) -> int:
+        async with self.pool.writer() as db:
             cursor = await db.execute(query, task)
             insert_id = cursor.lastrowid
+            await cursor.close()
             await db.commit()
+            if invalidate_gear is not None:
+                # still holding the write lock, so no reader can cache the
+                # rows this write replaced
+                self.gear_cache.invalidate(invalidate_gear)
             return insert_id
 
     def __parse_rows(self, rows, headings):
@@ -866,6 +915,23 @@ class Database:
 
         return json.loads(rows[0][self.SETTINGS_VALUE_COL])
 
+    async def get_all_settings(self) -> dict[int, dict[tuple[str, str], Any]]:
+        command = f"""
+            SELECT * FROM {self.SETTINGS_TABLE};
+        """
+
+        rows = await self.__query_select(command)
+
+        settings = {}
+        for row in rows:
+            guild_id = row[self.SETTINGS_GUILD_ID_COL]
+            if guild_id not in settings:
+                settings[guild_id] = {}
+            key = (row[self.SETTINGS_MODULE_COL], row[self.SETTINGS_KEY_COL])
+            settings[guild_id][key] = json.loads(row[self.SETTINGS_VALUE_COL])
+
+        return settings
+
     async def update_setting(self, guild_id: int, module: str, key: str, value):
         value = json.dumps(value)
 
@@ -879,40 +945,9 @@ class Database:
 
         return await self.__query_insert(command, task)
 
-    async def __create_base_event(self, event: BotEvent) -> int:
-        command = f"""
-                INSERT INTO {self.EVENT_TABLE} (
-                {self.EVENT_TIMESTAMP_COL}, 
-                {self.EVENT_GUILD_ID_COL}, 
-                {self.EVENT_TYPE_COL}) 
-                VALUES (?, ?, ?);
-            """
-        task = (event.get_timestamp(), event.guild_id, event.type)
-
-        return await self.__query_insert(command, task)
-
-    async def __create_batch_base_event(self, event: BotEvent) -> int:
-        command = f"""
-                INSERT INTO {self.EVENT_TABLE} (
-                {self.EVENT_TIMESTAMP_COL}, 
-                {self.EVENT_GUILD_ID_COL}, 
-                {self.EVENT_TYPE_COL}) 
-                VALUES 
-            """
-        timestamp = event.get_timestamp()
-
-        for i in range(event.amount):
-            last = i + 1 == event.amount
-            end = "," if not last else ";"
-            command += (
-                f"({timestamp}, {event.guild_id}, '{event.base_type.value}'){end}"
-            )
-
-        return await self.__query_insert(command)
-
-    async def __create_interaction_event(
+    def __create_interaction_event(
         self, event_id: int, event: InteractionEvent
-    ) -> int:
+    ) -> tuple[str, list[tuple]]:
         command = f"""
             INSERT INTO {self.INTERACTION_EVENT_TABLE} (
             {self.INTERACTION_EVENT_ID_COL},
@@ -928,9 +963,11 @@ class Database:
             event.to_user_id,
         )
 
-        return await self.__query_insert(command, task)
+        return command, [task]
 
-    async def __create_timeout_event(self, event_id: int, event: TimeoutEvent) -> int:
+    def __create_timeout_event(
+        self, event_id: int, event: TimeoutEvent
+    ) -> tuple[str, list[tuple]]:
         command = f"""
             INSERT INTO {self.TIMEOUT_EVENT_TABLE} (
             {self.TIMEOUT_EVENT_ID_COL},
@@ -940,9 +977,11 @@ class Database:
         """
         task = (event_id, event.member_id, event.duration)
 
-        return await self.__query_insert(command, task)
+        return command, [task]
 
-    async def __create_spam_event(self, event_id: int, event: SpamEvent) -> int:
+    def __create_spam_event(
+        self, event_id: int, event: SpamEvent
+    ) -> tuple[str, list[tuple]]:
         command = f"""
             INSERT INTO {self.SPAM_EVENT_TABLE} (
             {self.SPAM_EVENT_ID_COL},
@@ -951,9 +990,11 @@ class Database:
         """
         task = (event_id, event.member_id)
 
-        return await self.__query_insert(command, task)
+        return command, [task]
 
-    async def __create_jail_event(self, event_id: int, event: JailEvent) -> int:
+    def __create_jail_event(
+        self, event_id: int, event: JailEvent
+    ) -> tuple[str, list[tuple]]:
         command = f"""
             INSERT INTO {self.JAIL_EVENT_TABLE} (
             {self.JAIL_EVENT_ID_COL},
@@ -971,9 +1012,11 @@ class Database:
             event.jail_id,
         )
 
-        return await self.__query_insert(command, task)
+        return command, [task]
 
-    async def __create_quote_event(self, event_id: int, event: QuoteEvent) -> int:
+    def __create_quote_event(
+        self, event_id: int, event: QuoteEvent
+    ) -> tuple[str, list[tuple]]:
         command = f"""
             INSERT INTO {self.QUOTE_EVENT_TABLE} (
             {self.QUOTE_EVENT_ID_COL},
@@ -982,9 +1025,11 @@ class Database:
         """
         task = (event_id, event.quote_id)
 
-        return await self.__query_insert(command, task)
+        return command, [task]
 
-    async def __create_beans_event(self, event_id: int, event: BeansEvent) -> int:
+    def __create_beans_event(
+        self, event_id: int, event: BeansEvent
+    ) -> tuple[str, list[tuple]]:
         command = f"""
             INSERT INTO {self.BEANS_EVENT_TABLE} (
             {self.BEANS_EVENT_ID_COL},
@@ -1000,11 +1045,11 @@ class Database:
             event.value,
         )
 
-        return await self.__query_insert(command, task)
+        return command, [task]
 
-    async def __create_inventory_event(
+    def __create_inventory_event(
         self, event_id: int, event: InventoryEvent
-    ) -> int:
+    ) -> tuple[str, list[tuple]]:
         command = f"""
             INSERT INTO {self.INVENTORY_EVENT_TABLE} (
             {self.INVENTORY_EVENT_ID_COL},
@@ -1020,31 +1065,31 @@ class Database:
             event.amount,
         )
 
-        return await self.__query_insert(command, task)
+        return command, [task]
 
-    async def __create_batch_inventory_event(
+    def __create_batch_inventory_event(
         self, event_id: int, event: InventoryBatchEvent
-    ) -> int:
+    ) -> tuple[str, list[tuple]]:
         command = f"""
             INSERT INTO {self.INVENTORY_EVENT_TABLE} (
             {self.INVENTORY_EVENT_ID_COL},
             {self.INVENTORY_EVENT_MEMBER_COL},
             {self.INVENTORY_EVENT_ITEM_TYPE_COL},
             {self.INVENTORY_EVENT_AMOUNT_COL})
-            VALUES 
-            """
+            VALUES (?, ?, ?, ?);
+        """
 
         event_id = event_id - event.amount + 1
-        for index, (amount, item) in enumerate(event.items):
-            last = index + 1 == len(event.items)
-            end = "," if not last else ";"
-            command += f"({event_id}, {event.member_id}, '{item.value}', {amount}){end}"
-
+        tasks = []
+        for amount, item in event.items:
+            tasks.append((event_id, event.member_id, item.value, amount))
             event_id += 1
 
-        return await self.__query_insert(command)
+        return command, tasks
 
-    async def __create_loot_box_event(self, event_id: int, event: LootBoxEvent) -> int:
+    def __create_loot_box_event(
+        self, event_id: int, event: LootBoxEvent
+    ) -> tuple[str, list[tuple]]:
         command = f"""
             INSERT INTO {self.LOOTBOX_EVENT_TABLE} (
             {self.LOOTBOX_EVENT_ID_COL},
@@ -1060,9 +1105,11 @@ class Database:
             event.loot_box_event_type,
         )
 
-        return await self.__query_insert(command, task)
+        return command, [task]
 
-    async def __create_bat_event(self, event_id: int, event: BatEvent) -> int:
+    def __create_bat_event(
+        self, event_id: int, event: BatEvent
+    ) -> tuple[str, list[tuple]]:
         command = f"""
             INSERT INTO {self.BAT_EVENT_TABLE} (
             {self.BAT_EVENT_ID_COL},
@@ -1073,11 +1120,11 @@ class Database:
         """
         task = (event_id, event.used_by_id, event.target_id, event.duration)
 
-        return await self.__query_insert(command, task)
+        return command, [task]
 
-    async def __create_prediction_event(
+    def __create_prediction_event(
         self, event_id: int, event: PredictionEvent
-    ) -> int:
+    ) -> tuple[str, list[tuple]]:
         command = f"""
             INSERT INTO {self.PREDICTION_EVENT_TABLE} (
             {self.PREDICTION_EVENT_ID_COL},
@@ -1097,9 +1144,11 @@ class Database:
             event.amount,
         )
 
-        return await self.__query_insert(command, task)
+        return command, [task]
 
-    async def __create_garden_event(self, event_id: int, event: GardenEvent) -> int:
+    def __create_garden_event(
+        self, event_id: int, event: GardenEvent
+    ) -> tuple[str, list[tuple]]:
         command = f"""
             INSERT INTO {self.GARDEN_EVENT_TABLE} (
             {self.GARDEN_EVENT_ID_COL},
@@ -1119,11 +1168,11 @@ class Database:
             event.payload,
         )
 
-        return await self.__query_insert(command, task)
+        return command, [task]
 
-    async def __create_encounter_event(
+    def __create_encounter_event(
         self, event_id: int, event: EncounterEvent
-    ) -> int:
+    ) -> tuple[str, list[tuple]]:
         command = f"""
             INSERT INTO {self.ENCOUNTER_EVENT_TABLE} (
             {self.ENCOUNTER_EVENT_ID_COL},
@@ -1139,9 +1188,11 @@ class Database:
             event.encounter_event_type,
         )
 
-        return await self.__query_insert(command, task)
+        return command, [task]
 
-    async def __create_combat_event(self, event_id: int, event: CombatEvent) -> int:
+    def __create_combat_event(
+        self, event_id: int, event: CombatEvent
+    ) -> tuple[str, list[tuple]]:
         command = f"""
             INSERT INTO {self.COMBAT_EVENT_TABLE} (
             {self.COMBAT_EVENT_ID_COL},
@@ -1167,9 +1218,11 @@ class Database:
             event.combat_event_type,
         )
 
-        return await self.__query_insert(command, task)
+        return command, [task]
 
-    async def __create_karma_event(self, event_id: int, event: KarmaEvent) -> int:
+    def __create_karma_event(
+        self, event_id: int, event: KarmaEvent
+    ) -> tuple[str, list[tuple]]:
         command = f"""
             INSERT INTO {self.KARMA_EVENT_TABLE} (
             {self.KARMA_EVENT_ID_COL},
@@ -1185,11 +1238,11 @@ class Database:
             event.amount,
         )
 
-        return await self.__query_insert(command, task)
+        return command, [task]
 
-    async def __create_status_effect_event(
+    def __create_status_effect_event(
         self, event_id: int, event: StatusEffectEvent
-    ) -> int:
+    ) -> tuple[str, list[tuple]]:
         command = f"""
             INSERT INTO {self.STATUS_EFFECT_EVENT_TABLE} (
             {self.STATUS_EFFECT_EVENT_ID_COL},
@@ -1211,11 +1264,11 @@ class Database:
             event.value,
         )
 
-        return await self.__query_insert(command, task)
+        return command, [task]
 
-    async def __create_equipment_event(
+    def __create_equipment_event(
         self, event_id: int, event: EquipmentEvent
-    ) -> int:
+    ) -> tuple[str, list[tuple]]:
         command = f"""
             INSERT INTO {self.EQUIPMENT_EVENT_TABLE} (
             {self.EQUIPMENT_EVENT_ID_COL},
@@ -1231,56 +1284,166 @@ class Database:
             event.item_id,
         )
 
-        return await self.__query_insert(command, task)
-
-    async def log_event(self, event: BotEvent) -> int:
-        if event.type == EventType.INVENTORYBATCH:
-            event_id = await self.__create_batch_base_event(event)
-        else:
-            event_id = await self.__create_base_event(event)
-
-        if event_id is None:
-            self.logger.error("DB", "Event creation error, id was NoneType")
-            return None
+        return command, [task]
 
+    def __get_event_insert(
+        self, event_id: int, event: BotEvent
+    ) -> tuple[str, list[tuple]] | None:
         match event.type:
             case EventType.INTERACTION:
-                await self.__create_interaction_event(event_id, event)
+                return self.__create_interaction_event(event_id, event)
             case EventType.JAIL:
-                await self.__create_jail_event(event_id, event)
+                return self.__create_jail_event(event_id, event)
             case EventType.TIMEOUT:
-                await self.__create_timeout_event(event_id, event)
+                return self.__create_timeout_event(event_id, event)
             case EventType.QUOTE:
-                await self.__create_quote_event(event_id, event)
+                return self.__create_quote_event(event_id, event)
             case EventType.SPAM:
-                await self.__create_spam_event(event_id, event)
+                return self.__create_spam_event(event_id, event)
             case EventType.BEANS:
-                await self.__create_beans_event(event_id, event)
+                return self.__create_beans_event(event_id, event)
             case EventType.INVENTORY:
-                await self.__create_inventory_event(event_id, event)
+                return self.__create_inventory_event(event_id, event)
             case EventType.INVENTORYBATCH:
-                await self.__create_batch_inventory_event(event_id, event)
+                return self.__create_batch_inventory_event(event_id, event)
             case EventType.LOOTBOX:
-                await self.__create_loot_box_event(event_id, event)
+                return self.__create_loot_box_event(event_id, event)
             case EventType.BAT:
-                await self.__create_bat_event(event_id, event)
+                return self.__create_bat_event(event_id, event)
             case EventType.PREDICTION:
-                await self.__create_prediction_event(event_id, event)
+                return self.__create_prediction_event(event_id, event)
             case EventType.GARDEN:
-                await self.__create_garden_event(event_id, event)
+                return self.__create_garden_event(event_id, event)
             case EventType.ENCOUNTER:
-                await self.__create_encounter_event(event_id, event)
+                return self.__create_encounter_event(event_id, event)
             case EventType.COMBAT:
-                await self.__create_combat_event(event_id, event)
+                return self.__create_combat_event(event_id, event)
             case EventType.STATUS_EFFECT:
-                await self.__create_status_effect_event(event_id, event)
+                return self.__create_status_effect_event(event_id, event)
             case EventType.KARMA:
-                await self.__create_karma_event(event_id, event)
+                return self.__create_karma_event(event_id, event)
             case EventType.EQUIPMENT:
-                await self.__create_equipment_event(event_id, event)
+                return self.__create_equipment_event(event_id, event)
+        return None
+
+    async def __write_events(self, events: list[BotEvent]) -> list[int]:
+        base_command = f"""
+            INSERT INTO {self.EVENT_TABLE} (
+            {self.EVENT_ID_COL},
+            {self.EVENT_TIMESTAMP_COL},
+            {self.EVENT_GUILD_ID_COL},
+            {self.EVENT_TYPE_COL})
+            VALUES (?, ?, ?, ?);
+        """
+        last_id_command = f"""
+            SELECT MAX(
+                COALESCE((SELECT seq FROM sqlite_sequence WHERE name = '{self.EVENT_TABLE}'), 0),
+                COALESCE((SELECT MAX({self.EVENT_ID_COL}) FROM {self.EVENT_TABLE}), 0)
+            );
+        """
+
+        async with self.pool.writer() as db:
+            async with db.execute(last_id_command) as cursor:
+                row = await cursor.fetchone()
+            next_id = row[0] + 1
+
+            base_tasks = []
+            event_tasks: dict[str, list[tuple]] = {}
+            event_ids = []
+
+            for event in events:
+                timestamp = event.get_timestamp()
+                event_type = event.type
+                row_count = 1
+                if event.type == EventType.INVENTORYBATCH:
+                    event_type = event.base_type
+                    row_count = max(1, event.amount)
+
+                for _ in range(row_count):
+                    base_tasks.append(
+                        (next_id, timestamp, event.guild_id, event_type.value)
+                    )
+                    next_id += 1
+
+                event_id = next_id - 1
+                event_ids.append(event_id)
+
+                event_insert = self.__get_event_insert(event_id, event)
+                if event_insert is None:
+                    continue
+                command, tasks = event_insert
+                event_tasks.setdefault(command, []).extend(tasks)
+
+            await db.executemany(base_command, base_tasks)
+            for command, tasks in event_tasks.items():
+                await db.executemany(command, tasks)
+            await db.commit()
+
+            for event in events:
+                if event.type == EventType.BEANS:
+                    self.beans_ledger.apply(event)
+
+            await self.__invalidate_user_stats(db, events)
+
+        return event_ids
+
+    async def __invalidate_user_stats(
+        self, db: aiosqlite.Connection, events: list[BotEvent]
+    ):
+        user_ids = set()
+        jail_ids = set()
+        for event in events:
+            match event.type:
+                case EventType.INTERACTION:
+                    user_ids.update([event.from_user_id, event.to_user_id])
+                case EventType.TIMEOUT | EventType.SPAM:
+                    user_ids.add(event.member_id)
+                case EventType.JAIL:
+                    user_ids.add(event.caused_by_id)
+                    jail_ids.add(event.jail_id)
+
+        if len(jail_ids) > 0 and len(self.user_stats_cache.stats) > 0:
+            command = f"""
+                SELECT {self.JAIL_MEMBER_COL} FROM {self.JAIL_TABLE}
+                WHERE {self.JAIL_ID_COL} IN ({",".join("?" * len(jail_ids))});
+            """
+            rows = await self.__query_select(command, tuple(jail_ids), db)
+            user_ids.update(row[self.JAIL_MEMBER_COL] for row in rows)
+
+        if len(user_ids) > 0:
+            self.user_stats_cache.invalidate(user_ids)
+
+    async def flush_events(self):
+        await self.event_journal.flush()
+
+    async def log_event(self, event: BotEvent) -> int:
+        event_id = await self.event_journal.submit(event)
+
+        if event_id is None:
+            self.logger.error("DB", "Event creation error, id was NoneType")
+            return None
 
         return event_id
 
+    async def get_last_event_id(self, db: aiosqlite.Connection | None = None) -> int:
+        command = f"""
+            SELECT COALESCE(MAX({self.EVENT_ID_COL}), 0) AS last_id
+            FROM {self.EVENT_TABLE};
+        """
+        rows = await self.__query_select(command, None, db)
+        return rows[0]["last_id"]
+
+    @contextlib.asynccontextmanager
+    async def read_snapshot(self) -> AsyncIterator[aiosqlite.Connection]:
+        # WAL keeps every query on this connection on the state of the first
+        # read, writers are never blocked
+        async with self.pool.reader() as db:
+            await db.execute("BEGIN;")
+            try:
+                yield db
+            finally:
+                await db.commit()
+
     async def log_quote(self, quote: Quote) -> int:
         command = f"""
             INSERT INTO {self.QUOTE_TABLE} (
@@ -1735,17 +1898,19 @@ class Database:
         """
         rows = await self.__query_select(command)
 
-        if rows and len(rows) < 1:
+        if not rows or len(rows) < 1:
             return None
 
-        return UserJail.from_db_row(rows)
+        return UserJail.from_db_row(rows[0])
 
-    async def get_jails_by_guild(self, guild_id: int) -> list[UserJail]:
+    async def get_jails_by_guild(
+        self, guild_id: int, db: aiosqlite.Connection | None = None
+    ) -> list[UserJail]:
         command = f"""
             SELECT * FROM {self.JAIL_TABLE} 
             WHERE {self.JAIL_GUILD_ID_COL} = {int(guild_id)};
         """
-        rows = await self.__query_select(command)
+        rows = await self.__query_select(command, None, db)
         if not rows:
             return []
         return [UserJail.from_db_row(row) for row in rows]
@@ -1779,7 +1944,11 @@ class Database:
         return [UserJail.from_db_row(row) for row in rows]
 
     async def get_jail_events_by_jail(
-        self, guild_id: int, jail_id: int, season: int = None
+        self,
+        guild_id: int,
+        jail_id: int,
+        season: int = None,
+        db: aiosqlite.Connection | None = None,
     ) -> list[JailEvent]:
         start_timestamp, end_timestamp = await self.__get_season_interval(
             guild_id, season
@@ -1792,7 +1961,7 @@ class Database:
             AND {self.EVENT_TIMESTAMP_COL} <= ?;
         """
         task = (jail_id, start_timestamp, end_timestamp)
-        rows = await self.__query_select(command, task)
+        rows = await self.__query_select(command, task, db)
         if not rows:
             return []
         return [JailEvent.from_db_row(row) for row in rows]
@@ -1835,12 +2004,14 @@ class Database:
         return [JailEvent.from_db_row(row) for row in rows]
 
     async def get_jail_events_by_guild(
-        self, guild_id: int, season: int = None
+        self, guild_id: int, season: int = None, db: aiosqlite.Connection | None = None
     ) -> dict[UserJail, list[JailEvent]]:
-        jails = await self.get_jails_by_guild(guild_id)
+        jails = await self.get_jails_by_guild(guild_id, db)
         output = {}
         for jail in jails:
-            output[jail] = await self.get_jail_events_by_jail(guild_id, jail.id, season)
+            output[jail] = await self.get_jail_events_by_jail(
+                guild_id, jail.id, season, db
+            )
 
         return output
 
@@ -1862,7 +2033,7 @@ class Database:
         return [TimeoutEvent.from_db_row(row) for row in rows]
 
     async def get_timeout_events_by_guild(
-        self, guild_id: int, season: int = None
+        self, guild_id: int, season: int = None, db: aiosqlite.Connection | None = None
     ) -> list[TimeoutEvent]:
         start_timestamp, end_timestamp = await self.__get_season_interval(
             guild_id, season
@@ -1875,7 +2046,7 @@ class Database:
             AND {self.EVENT_TIMESTAMP_COL} <= ?;
         """
         task = (guild_id, start_timestamp, end_timestamp)
-        rows = await self.__query_select(command, task)
+        rows = await self.__query_select(command, task, db)
         if not rows:
             return []
         return [TimeoutEvent.from_db_row(row) for row in rows]
@@ -1898,7 +2069,7 @@ class Database:
         return [SpamEvent.from_db_row(row) for row in rows]
 
     async def get_spam_events_by_guild(
-        self, guild_id: int, season: int = None
+        self, guild_id: int, season: int = None, db: aiosqlite.Connection | None = None
     ) -> list[SpamEvent]:
         start_timestamp, end_timestamp = await self.__get_season_interval(
             guild_id, season
@@ -1911,11 +2082,141 @@ class Database:
             AND {self.EVENT_TIMESTAMP_COL} <= ?;
         """
         task = (guild_id, start_timestamp, end_timestamp)
-        rows = await self.__query_select(command, task)
+        rows = await self.__query_select(command, task, db)
         if not rows:
             return []
         return [SpamEvent.from_db_row(row) for row in rows]
 
+    async def get_user_stats(self, user_id: int, season: int = None) -> UserStats:
+        if season is None:
+            user_stats = self.user_stats_cache.get(user_id)
+            if user_stats is not None:
+                return user_stats
+
+        generation = self.user_stats_cache.generation
+        start_timestamp, end_timestamp = await self.__get_season_interval(None, season)
+        jail_interactions = [
+            JailEventType.FART.value,
+            JailEventType.PET.value,
+            JailEventType.SLAP.value,
+        ]
+        in_jail_interactions = ",".join("?" * len(jail_interactions))
+
+        interaction_command = f"""
+            SELECT {self.INTERACTION_EVENT_TYPE_COL}, {self.INTERACTION_EVENT_FROM_COL}, {self.INTERACTION_EVENT_TO_COL}, COUNT(*) AS amount
+            FROM {self.INTERACTION_EVENT_TABLE}
+            INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.INTERACTION_EVENT_TABLE}.{self.INTERACTION_EVENT_ID_COL}
+            WHERE ({self.INTERACTION_EVENT_FROM_COL} = ? OR {self.INTERACTION_EVENT_TO_COL} = ?)
+            AND {self.EVENT_TIMESTAMP_COL} > ?
+            AND {self.EVENT_TIMESTAMP_COL} <= ?
+            GROUP BY {self.INTERACTION_EVENT_TYPE_COL}, {self.INTERACTION_EVENT_FROM_COL}, {self.INTERACTION_EVENT_TO_COL};
+        """
+        interaction_task = (user_id, user_id, start_timestamp, end_timestamp)
+
+        totals_command = f"""
+            SELECT * FROM (
+                SELECT COALESCE(SUM({self.JAIL_EVENT_DURATION_COL}), 0) AS jail_total,
+                COUNT(DISTINCT {self.JAIL_EVENT_JAILREFERENCE_COL}) AS jail_count,
+                COALESCE(SUM(CASE WHEN {self.JAIL_EVENT_TYPE_COL} IN ({in_jail_interactions}) AND {self.JAIL_EVENT_DURATION_COL} >= 0 THEN {self.JAIL_EVENT_DURATION_COL} ELSE 0 END), 0) AS added_to_self,
+                COALESCE(SUM(CASE WHEN {self.JAIL_EVENT_TYPE_COL} IN ({in_jail_interactions}) AND {self.JAIL_EVENT_DURATION_COL} < 0 THEN {self.JAIL_EVENT_DURATION_COL} ELSE 0 END), 0) AS reduced_from_self
+                FROM {self.JAIL_TABLE}
+                INNER JOIN {self.JAIL_EVENT_TABLE} ON {self.JAIL_TABLE}.{self.JAIL_ID_COL} = {self.JAIL_EVENT_TABLE}.{self.JAIL_EVENT_JAILREFERENCE_COL}
+                INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.JAIL_EVENT_TABLE}.{self.JAIL_EVENT_ID_COL}
+                WHERE {self.JAIL_TABLE}.{self.JAIL_MEMBER_COL} = ?
+                AND {self.EVENT_TIMESTAMP_COL} > ?
+                AND {self.EVENT_TIMESTAMP_COL} <= ?
+            ), (
+                SELECT COALESCE(SUM(CASE WHEN {self.JAIL_EVENT_TYPE_COL} IN ({in_jail_interactions}) AND {self.JAIL_EVENT_DURATION_COL} >= 0 THEN {self.JAIL_EVENT_DURATION_COL} ELSE 0 END), 0) AS added_to_others,
+                COALESCE(SUM(CASE WHEN {self.JAIL_EVENT_TYPE_COL} IN ({in_jail_interactions}) AND {self.JAIL_EVENT_DURATION_COL} < 0 THEN {self.JAIL_EVENT_DURATION_COL} ELSE 0 END), 0) AS reduced_from_others,
+                MAX(CASE WHEN {self.JAIL_EVENT_TYPE_COL} = ? THEN {self.JAIL_EVENT_DURATION_COL} END) AS max_fart,
+                MIN(CASE WHEN {self.JAIL_EVENT_TYPE_COL} = ? THEN {self.JAIL_EVENT_DURATION_COL} END) AS min_fart
+                FROM {self.JAIL_EVENT_TABLE}
+                INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.JAIL_EVENT_TABLE}.{self.JAIL_EVENT_ID_COL}
+                WHERE {self.JAIL_EVENT_BY_COL} = ?
+                AND {self.EVENT_TIMESTAMP_COL} > ?
+                AND {self.EVENT_TIMESTAMP_COL} <= ?
+            ), (
+                SELECT COALESCE(SUM({self.TIMEOUT_EVENT_DURATION_COL}), 0) AS timeout_total,
+                COUNT(*) AS timeout_count
+                FROM {self.TIMEOUT_EVENT_TABLE}
+                INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.TIMEOUT_EVENT_TABLE}.{self.TIMEOUT_EVENT_ID_COL}
+                WHERE {self.TIMEOUT_EVENT_MEMBER_COL} = ?
+                AND {self.EVENT_TIMESTAMP_COL} > ?
+                AND {self.EVENT_TIMESTAMP_COL} <= ?
+            ), (
+                SELECT COUNT(*) AS spam_count
+                FROM {self.SPAM_EVENT_TABLE}
+                INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.SPAM_EVENT_TABLE}.{self.SPAM_EVENT_ID_COL}
+                WHERE {self.SPAM_EVENT_MEMBER_COL} = ?
+                AND {self.EVENT_TIMESTAMP_COL} > ?
+                AND {self.EVENT_TIMESTAMP_COL} <= ?
+            );
+        """
+        interval = (user_id, start_timestamp, end_timestamp)
+        totals_task = (
+            *jail_interactions,
+            *jail_interactions,
+            *interval,
+            *jail_interactions,
+            *jail_interactions,
+            JailEventType.FART.value,
+            JailEventType.FART.value,
+            *interval,
+            *interval,
+            *interval,
+        )
+
+        async with self.pool.reader() as db:
+            interaction_rows = await self.__query_select(
+                interaction_command, interaction_task, db
+            )
+            totals = (await self.__query_select(totals_command, totals_task, db))[0]
+
+        user_stats = UserStats()
+        count_out = {interaction_type: 0 for interaction_type in UserInteraction}
+        count_in = {interaction_type: 0 for interaction_type in UserInteraction}
+        user_count_out = {}
+        user_count_in = {}
+
+        for row in interaction_rows:
+            interaction_type = UserInteraction(row[self.INTERACTION_EVENT_TYPE_COL])
+            amount = row["amount"]
+            if row[self.INTERACTION_EVENT_FROM_COL] == user_id:
+                member_id = row[self.INTERACTION_EVENT_TO_COL]
+                count_out[interaction_type] += amount
+                if member_id not in user_count_out:
+                    user_count_out[member_id] = {
+                        interaction_type: 0 for interaction_type in UserInteraction
+                    }
+                user_count_out[member_id][interaction_type] += amount
+            if row[self.INTERACTION_EVENT_TO_COL] == user_id:
+                member_id = row[self.INTERACTION_EVENT_FROM_COL]
+                count_in[interaction_type] += amount
+                if member_id not in user_count_in:
+                    user_count_in[member_id] = {
+                        interaction_type: 0 for interaction_type in UserInteraction
+                    }
+                user_count_in[member_id][interaction_type] += amount
+
+        user_stats.set_count_out(count_out)
+        user_stats.set_user_count_out(user_count_out)
+        user_stats.set_count_in(count_in)
+        user_stats.set_user_count_in(user_count_in)
+        user_stats.set_jail_total(totals["jail_total"])
+        user_stats.set_jail_amount(totals["jail_count"])
+        user_stats.set_total_added_others(totals["added_to_others"])
+        user_stats.set_total_added_self(totals["added_to_self"])
+        user_stats.set_total_reduced_from_others(abs(totals["reduced_from_others"]))
+        user_stats.set_total_reduced_from_self(abs(totals["reduced_from_self"]))
+        user_stats.set_fart_stats(totals["max_fart"], totals["min_fart"])
+        user_stats.set_timeout_total(totals["timeout_total"])
+        user_stats.set_timeout_amount(totals["timeout_count"])
+        user_stats.set_spam_score(totals["spam_count"])
+
+        if season is None:
+            self.user_stats_cache.put(user_id, user_stats, generation)
+        return user_stats
+
     async def get_interaction_events_by_user(
         self, user_id: int, season: int = None
     ) -> list[InteractionEvent]:
@@ -1955,6 +2256,7 @@ class Database:
         guild_id: int,
         interaction_type: UserInteraction,
         season: int = None,
+        db: aiosqlite.Connection | None = None,
     ) -> list[InteractionEvent]:
         start_timestamp, end_timestamp = await self.__get_season_interval(
             guild_id, season
@@ -1968,7 +2270,7 @@ class Database:
             AND {self.EVENT_TIMESTAMP_COL} <= ?;
         """
         task = (guild_id, interaction_type.value, start_timestamp, end_timestamp)
-        rows = await self.__query_select(command, task)
+        rows = await self.__query_select(command, task, db)
         if not rows:
             return []
         return [InteractionEvent.from_db_row(row) for row in rows]
@@ -2067,6 +2369,10 @@ class Database:
     async def get_member_beans(
         self, guild_id: int, user_id: int, season: int = None
     ) -> int:
+        if season is None:
+            ledger = await self.__get_beans_ledger(guild_id)
+            return ledger.balances.get(user_id, 0)
+
         start_timestamp, end_timestamp = await self.__get_season_interval(
             guild_id, season
         )
@@ -2089,9 +2395,22 @@ class Database:
     async def get_guild_beans(
         self, guild_id: int, season: int = None
     ) -> dict[int, int]:
+        if season is None:
+            ledger = await self.__get_beans_ledger(guild_id)
+            return dict(ledger.balances)
+
         start_timestamp, end_timestamp = await self.__get_season_interval(
             guild_id, season
         )
+        return await self.__select_guild_beans(guild_id, start_timestamp, end_timestamp)
+
+    async def __select_guild_beans(
+        self,
+        guild_id: int,
+        start_timestamp: int,
+        end_timestamp: int,
+        db: aiosqlite.Connection | None = None,
+    ) -> dict[int, int]:
         command = f"""
             SELECT {self.BEANS_EVENT_MEMBER_COL}, SUM({self.BEANS_EVENT_VALUE_COL}) FROM {self.BEANS_EVENT_TABLE} 
             INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.BEANS_EVENT_TABLE}.{self.BEANS_EVENT_ID_COL}
@@ -2101,7 +2420,7 @@ class Database:
             GROUP BY {self.BEANS_EVENT_MEMBER_COL};
         """
         task = (guild_id, start_timestamp, end_timestamp)
-        rows = await self.__query_select(command, task)
+        rows = await self.__query_select(command, task, db)
         if not rows or len(rows) < 1:
             return {}
 
@@ -2115,9 +2434,24 @@ class Database:
     async def get_guild_beans_rankings_current(
         self, guild_id: int, season: int = None
     ) -> dict[int, int]:
+        if season is None:
+            ledger = await self.__get_beans_ledger(guild_id)
+            return dict(ledger.ranking_balances)
+
         start_timestamp, end_timestamp = await self.__get_season_interval(
             guild_id, season
         )
+        return await self.__select_guild_beans_rankings_current(
+            guild_id, start_timestamp, end_timestamp
+        )
+
+    async def __select_guild_beans_rankings_current(
+        self,
+        guild_id: int,
+        start_timestamp: int,
+        end_timestamp: int,
+        db: aiosqlite.Connection | None = None,
+    ) -> dict[int, int]:
         command = f"""
             SELECT {self.BEANS_EVENT_MEMBER_COL}, SUM({self.BEANS_EVENT_VALUE_COL}) FROM {self.BEANS_EVENT_TABLE} 
             INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.BEANS_EVENT_TABLE}.{self.BEANS_EVENT_ID_COL}
@@ -2137,7 +2471,7 @@ class Database:
             end_timestamp,
         )
 
-        rows = await self.__query_select(command, task)
+        rows = await self.__query_select(command, task, db)
         if not rows or len(rows) < 1:
             return {}
 
@@ -2146,12 +2480,95 @@ class Database:
             for row in rows
         }
 
+    async def __get_beans_ledger(self, guild_id: int) -> GuildBeansLedger:
+        ledger = self.beans_ledger.get(guild_id)
+        if ledger is not None:
+            return ledger
+
+        # holding the writer keeps new beans events from slipping in
+        # between the aggregate query and the ledger becoming live
+        async with self.pool.writer() as db:
+            ledger = self.beans_ledger.get(guild_id)
+            if ledger is not None:
+                return ledger
+
+            start_timestamp, end_timestamp = await self.__get_season_interval(guild_id)
+            ledger = GuildBeansLedger(guild_id, start_timestamp)
+            ledger.balances = await self.__select_guild_beans(
+                guild_id, start_timestamp, end_timestamp, db
+            )
+            ledger.ranking_balances = await self.__select_guild_beans_rankings_current(
+                guild_id, start_timestamp, end_timestamp, db
+            )
+            ledger.set_high_scores(
+                await self.__select_guild_beans_rankings(
+                    guild_id, start_timestamp, end_timestamp, db
+                )
+            )
+            self.beans_ledger.set(ledger)
+
+        return ledger
+
+    async def rebuild_beans_ledger(self, guild_id: int) -> GuildBeansLedger:
+        self.beans_ledger.invalidate(guild_id)
+        return await self.__get_beans_ledger(guild_id)
+
+    async def verify_beans_ledger(self, guild_id: int) -> dict[int, tuple[int, int]]:
+        ledger = await self.__get_beans_ledger(guild_id)
+
+        async with self.pool.writer() as db:
+            start_timestamp, end_timestamp = await self.__get_season_interval(guild_id)
+            balances = await self.__select_guild_beans(
+                guild_id, start_timestamp, end_timestamp, db
+            )
+            ranking_balances = await self.__select_guild_beans_rankings_current(
+                guild_id, start_timestamp, end_timestamp, db
+            )
+            high_scores = await self.__select_guild_beans_rankings(
+                guild_id, start_timestamp, end_timestamp, db
+            )
+
+            mismatches = {}
+            for expected, cached in [
+                (balances, ledger.balances),
+                (ranking_balances, ledger.ranking_balances),
+                (high_scores, ledger.high_scores),
+            ]:
+                for member_id in set(expected) | set(cached):
+                    expected_value = expected.get(member_id, 0)
+                    cached_value = cached.get(member_id, 0)
+                    if expected_value != cached_value:
+                        mismatches[member_id] = (cached_value, expected_value)
+
+        return mismatches
+
     async def get_guild_beans_rankings(
         self, guild_id: int, season: int = None
     ) -> dict[int, int]:
+        if season is None:
+            ledger = await self.__get_beans_ledger(guild_id)
+            return dict(ledger.high_scores)
+
         start_timestamp, end_timestamp = await self.__get_season_interval(
             guild_id, season
         )
+        return await self.__select_guild_beans_rankings(
+            guild_id, start_timestamp, end_timestamp
+        )
+
+    async def get_guild_beans_rankings_top(
+        self, guild_id: int, limit: int
+    ) -> list[tuple[int, int]]:
+        ledger = await self.__get_beans_ledger(guild_id)
+        return ledger.top_high_scores(limit)
+
+    async def __select_guild_beans_rankings(
+        self,
+        guild_id: int,
+        start_timestamp: int,
+        end_timestamp: int,
+        db: aiosqlite.Connection | None = None,
+    ) -> dict[int, int]:
         command = f"""
             SELECT {self.BEANS_EVENT_MEMBER_COL}, MAX(rollingSum) as high_score 
             FROM (
@@ -2179,7 +2596,7 @@ class Database:
             end_timestamp,
         )
 
-        rows = await self.__query_select(command, task)
+        rows = await self.__query_select(command, task, db)
         if not rows or len(rows) < 1:
             return {}
 
@@ -2188,6 +2605,10 @@ class Database:
     async def get_member_beans_rankings(
         self, guild_id: int, member_id: int, season: int = None
     ) -> int:
+        if season is None:
+            ledger = await self.__get_beans_ledger(guild_id)
+            return ledger.high_scores.get(member_id, 0)
+
         start_timestamp, end_timestamp = await self.__get_season_interval(
             guild_id, season
         )
@@ -2814,6 +3235,7 @@ class Database:
         guild_id: int,
         event_types: list[BeansEventType],
         season: int = None,
+        db: aiosqlite.Connection | None = None,
     ) -> list[BeansEvent]:
         start_timestamp, end_timestamp = await self.__get_season_interval(
             guild_id, season
@@ -2831,7 +3253,7 @@ class Database:
         """
         task = (guild_id, start_timestamp, end_timestamp, *event_type_values)
 
-        rows = await self.__query_select(command, task)
+        rows = await self.__query_select(command, task, db)
         if not rows or len(rows) < 1:
             return {}
 
@@ -2887,30 +3309,94 @@ class Database:
         if not rows or len(rows) < 1:
             return []
 
-        plots: list[Plot] = []
+        plots = [
+            Plot(row[self.PLOT_ID], garden_id, row[self.PLOT_X], row[self.PLOT_Y])
+            for row in rows
+        ]
 
-        for row in rows:
-            plot = Plot(
-                row[self.PLOT_ID],
-                garden_id,
-                row[self.PLOT_X],
-                row[self.PLOT_Y],
-            )
-            plots.append(plot)
+        rows = await self.__select_relevant_garden_events(
+            self.GARDEN_ID, garden_id, start_timestamp, end_timestamp
+        )
+        if not rows or len(rows) < 1:
+            return plots
+
+        return self.__replay_garden_events(plots, rows)
 
+    async def __select_relevant_garden_events(
+        self,
+        scope_column: str,
+        scope_id: int,
+        start_timestamp: int,
+        end_timestamp: int,
+    ) -> list[dict[str, Any]]:
+        # only the rows __replay_garden_events looks at: per plot the latest
+        # plant, remove or harvest and everything after it, the latest yellow
+        # bean harvest and every flash bean plant or removal of the garden
+        plot = self.GARDEN_EVENT_PLOT_ID_COL
+        event_type = self.GARDEN_EVENT_TYPE_COL
+        payload = self.GARDEN_EVENT_PAYLOAD_COL
+        timestamp = self.EVENT_TIMESTAMP_COL
+        event_id = self.EVENT_ID_COL
         command = f"""
-            SELECT * FROM {self.GARDEN_EVENT_TABLE}
-            INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.GARDEN_EVENT_TABLE}.{self.GARDEN_EVENT_ID_COL}
-            WHERE {self.GARDEN_EVENT_GARDEN_ID_COL} = ?
-            AND {self.EVENT_TIMESTAMP_COL} > ?
-            AND {self.EVENT_TIMESTAMP_COL} <= ?
-            ORDER BY {self.EVENT_TIMESTAMP_COL} DESC;
+            WITH scoped AS (
+                SELECT {self.GARDEN_EVENT_TABLE}.*, {self.EVENT_TABLE}.* FROM {self.GARDEN_TABLE}
+                INNER JOIN {self.GARDEN_EVENT_TABLE} ON {self.GARDEN_EVENT_TABLE}.{self.GARDEN_EVENT_GARDEN_ID_COL} = {self.GARDEN_TABLE}.{self.GARDEN_ID}
+                INNER JOIN {self.EVENT_TABLE} ON {self.EVENT_TABLE}.{self.EVENT_ID_COL} = {self.GARDEN_EVENT_TABLE}.{self.GARDEN_EVENT_ID_COL}
+                WHERE {self.GARDEN_TABLE}.{scope_column} = ?
+                AND {timestamp} > ?
+                AND {timestamp} <= ?
+            ), cutoffs AS (
+                SELECT {plot} AS cutoff_plot, {timestamp} AS cutoff_timestamp, {event_id} AS cutoff_id
+                FROM (
+                    SELECT {plot}, {timestamp}, {event_id}, ROW_NUMBER()
+                    OVER (
+                        PARTITION BY {plot}
+                        ORDER BY {timestamp} DESC, {event_id} DESC
+                    ) AS position
+                    FROM scoped
+                    WHERE {event_type} IN (?, ?, ?)
+                )
+                WHERE position = 1
+            ), fertilized AS (
+                SELECT {event_id} AS fertilized_id
+                FROM (
+                    SELECT {event_id}, ROW_NUMBER()
+                    OVER (
+                        PARTITION BY {plot}
+                        ORDER BY {timestamp} DESC, {event_id} DESC
+                    ) AS position
+                    FROM scoped
+                    WHERE {event_type} = ? AND {payload} = ?
+                )
+                WHERE position = 1
+            )
+            SELECT scoped.* FROM scoped
+            LEFT JOIN cutoffs ON cutoff_plot = scoped.{plot}
+            WHERE cutoff_id IS NULL
+            OR ({timestamp}, {event_id}) >= (cutoff_timestamp, cutoff_id)
+            OR {event_id} IN (SELECT fertilized_id FROM fertilized)
+            OR ({event_type} IN (?, ?) AND {payload} = ?)
+            ORDER BY {timestamp} DESC, {event_id} DESC;
         """
-        task = (garden_id, start_timestamp, end_timestamp)
-        rows = await self.__query_select(command, task)
-        if not rows or len(rows) < 1:
-            return plots
+        task = (
+            scope_id,
+            start_timestamp,
+            end_timestamp,
+            GardenEventType.PLANT.value,
+            GardenEventType.REMOVE.value,
+            GardenEventType.HARVEST.value,
+            GardenEventType.HARVEST.value,
+            PlantType.YELLOW_BEAN.value,
+            GardenEventType.PLANT.value,
+            GardenEventType.REMOVE.value,
+            PlantType.FLASH_BEAN.value,
+        )
+        return await self.__query_select(command, task)
 
+    def __replay_garden_events(
+        self, plots: list[Plot], rows: list[dict[str, Any]]
+    ) -> list[Plot]:
+        # rows are the garden's events, newest first
         plot_plants = {}
         plot_water_events = {}
         plot_last_fertilized = {}
@@ -3029,28 +3515,57 @@ class Database:
     async def get_guild_gardens(
         self, guild_id: int, season: int = None
     ) -> list[UserGarden]:
+        start_timestamp, end_timestamp = await self.__get_season_interval(
+            guild_id, season
+        )
 
         command = f"""
             SELECT * FROM {self.GARDEN_TABLE}
             WHERE {self.GARDEN_GUILD_ID} = {int(guild_id)};
         """
-        rows = await self.__query_select(command)
-        if not rows or len(rows) < 1:
+        garden_rows = await self.__query_select(command)
+        if not garden_rows or len(garden_rows) < 1:
             return []
 
-        gardens = []
+        command = f"""
+            SELECT {self.PLOT_TABLE}.* FROM {self.GARDEN_TABLE}
+            INNER JOIN {self.PLOT_TABLE} ON {self.PLOT_TABLE}.{self.PLOT_GARDEN_ID} = {self.GARDEN_TABLE}.{self.GARDEN_ID}
+            WHERE {self.GARDEN_GUILD_ID} = ?
+            AND {self.PLOT_CREATE_TIMESTAMP} > ?
+            AND {self.PLOT_CREATE_TIMESTAMP} <= ?;
+        """
+        task = (guild_id, start_timestamp, end_timestamp)
+        plot_rows = await self.__query_select(command, task)
 
-        for row in rows:
-            garden_id = row[self.GARDEN_ID]
-            user_id = row[self.GARDEN_USER_ID]
+        garden_plots: dict[int, list[Plot]] = {}
+        for row in plot_rows:
+            garden_id = row[self.PLOT_GARDEN_ID]
+            garden_plots.setdefault(garden_id, []).append(
+                Plot(row[self.PLOT_ID], garden_id, row[self.PLOT_X], row[self.PLOT_Y])
+            )
 
-            plots = await self.get_garden_plots(guild_id, garden_id, season)
+        event_rows = await self.__select_relevant_garden_events(
+            self.GARDEN_GUILD_ID, guild_id, start_timestamp, end_timestamp
+        )
+
+        garden_events: dict[int, list[dict[str, Any]]] = {}
+        for row in event_rows:
+            garden_events.setdefault(row[self.GARDEN_EVENT_GARDEN_ID_COL], []).append(
+                row
+            )
+
+        gardens = []
+        for row in garden_rows:
+            garden_id = row[self.GARDEN_ID]
+            plots = garden_plots.get(garden_id, [])
+            if len(plots) > 0 and garden_id in garden_events:
+                plots = self.__replay_garden_events(plots, garden_events[garden_id])
 
             gardens.append(
                 UserGarden(
                     garden_id,
                     guild_id,
-                    user_id,
+                    row[self.GARDEN_USER_ID],
                     plots,
                     {},
                 )
@@ -3059,15 +3574,6 @@ class Database:
         return gardens
 
     async def get_guild_level(self, guild_id: int) -> int:
-        command = f"""
-            INSERT OR IGNORE INTO {self.GUILD_CURRENT_SEASON_TABLE}
-            ({self.GUILD_CURRENT_SEASON_GUILD_ID_COL}, {self.GUILD_CURRENT_SEASON_GUILD_LEVEL_COL}) 
-            VALUES(?, ?);
-        """
-        task = (guild_id, 1)
-
-        await self.__query_insert(command, task)
-
         command = f""" 
             SELECT * FROM {self.GUILD_CURRENT_SEASON_TABLE} 
             WHERE {self.GUILD_CURRENT_SEASON_GUILD_ID_COL} = {int(guild_id)}
@@ -3075,6 +3581,14 @@ class Database:
         """
         rows = await self.__query_select(command)
         if not rows:
+            command = f"""
+                INSERT OR IGNORE INTO {self.GUILD_CURRENT_SEASON_TABLE}
+                ({self.GUILD_CURRENT_SEASON_GUILD_ID_COL}, {self.GUILD_CURRENT_SEASON_GUILD_LEVEL_COL}) 
+                VALUES(?, ?);
+            """
+            task = (guild_id, 1)
+
+            await self.__query_insert(command, task)
             return 1
 
         return int(rows[0][self.GUILD_CURRENT_SEASON_GUILD_LEVEL_COL])
@@ -3523,7 +4037,7 @@ class Database:
                 modifier.value,
                 value,
             )
-            await self.__query_insert(command, task)
+            await self.__query_insert(command, task, invalidate_gear=[gear_id])
 
     async def delete_user_gear_modifiers(self, gear_id: int):
         command = f"""
@@ -3531,7 +4045,7 @@ class Database:
             WHERE {self.USER_GEAR_MODIFIER_GEAR_ID_COL} = {int(gear_id)}
         """
 
-        return await self.__query_insert(command)
+        return await self.__query_insert(command, invalidate_gear=[gear_id])
 
     async def log_user_gear_skills(self, gear_id: int, gear: Gear):
         command = f"""
@@ -3546,7 +4060,7 @@ class Database:
                 gear_id,
                 skill_type.value,
             )
-            await self.__query_insert(command, task)
+            await self.__query_insert(command, task, invalidate_gear=[gear_id])
 
     async def log_user_drop(
         self,
@@ -3595,6 +4109,11 @@ class Database:
         if skill_id is None:
             return None
 
+        skill = self.gear_cache.get(skill_id, Skill)
+        if skill is not None:
+            return skill
+
+        generation = self.gear_cache.generation
         command = f""" 
             SELECT * FROM {self.USER_GEAR_TABLE} 
             WHERE {self.USER_GEAR_ID_COL} = {int(skill_id)}
@@ -3604,13 +4123,18 @@ class Database:
         if not rows:
             return None
 
-        id = rows[0][self.USER_GEAR_ID_COL]
-        skill_type = SkillType(rows[0][self.USER_GEAR_TYPE_COL])
+        skill = self.__get_skill_from_row(rows[0])
+        self.gear_cache.put(skill, generation)
+        return skill
+
+    def __get_skill_from_row(self, row: dict[str, Any]) -> Skill:
+        id = row[self.USER_GEAR_ID_COL]
+        skill_type = SkillType(row[self.USER_GEAR_TYPE_COL])
         base_class = globals()[skill_type]
         base_skill: BaseSkill = base_class()  # noqa: F405
-        rarity = Rarity(rows[0][self.USER_GEAR_RARITY_COL])
-        level = rows[0][self.USER_GEAR_LEVEL_COL]
-        locked = int(rows[0][self.USER_GEAR_IS_LOCKED_COL]) == 1
+        rarity = Rarity(row[self.USER_GEAR_RARITY_COL])
+        level = row[self.USER_GEAR_LEVEL_COL]
+        locked = int(row[self.USER_GEAR_IS_LOCKED_COL]) == 1
 
         return Skill(
             base_skill=base_skill,
@@ -3626,24 +4150,51 @@ class Database:
         if enchantment_id is None:
             return None
 
+        enchantments = await self.get_enchantments_by_ids([enchantment_id])
+        return enchantments.get(enchantment_id)
+
+    async def get_enchantments_by_ids(
+        self, enchantment_ids: list[int | None]
+    ) -> dict[int, Enchantment | EffectEnchantment]:
+        enchantment_ids = list(
+            dict.fromkeys(id for id in enchantment_ids if id is not None)
+        )
+        if len(enchantment_ids) <= 0:
+            return {}
+
+        enchantments, missing = self.gear_cache.get_many(enchantment_ids, Enchantment)
+        if len(missing) <= 0:
+            return enchantments
+
+        generation = self.gear_cache.generation
         command = f""" 
             SELECT * FROM {self.USER_GEAR_TABLE} 
-            WHERE {self.USER_GEAR_ID_COL} = {int(enchantment_id)}
+            WHERE {self.USER_GEAR_ID_COL} IN {self.__list_sanitizer(missing)}
             ;
         """
-        rows = await self.__query_select(command)
+        rows = await self.__query_select(command, missing)
         if not rows:
-            return None
+            rows = []
 
-        id = rows[0][self.USER_GEAR_ID_COL]
-        enchantment_type = EnchantmentType(rows[0][self.USER_GEAR_TYPE_COL])
+        for row in rows:
+            enchantment = self.__get_enchantment_from_row(row)
+            self.gear_cache.put(enchantment, generation)
+            enchantments[enchantment.id] = enchantment
+
+        return {id: enchantments[id] for id in enchantment_ids if id in enchantments}
+
+    def __get_enchantment_from_row(
+        self, row: dict[str, Any]
+    ) -> Enchantment | EffectEnchantment:
+        id = row[self.USER_GEAR_ID_COL]
+        enchantment_type = EnchantmentType(row[self.USER_GEAR_TYPE_COL])
         base_class = globals()[enchantment_type]
         base_enchantment: BaseEnchantment = base_class()  # noqa: F405
-        rarity = Rarity(rows[0][self.USER_GEAR_RARITY_COL])
-        level = rows[0][self.USER_GEAR_LEVEL_COL]
-        locked = int(rows[0][self.USER_GEAR_IS_LOCKED_COL]) == 1
+        rarity = Rarity(row[self.USER_GEAR_RARITY_COL])
+        level = row[self.USER_GEAR_LEVEL_COL]
+        locked = int(row[self.USER_GEAR_IS_LOCKED_COL]) == 1
 
-        special = rows[0][self.USER_GEAR_SPECIAL_VALUE_COL]
+        special = row[self.USER_GEAR_SPECIAL_VALUE_COL]
 
         if base_enchantment.enchantment_effect == EnchantmentEffect.EFFECT:
             if special is not None:
@@ -3674,7 +4225,7 @@ class Database:
             WHERE {self.USER_GEAR_ENCHANTMENTS_GEAR_ID_COL} = {int(gear_id)}
         """
 
-        return await self.__query_insert(command)
+        return await self.__query_insert(command, invalidate_gear=[gear_id])
 
     async def log_user_gear_enchantment(
         self, gear: Gear, enchantments: list[Enchantment]
@@ -3694,7 +4245,7 @@ class Database:
                 gear.id,
                 enchantment.id,
             )
-            await self.__query_insert(command, task)
+            await self.__query_insert(command, task, invalidate_gear=[gear.id])
 
         return await self.get_gear_by_id(gear.id)
 
@@ -3702,19 +4253,55 @@ class Database:
         if gear_id is None:
             return None
 
+        gear = await self.get_gear_by_ids([gear_id])
+        return gear.get(gear_id)
+
+    async def get_gear_by_ids(self, gear_ids: list[int | None]) -> dict[int, Gear]:
+        gear_ids = list(dict.fromkeys(id for id in gear_ids if id is not None))
+        if len(gear_ids) <= 0:
+            return {}
+
+        gear, missing = self.gear_cache.get_many(gear_ids, Gear)
+        if len(missing) <= 0:
+            return gear
+
+        generation = self.gear_cache.generation
         command = f""" 
             SELECT * FROM {self.USER_GEAR_TABLE} 
             LEFT JOIN {self.USER_GEAR_MODIFIER_TABLE} ON {self.USER_GEAR_MODIFIER_GEAR_ID_COL} = {self.USER_GEAR_ID_COL}
             LEFT JOIN {self.USER_GEAR_SKILL_TABLE} ON {self.USER_GEAR_SKILL_GEAR_ID_COL} = {self.USER_GEAR_ID_COL}
             LEFT JOIN {self.USER_GEAR_ENCHANTMENTS_TABLE} ON {self.USER_GEAR_ENCHANTMENTS_GEAR_ID_COL} = {self.USER_GEAR_ID_COL}
-            WHERE {self.USER_GEAR_ID_COL} = {int(gear_id)}
+            WHERE {self.USER_GEAR_ID_COL} IN {self.__list_sanitizer(missing)}
             AND {self.USER_GEAR_IS_SCRAPPED_COL} = 0
             ;
         """
-        rows = await self.__query_select(command)
+        rows = await self.__query_select(command, missing)
         if not rows:
-            return None
+            rows = []
+
+        enchantments = await self.get_enchantments_by_ids(
+            [row[self.USER_GEAR_ENCHANTMENTS_ID_COL] for row in rows]
+        )
+
+        gear_rows: dict[int, list[dict[str, Any]]] = {}
+        for row in rows:
+            id = row[self.USER_GEAR_ID_COL]
+            if id not in gear_rows:
+                gear_rows[id] = [row]
+            else:
+                gear_rows[id].append(row)
+
+        for id, rows in gear_rows.items():
+            gear[id] = self.__get_gear_from_rows(rows, enchantments)
+            self.gear_cache.put(gear[id], generation)
+
+        return {id: gear[id] for id in gear_ids if id in gear}
 
+    def __get_gear_from_rows(
+        self,
+        rows: list[dict[str, Any]],
+        enchantments: dict[int, Enchantment | EffectEnchantment],
+    ) -> Gear:
         id = rows[0][self.USER_GEAR_ID_COL]
         name = rows[0][self.USER_GEAR_NAME_COL]
         gear_base_type = GearBaseType(rows[0][self.USER_GEAR_TYPE_COL])
@@ -3725,7 +4312,7 @@ class Database:
         locked = int(rows[0][self.USER_GEAR_IS_LOCKED_COL]) == 1
 
         modifiers = {}
-        enchantments = {}
+        gear_enchantments = {}
         skills = []
 
         for row in rows:
@@ -3742,10 +4329,8 @@ class Database:
                     modifiers[modifier_type] = row[self.USER_GEAR_MODIFIER_VALUE_COL]
 
             enchantment_id = row[self.USER_GEAR_ENCHANTMENTS_ID_COL]
-            if enchantment_id is not None and enchantment_id not in enchantments:
-                enchantment = await self.get_enchantment_by_id(enchantment_id)
-                enchantment = await self.get_enchantment_by_id(enchantment_id)
-                enchantments[enchantment_id] = enchantment
+            if enchantment_id is not None and enchantment_id not in gear_enchantments:
+                gear_enchantments[enchantment_id] = enchantments.get(enchantment_id)
 
         return Gear(
             name=name,
@@ -3754,7 +4339,7 @@ class Database:
             level=level,
             modifiers=modifiers,
             skills=skills,
-            enchantments=list(enchantments.values()),
+            enchantments=list(gear_enchantments.values()),
             locked=locked,
             id=id,
         )
@@ -3771,7 +4356,7 @@ class Database:
             WHERE {self.USER_GEAR_ID_COL} IN {list_sanitized};
         """
         task = gear_ids
-        await self.__query_insert(command, task)
+        await self.__query_insert(command, task, invalidate_gear=gear_ids)
 
     async def update_lock_gear_by_id(self, gear_id: int | None, lock: bool):
 
@@ -3786,7 +4371,7 @@ class Database:
         """
         task = (lock_value, gear_id)
 
-        await self.__query_insert(command, task)
+        await self.__query_insert(command, task, invalidate_gear=[gear_id])
 
     async def update_gear_rarity(self, gear_id: int, rarity: Rarity):
         if gear_id is None:
@@ -3798,7 +4383,7 @@ class Database:
         """
         task = (rarity.value, gear_id)
 
-        await self.__query_insert(command, task)
+        await self.__query_insert(command, task, invalidate_gear=[gear_id])
 
     async def create_user_equipment(self, guild_id: int, user_id: int) -> int:
         command = f"""
@@ -3918,12 +4503,14 @@ class Database:
                     gear = DefaultPants()
                 equipped.append(gear)
             case EquipmentSlot.ACCESSORY:
-                gear_1 = await self.get_gear_by_id(
-                    row[self.USER_EQUIPMENT_ACCESSORY_1_ID_COL]
-                )
-                gear_2 = await self.get_gear_by_id(
-                    row[self.USER_EQUIPMENT_ACCESSORY_2_ID_COL]
+                accessories = await self.get_gear_by_ids(
+                    [
+                        row[self.USER_EQUIPMENT_ACCESSORY_1_ID_COL],
+                        row[self.USER_EQUIPMENT_ACCESSORY_2_ID_COL],
+                    ]
                 )
+                gear_1 = accessories.get(row[self.USER_EQUIPMENT_ACCESSORY_1_ID_COL])
+                gear_2 = accessories.get(row[self.USER_EQUIPMENT_ACCESSORY_2_ID_COL])
                 if gear_1 is not None:
                     equipped.append(gear_1)
                 else:
@@ -3954,6 +4541,17 @@ class Database:
             return None
         row = rows[0]
 
+        gear = await self.get_gear_by_ids(
+            [
+                row[self.USER_EQUIPMENT_WEAPON_ID_COL],
+                row[self.USER_EQUIPMENT_HEADGEAR_ID_COL],
+                row[self.USER_EQUIPMENT_BODYGEAR_ID_COL],
+                row[self.USER_EQUIPMENT_LEGGEAR_ID_COL],
+                row[self.USER_EQUIPMENT_ACCESSORY_1_ID_COL],
+                row[self.USER_EQUIPMENT_ACCESSORY_2_ID_COL],
+            ]
+        )
+
         weapon = None
         weapon_id = row[self.USER_EQUIPMENT_WEAPON_ID_COL]
         if weapon_id is not None and weapon_id < 0:
@@ -3964,17 +4562,13 @@ class Database:
                     weapon = DefaultWand()
 
         if weapon is None:
-            weapon = await self.get_gear_by_id(weapon_id)
+            weapon = gear.get(weapon_id)
 
-        head_gear = await self.get_gear_by_id(row[self.USER_EQUIPMENT_HEADGEAR_ID_COL])
-        body_gear = await self.get_gear_by_id(row[self.USER_EQUIPMENT_BODYGEAR_ID_COL])
-        leg_gear = await self.get_gear_by_id(row[self.USER_EQUIPMENT_LEGGEAR_ID_COL])
-        accessory_1 = await self.get_gear_by_id(
-            row[self.USER_EQUIPMENT_ACCESSORY_1_ID_COL]
-        )
-        accessory_2 = await self.get_gear_by_id(
-            row[self.USER_EQUIPMENT_ACCESSORY_2_ID_COL]
-        )
+        head_gear = gear.get(row[self.USER_EQUIPMENT_HEADGEAR_ID_COL])
+        body_gear = gear.get(row[self.USER_EQUIPMENT_BODYGEAR_ID_COL])
+        leg_gear = gear.get(row[self.USER_EQUIPMENT_LEGGEAR_ID_COL])
+        accessory_1 = gear.get(row[self.USER_EQUIPMENT_ACCESSORY_1_ID_COL])
+        accessory_2 = gear.get(row[self.USER_EQUIPMENT_ACCESSORY_2_ID_COL])
 
         level = await self.get_guild_level(guild_id)
 
@@ -4048,17 +4642,20 @@ class Database:
         equipped_gear = await self.get_user_equipment(guild_id, member_id)
         equipped_ids = [gear.id for gear in equipped_gear.gear]
 
-        equipment = []
-        for row in rows:
-            id = row[self.USER_GEAR_ID_COL]
-            if id in equipped_ids:
-                continue
-            match type:
-                case Base.GEAR:
-                    item = await self.get_gear_by_id(id)
-                case Base.SKILL:
-                    item = await self.get_skill_by_id(id)
-            equipment.append(item)
+        rows = [row for row in rows if row[self.USER_GEAR_ID_COL] not in equipped_ids]
+
+        match type:
+            case Base.GEAR:
+                gear = await self.get_gear_by_ids(
+                    [row[self.USER_GEAR_ID_COL] for row in rows]
+                )
+                equipment = [
+                    gear[row[self.USER_GEAR_ID_COL]]
+                    for row in rows
+                    if row[self.USER_GEAR_ID_COL] in gear
+                ]
+            case Base.SKILL:
+                equipment = [self.__get_skill_from_row(row) for row in rows]
 
         return equipment
 
@@ -4078,12 +4675,7 @@ class Database:
         rows = await self.__query_select(command, task)
         if not rows:
             return []
-        enchantments = []
-        for row in rows:
-            enchantment = await self.get_enchantment_by_id(row[self.USER_GEAR_ID_COL])
-            enchantments.append(enchantment)
-
-        return enchantments
+        return [self.__get_enchantment_from_row(row) for row in rows]
 
     async def get_user_skill_inventory(
         self, guild_id: int, member_id: int
@@ -4102,14 +4694,11 @@ class Database:
         rows = await self.__query_select(command, task)
         if not rows:
             return []
-        skills = []
-        for row in rows:
-            if row[self.USER_EQUIPPED_SKILLS_SKILL_ID_COL] is not None:
-                continue
-            gear_piece = await self.get_skill_by_id(row[self.USER_GEAR_ID_COL])
-            skills.append(gear_piece)
-
-        return skills
+        return [
+            self.__get_skill_from_row(row)
+            for row in rows
+            if row[self.USER_EQUIPPED_SKILLS_SKILL_ID_COL] is None
+        ]
 
     async def get_user_armory(self, guild_id: int, member_id: int) -> list[Gear]:
 
@@ -4125,12 +4714,11 @@ class Database:
         rows = await self.__query_select(command, task)
         if not rows:
             return []
-        armory = []
-        for row in rows:
-            gear_piece = await self.get_gear_by_id(row[self.USER_GEAR_ID_COL])
-            armory.append(gear_piece)
 
-        return armory
+        armory = await self.get_gear_by_ids(
+            [row[self.USER_GEAR_ID_COL] for row in rows]
+        )
+        return list(armory.values())
 
     async def get_user_armory_proxy(
         self, guild_id: int, member_id: int
@@ -4419,7 +5007,11 @@ class Database:
         return [KarmaEvent.from_db_row(row) for row in rows]
 
     async def get_karma_events_by_guild(
-        self, guild_id: int, season: int = None, positive: bool = None
+        self,
+        guild_id: int,
+        season: int = None,
+        positive: bool = None,
+        db: aiosqlite.Connection | None = None,
     ) -> list[KarmaEvent]:
         start_timestamp, end_timestamp = await self.__get_season_interval(
             guild_id, season
@@ -4441,7 +5033,7 @@ class Database:
             AND {self.EVENT_TIMESTAMP_COL} <= ?;
         """
         task = (guild_id, start_timestamp, end_timestamp)
-        rows = await self.__query_select(command, task)
+        rows = await self.__query_select(command, task, db)
         if not rows:
             return []
         return [KarmaEvent.from_db_row(row) for row in rows]
@@ -4545,61 +5137,69 @@ class Database:
 
         return rows[0][self.USER_SETTINGS_VALUE_COL]
 
+    async def load_season_cache(self) -> dict[int, dict[int, int]]:
+        command = f"""
+            SELECT * FROM {self.GUILD_SEASON_TABLE};
+        """
+
+        while True:
+            generation = self.season_generation
+            rows = await self.__query_select(command)
+
+            season_ends = {}
+            for row in rows:
+                guild_id = row[self.GUILD_SEASON_GUILD_ID_COL]
+                season_nr = row[self.GUILD_SEASON_SEASON_NR_COL]
+                if guild_id not in season_ends:
+                    season_ends[guild_id] = {}
+                season_ends[guild_id][season_nr] = row[
+                    self.GUILD_SEASON_END_TIMESTAMP_COL
+                ]
+
+            # a season ended while loading, these rows may be missing it
+            if generation == self.season_generation:
+                self.season_ends = season_ends
+                return season_ends
+
+    async def __get_season_ends(self, guild_id: int) -> dict[int, int]:
+        season_ends = self.season_ends
+        if season_ends is None:
+            season_ends = await self.load_season_cache()
+        else:
+            self.season_cache_saved_queries += 1
+
+        return season_ends.get(guild_id, {})
+
     async def get_guild_current_season_number(
         self,
         guild_id: int,
     ) -> int:
-        command = f"""
-            SELECT * FROM {self.GUILD_SEASON_TABLE} 
-            WHERE {self.GUILD_SEASON_GUILD_ID_COL} = {int(guild_id)}
-            ORDER BY {self.GUILD_SEASON_SEASON_NR_COL} DESC
-            LIMIT 1;
-        """
+        season_ends = await self.__get_season_ends(guild_id)
 
-        rows = await self.__query_select(command)
-
-        if not rows or len(rows) < 1:
+        if len(season_ends) < 1:
             return 1
 
-        return rows[0][self.GUILD_SEASON_SEASON_NR_COL] + 1
+        return max(season_ends) + 1
 
     async def get_guild_current_season_start(
         self,
         guild_id: int,
     ) -> int:
-        command = f"""
-            SELECT * FROM {self.GUILD_SEASON_TABLE} 
-            WHERE {self.GUILD_SEASON_GUILD_ID_COL} = {int(guild_id)}
-            ORDER BY {self.GUILD_SEASON_SEASON_NR_COL} DESC
-            LIMIT 1;
-        """
+        season_ends = await self.__get_season_ends(guild_id)
 
-        rows = await self.__query_select(command)
-
-        if not rows or len(rows) < 1:
+        if len(season_ends) < 1:
             return 0
 
-        return rows[0][self.GUILD_SEASON_END_TIMESTAMP_COL]
+        return season_ends[max(season_ends)]
 
     async def get_guild_season_end(
         self,
         guild_id: int,
         season_nr: int,
     ) -> int:
-        command = f"""
-            SELECT * FROM {self.GUILD_SEASON_TABLE} 
-            WHERE {self.GUILD_SEASON_GUILD_ID_COL} = ?
-            AND {self.GUILD_SEASON_SEASON_NR_COL} = ?
-            LIMIT 1;
-        """
-
-        task = (guild_id, season_nr)
-        rows = await self.__query_select(command, task)
+        season_ends = await self.__get_season_ends(guild_id)
 
-        if not rows or len(rows) < 1:
-            return 0
-
-        return rows[0][self.GUILD_SEASON_END_TIMESTAMP_COL]
+        return season_ends.get(season_nr, 0)
 
     async def end_current_season(
         self,
@@ -4622,4 +5222,8 @@ class Database:
         timestamp = datetime.datetime.now().timestamp()
         task = (guild_id, current_season, timestamp)
 
-        return await self.__query_insert(command, task)
+        insert_id = await self.__query_insert(command, task)
+        self.season_generation += 1
+        self.season_ends = None
+        self.beans_ledger.invalidate(guild_id)
+        return insert_id
@@ -0,0 +1,74 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from events.bot_event import BotEvent
+
+
+class EventJournal:
+
+    MAX_BATCH = 500
+
+    def __init__(
+        self,
+        writer: Callable[[list[BotEvent]], Awaitable[list[int]]],
+        max_batch: int = MAX_BATCH,
+    ):
+        self.writer = writer
+        self.max_batch = max_batch
+
+        self.pending: list[tuple[BotEvent, asyncio.Future]] = []
+        self.flush_task: asyncio.Task | None = None
+        self.flush_lock = asyncio.Lock()
+
+    async def submit(self, event: BotEvent) -> int:
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((event, future))
+
+        # group commit: an idle journal writes right away, events submitted
+        # while a batch is being written go out together in the next one
+        if self.flush_task is None or self.flush_task.done():
+            self.flush_task = asyncio.create_task(self.flush())
+
+        return await future
+
+    async def flush(self):
+        async with self.flush_lock:
+            while len(self.pending) > 0:
+                batch = self.pending[: self.max_batch]
+                self.pending = self.pending[self.max_batch :]
+                await self.__write_batch(batch)
+
+    async def __write_batch(self, batch: list[tuple[BotEvent, asyncio.Future]]):
+        try:
+            try:
+                event_ids = await self.writer([event for event, _ in batch])
+            except Exception as e:
+                if len(batch) == 1:
+                    _, future = batch[0]
+                    if not future.done():
+                        future.set_exception(e)
+                    return
+                event_ids = await self.__write_separately(batch)
+
+            for (_, future), event_id in zip(batch, event_ids, strict=True):
+                if not future.done():
+                    future.set_result(event_id)
+        finally:
+            # cancelled mid write, submitters must not wait forever
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+
+    async def __write_separately(
+        self, batch: list[tuple[BotEvent, asyncio.Future]]
+    ) -> list[int | None]:
+        # one bad event should not take the rest of the batch down with it
+        event_ids = []
+        for event, future in batch:
+            try:
+                event_ids.extend(await self.writer([event]))
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                event_ids.append(None)
+        return event_ids
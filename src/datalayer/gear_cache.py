@@ -0,0 +1,109 @@
+import copy
+from collections import OrderedDict
+
+from combat.gear.droppable import Droppable
+from combat.gear.gear import Gear
+
+
+class GearCache:
+
+    DEFAULT_SIZE = 4096
+
+    def __init__(self, max_size: int = DEFAULT_SIZE):
+        self.max_size = max_size
+        self.items: OrderedDict[int, Droppable] = OrderedDict()
+        # cached gear embeds its enchantments, so a changed enchantment
+        # row has to evict the gear holding it as well
+        self.parents: dict[int, set[int]] = {}
+        self.generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups <= 0:
+            return 0
+        return self.hits / lookups
+
+    def __copy(self, item: Droppable) -> Droppable:
+        # callers freely mutate what the database hands them (crafting
+        # rewrites gear.modifiers in place), so never give out the cached
+        # instance itself
+        item = copy.copy(item)
+        if isinstance(item, Gear):
+            item.modifiers = dict(item.modifiers)
+            item.skills = list(item.skills)
+            item.enchantments = list(item.enchantments)
+        return item
+
+    def get(self, item_id: int, item_class: type[Droppable]) -> Droppable | None:
+        item = self.items.get(item_id)
+        if item is None or not isinstance(item, item_class):
+            self.misses += 1
+            return None
+
+        self.items.move_to_end(item_id)
+        self.hits += 1
+        return self.__copy(item)
+
+    def get_many(
+        self, item_ids: list[int], item_class: type[Droppable]
+    ) -> tuple[dict[int, Droppable], list[int]]:
+        found = {}
+        missing = []
+        for item_id in item_ids:
+            item = self.get(item_id, item_class)
+            if item is None:
+                missing.append(item_id)
+            else:
+                found[item_id] = item
+        return found, missing
+
+    def put(self, item: Droppable, generation: int):
+        if item is None or item.id is None:
+            return
+        if generation != self.generation:
+            # an invalidation ran while the item was loaded, it may be stale
+            return
+
+        self.__remove(item.id)
+        self.items[item.id] = self.__copy(item)
+        if isinstance(item, Gear):
+            for enchantment in item.enchantments:
+                if enchantment is not None and enchantment.id is not None:
+                    self.parents.setdefault(enchantment.id, set()).add(item.id)
+
+        while len(self.items) > self.max_size:
+            self.__remove(next(iter(self.items)))
+
+    def __remove(self, item_id: int) -> bool:
+        item = self.items.pop(item_id, None)
+        if item is None:
+            return False
+
+        if isinstance(item, Gear):
+            for enchantment in item.enchantments:
+                if enchantment is None or enchantment.id not in self.parents:
+                    continue
+                parents = self.parents[enchantment.id]
+                parents.discard(item_id)
+                if len(parents) <= 0:
+                    del self.parents[enchantment.id]
+        return True
+
+    def invalidate(self, item_ids: list[int]):
+        self.generation += 1
+        for item_id in item_ids:
+            if self.__remove(item_id):
+                self.invalidations += 1
+            for parent_id in self.parents.pop(item_id, ()):
+                if self.__remove(parent_id):
+                    self.invalidations += 1
+
+    def clear(self):
+        self.generation += 1
+        self.items.clear()
+        self.parents.clear()
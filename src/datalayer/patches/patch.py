@@ -1,8 +1,6 @@
 import datetime
 from dataclasses import dataclass
 
-import aiosqlite
-
 from datalayer.database import Database
 
 
@@ -13,6 +11,13 @@ class Patch:
     id: str
 
 
+@dataclass
+class Migration:
+    version: int
+    commands: list[str]
+    id: str
+
+
 class DBPatcher:
 
     def __init__(self, database: Database):
@@ -73,17 +78,160 @@ class DBPatcher:
             )
         )
 
+        db = self.database
+        self.migrations: list[Migration] = []
+
+        self.migrations.append(
+            Migration(
+                version=1,
+                commands=[
+                    f"""
+                    CREATE INDEX IF NOT EXISTS idx_events_guild_timestamp
+                    ON {db.EVENT_TABLE} ({db.EVENT_GUILD_ID_COL}, {db.EVENT_TIMESTAMP_COL});
+                    """,
+                    f"""
+                    CREATE INDEX IF NOT EXISTS idx_beansevents_member
+                    ON {db.BEANS_EVENT_TABLE} ({db.BEANS_EVENT_MEMBER_COL}, {db.BEANS_EVENT_TYPE_COL}, {db.BEANS_EVENT_VALUE_COL});
+                    """,
+                    f"""
+                    CREATE INDEX IF NOT EXISTS idx_inventoryevents_member_item
+                    ON {db.INVENTORY_EVENT_TABLE} ({db.INVENTORY_EVENT_MEMBER_COL}, {db.INVENTORY_EVENT_ITEM_TYPE_COL}, {db.INVENTORY_EVENT_AMOUNT_COL});
+                    """,
+                    f"""
+                    CREATE INDEX IF NOT EXISTS idx_encounterevents_encounter
+                    ON {db.ENCOUNTER_EVENT_TABLE} ({db.ENCOUNTER_EVENT_ENCOUNTER_ID_COL}, {db.ENCOUNTER_EVENT_TYPE_COL});
+                    """,
+                    f"""
+                    CREATE INDEX IF NOT EXISTS idx_combatevents_encounter
+                    ON {db.COMBAT_EVENT_TABLE} ({db.COMBAT_EVENT_ENCOUNTER_ID_COL});
+                    """,
+                    f"""
+                    CREATE INDEX IF NOT EXISTS idx_statuseffectevents_encounter
+                    ON {db.STATUS_EFFECT_EVENT_TABLE} ({db.STATUS_EFFECT_EVENT_ENCOUNTER_ID_COL});
+                    """,
+                    f"""
+                    CREATE INDEX IF NOT EXISTS idx_gardenevents_garden_plot
+                    ON {db.GARDEN_EVENT_TABLE} ({db.GARDEN_EVENT_GARDEN_ID_COL}, {db.GARDEN_EVENT_PLOT_ID_COL}, {db.GARDEN_EVENT_TYPE_COL});
+                    """,
+                    f"""
+                    CREATE INDEX IF NOT EXISTS idx_plots_garden
+                    ON {db.PLOT_TABLE} ({db.PLOT_GARDEN_ID}, {db.PLOT_CREATE_TIMESTAMP});
+                    """,
+                    f"""
+                    CREATE INDEX IF NOT EXISTS idx_interactionevents_from
+                    ON {db.INTERACTION_EVENT_TABLE} ({db.INTERACTION_EVENT_FROM_COL}, {db.INTERACTION_EVENT_TYPE_COL});
+                    """,
+                    f"""
+                    CREATE INDEX IF NOT EXISTS idx_interactionevents_to
+                    ON {db.INTERACTION_EVENT_TABLE} ({db.INTERACTION_EVENT_TO_COL}, {db.INTERACTION_EVENT_TYPE_COL});
+                    """,
+                    f"""
+                    CREATE INDEX IF NOT EXISTS idx_jailevents_jail
+                    ON {db.JAIL_EVENT_TABLE} ({db.JAIL_EVENT_JAILREFERENCE_COL});
+                    """,
+                    f"""
+                    CREATE INDEX IF NOT EXISTS idx_jailevents_by
+                    ON {db.JAIL_EVENT_TABLE} ({db.JAIL_EVENT_BY_COL});
+                    """,
+                    f"""
+                    CREATE INDEX IF NOT EXISTS idx_timeoutevents_member
+                    ON {db.TIMEOUT_EVENT_TABLE} ({db.TIMEOUT_EVENT_MEMBER_COL});
+                    """,
+                    f"""
+                    CREATE INDEX IF NOT EXISTS idx_spamevents_member
+                    ON {db.SPAM_EVENT_TABLE} ({db.SPAM_EVENT_MEMBER_COL});
+                    """,
+                    f"""
+                    CREATE INDEX IF NOT EXISTS idx_karmaevents_recipient
+                    ON {db.KARMA_EVENT_TABLE} ({db.KARMA_EVENT_RECIPIENT_ID});
+                    """,
+                    f"""
+                    CREATE INDEX IF NOT EXISTS idx_karmaevents_giver
+                    ON {db.KARMA_EVENT_TABLE} ({db.KARMA_EVENT_GIVER_ID});
+                    """,
+                    f"""
+                    CREATE INDEX IF NOT EXISTS idx_usergear_member
+                    ON {db.USER_GEAR_TABLE} ({db.USER_GEAR_GUILD_ID_COL}, {db.USER_GEAR_MEMBER_ID_COL});
+                    """,
+                    "ANALYZE;",
+                ],
+                id="hot_event_indexes",
+            )
+        )
+
+        self.migrations.append(
+            Migration(
+                version=2,
+                commands=[
+                    f"""
+                    CREATE INDEX IF NOT EXISTS idx_jail_member
+                    ON {db.JAIL_TABLE} ({db.JAIL_MEMBER_COL});
+                    """,
+                    "ANALYZE;",
+                ],
+                id="jail_member_index",
+            )
+        )
+
     def get_patch(self, patch_id: str) -> Patch | None:
         for patch in self.patches:
             if patch.id == patch_id:
                 return patch
         return None
 
+    async def get_schema_version(self) -> int:
+        command = f"""
+            SELECT MAX({self.database.SCHEMA_MIGRATION_VERSION_COL}) FROM {self.database.SCHEMA_MIGRATION_TABLE};
+        """
+        async with self.database.pool.reader() as db:  # noqa: SIM117
+            async with db.execute(command) as cursor:
+                row = await cursor.fetchone()
+
+        if row is None or row[0] is None:
+            return 0
+        return row[0]
+
+    async def migrate(self) -> int:
+        version = await self.get_schema_version()
+        pending = sorted(
+            [migration for migration in self.migrations if migration.version > version],
+            key=lambda migration: migration.version,
+        )
+
+        record_command = f"""
+            INSERT INTO {self.database.SCHEMA_MIGRATION_TABLE} (
+            {self.database.SCHEMA_MIGRATION_VERSION_COL},
+            {self.database.SCHEMA_MIGRATION_NAME_COL},
+            {self.database.SCHEMA_MIGRATION_TIMESTAMP_COL})
+            VALUES (?, ?, ?);
+        """
+
+        for migration in pending:
+            async with self.database.pool.writer() as db:
+                for command in migration.commands:
+                    await db.execute(command)
+                await db.execute(
+                    record_command,
+                    (
+                        migration.version,
+                        migration.id,
+                        int(datetime.datetime.now().timestamp()),
+                    ),
+                )
+                await db.commit()
+
+            version = migration.version
+            self.database.logger.log(
+                "DB", f"Applied schema migration {version} ({migration.id})."
+            )
+
+        return version
+
     async def apply_patch(self, patch_id: str):
         patch = self.get_patch(patch_id)
 
         if patch is not None:
-            async with aiosqlite.connect(self.database.db_file, timeout=20) as db:
+            async with self.database.pool.writer() as db:
                 cursor = await db.execute(patch.command)
                 insert_id = cursor.lastrowid
                 await db.commit()
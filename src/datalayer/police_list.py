@@ -1,53 +1,89 @@
 import collections
 import datetime
-import itertools
 
 
 class PoliceListNode:
 
+    QUEUE_LENGTH = 50
+
     def __init__(self, author_id: int):
         self.author_id = author_id
-        self.spam_message_queue = collections.deque(maxlen=50)
-        self.timeout_message_queue = collections.deque(maxlen=50)
+        self.spam_message_queue: collections.deque[float] = collections.deque(
+            maxlen=self.QUEUE_LENGTH
+        )
+        self.timeout_message_queue: collections.deque[float] = collections.deque(
+            maxlen=self.QUEUE_LENGTH
+        )
         self.timeout_flag = False
 
+        self.spam_message_count = 0
+        self.spam_streak = 0
+        self.spam_streak_count = 0
+        self.spam_streak_settings: tuple[int, int] | None = None
+
+    def __track(
+        self, queue: collections.deque[float], message_timestamp: datetime.datetime
+    ) -> None:
+        timestamp = message_timestamp.timestamp()
+        if len(queue) > 0:
+            timestamp = max(timestamp, queue[-1])
+        queue.append(timestamp)
+
     def __threshold_check(
-        self, queue: collections.deque, interval: int, limit: int, offset: int = 0
+        self,
+        queue: collections.deque[float],
+        interval: int,
+        limit: int,
+        offset: int = 0,
     ) -> bool:
         if len(queue) < (limit + offset):
             return False
 
-        min_time = datetime.datetime.max
-        max_time = datetime.datetime.min
+        last = len(queue) - 1 - offset
+        return queue[last] - queue[last - limit + 1] < interval
 
-        slice_start = len(queue) - (limit + offset)
-        slice_end = len(queue) - offset
-
-        slice_result = list(itertools.islice(queue, slice_start, slice_end))
-
-        for timestamp in slice_result:
-            min_time = min([min_time, timestamp.replace(tzinfo=None)])
-            max_time = max([max_time, timestamp.replace(tzinfo=None)])
-
-        difference = max_time - min_time
-        return difference.total_seconds() < interval
+    def __count_spam_streak(self, interval: int, limit: int) -> int:
+        offset = 0
+        while self.spam_check(interval, limit, offset):
+            offset += 1
+        return offset
 
     def track_spam_message(self, message_timestamp: datetime.datetime) -> None:
-        self.spam_message_queue.append(message_timestamp)
+        self.__track(self.spam_message_queue, message_timestamp)
+        self.spam_message_count += 1
 
     def track_timeout_message(self, message_timestamp: datetime.datetime) -> None:
-        self.timeout_message_queue.append(message_timestamp)
+        self.__track(self.timeout_message_queue, message_timestamp)
 
     def spam_check(self, interval: int, limit: int, offset: int = 0) -> bool:
         return self.__threshold_check(self.spam_message_queue, interval, limit, offset)
 
+    def update_spam_streak(self, interval: int, limit: int) -> int:
+        # number of consecutive limit sized windows ending at the latest message
+        # that were below the interval
+        settings = (interval, limit)
+        missed_messages = self.spam_message_count - self.spam_streak_count
+
+        if settings != self.spam_streak_settings or missed_messages > 1:
+            self.spam_streak = self.__count_spam_streak(interval, limit)
+        elif missed_messages == 1:
+            if self.spam_check(interval, limit):
+                max_streak = len(self.spam_message_queue) - limit + 1
+                self.spam_streak = min(self.spam_streak + 1, max_streak)
+            else:
+                self.spam_streak = 0
+
+        self.spam_streak_settings = settings
+        self.spam_streak_count = self.spam_message_count
+        return self.spam_streak
+
     def check_spam_score_increase(self, interval: int, limit: int) -> bool:
         # only returns true for every limit'th message the user was spamming in a row
-        offset = 0
-        while self.spam_check(interval, limit, offset):
-            offset += 1
+        streak = self.update_spam_streak(interval, limit)
+        if streak <= 0:
+            return False
 
-        return offset == 1 or (offset - 1) % limit == 0
+        return streak == 1 or (streak - 1) % limit == 0
 
     def timeout_check(self, interval: int, limit: int) -> bool:
         return self.__threshold_check(self.timeout_message_queue, interval, limit, 0)
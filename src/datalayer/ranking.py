@@ -1,3 +1,15 @@
+import heapq
+from typing import Any
+
+from bot_util import BotUtil
+from datalayer.types import UserInteraction
+from events.beans_event import BeansEvent
+from events.interaction_event import InteractionEvent
+from events.jail_event import JailEvent
+from events.karma_event import KarmaEvent
+from events.spam_event import SpamEvent
+from events.timeout_event import TimeoutEvent
+from events.types import BeansEventType, JailEventType
 from view.types import RankingType
 
 
@@ -17,6 +29,8 @@ class RankingDefinition:
 
 
 class Ranking:
+    DISPLAY_LIMIT = 29
+
     DEFINITIONS = {
         RankingType.BEANS: RankingDefinition(
             type=RankingType.BEANS,
@@ -157,3 +171,200 @@ class Ranking:
             emoji="📢",
         ),
     }
+
+
+class RankingAggregate:
+
+    INTERACTION_RANKINGS = {
+        RankingType.SLAP: (UserInteraction.SLAP, True),
+        RankingType.PET: (UserInteraction.PET, True),
+        RankingType.FART: (UserInteraction.FART, True),
+        RankingType.SLAP_RECIEVED: (UserInteraction.SLAP, False),
+        RankingType.PET_RECIEVED: (UserInteraction.PET, False),
+        RankingType.FART_RECIEVED: (UserInteraction.FART, False),
+    }
+
+    RANKING_TYPES = [
+        *INTERACTION_RANKINGS.keys(),
+        RankingType.TIMEOUT_TOTAL,
+        RankingType.TIMEOUT_COUNT,
+        RankingType.JAIL_TOTAL,
+        RankingType.JAIL_COUNT,
+        RankingType.SPAM_SCORE,
+        RankingType.TOTAL_GAMBAD_SPENT,
+        RankingType.TOTAL_GAMBAD_WON,
+        RankingType.WIN_RATE,
+        RankingType.AVG_GAMBA_GAIN,
+        RankingType.WIN_STREAK,
+        RankingType.LOSS_STREAK,
+        RankingType.KARMA,
+        RankingType.GOLD_STARS,
+        RankingType.FUCK_YOUS,
+    ]
+
+    def __init__(self, last_event_id: int):
+        # every event up to this id is already part of the aggregate
+        self.last_event_id = last_event_id
+        self.values: dict[RankingType, dict[int, int]] = {
+            ranking_type: {} for ranking_type in self.RANKING_TYPES
+        }
+
+        self.gamba_wins: dict[int, int] = {}
+        self.gamba_losses: dict[int, int] = {}
+        self.gamba_won: dict[int, int] = {}
+        self.gamba_cost: dict[int, int] = {}
+        self.gamba_count: dict[int, int] = {}
+        self.current_win_streak: dict[int, int] = {}
+        self.current_loss_streak: dict[int, int] = {}
+
+    def add_interaction_event(self, event: InteractionEvent):
+        for ranking_type, (
+            interaction_type,
+            outgoing,
+        ) in self.INTERACTION_RANKINGS.items():
+            if event.interaction_type != interaction_type:
+                continue
+            user_id = event.from_user_id if outgoing else event.to_user_id
+            BotUtil.dict_append(self.values[ranking_type], user_id, 1)
+
+    def add_timeout_event(self, event: TimeoutEvent):
+        user_id = event.member_id
+        BotUtil.dict_append(
+            self.values[RankingType.TIMEOUT_TOTAL], user_id, event.duration
+        )
+        BotUtil.dict_append(self.values[RankingType.TIMEOUT_COUNT], user_id, 1)
+
+    def add_jail_event(self, event: JailEvent, user_id: int):
+        BotUtil.dict_append(
+            self.values[RankingType.JAIL_TOTAL], user_id, event.duration
+        )
+        if event.jail_event_type == JailEventType.JAIL:
+            BotUtil.dict_append(self.values[RankingType.JAIL_COUNT], user_id, 1)
+
+    def add_spam_event(self, event: SpamEvent):
+        BotUtil.dict_append(self.values[RankingType.SPAM_SCORE], event.member_id, 1)
+
+    def add_karma_event(self, event: KarmaEvent):
+        user_id = event.recipient_id
+        BotUtil.dict_append(self.values[RankingType.KARMA], user_id, event.amount)
+        if event.amount >= 0:
+            BotUtil.dict_append(
+                self.values[RankingType.GOLD_STARS], user_id, event.amount
+            )
+        else:
+            BotUtil.dict_append(
+                self.values[RankingType.FUCK_YOUS], user_id, abs(event.amount)
+            )
+
+    def add_beans_event(self, event: BeansEvent):
+        if event.beans_event_type not in [
+            BeansEventType.GAMBA_COST,
+            BeansEventType.GAMBA_PAYOUT,
+        ]:
+            return
+
+        user_id = event.member_id
+        value = event.value
+
+        BotUtil.dict_append(self.values[RankingType.TOTAL_GAMBAD_WON], user_id, value)
+        if value > 0:
+            BotUtil.dict_append(self.gamba_won, user_id, value)
+            self.gamba_cost.setdefault(user_id, 0)
+        else:
+            BotUtil.dict_append(self.gamba_cost, user_id, abs(value))
+            self.gamba_won.setdefault(user_id, 0)
+        self.values[RankingType.AVG_GAMBA_GAIN].setdefault(user_id, 0)
+
+        if event.beans_event_type == BeansEventType.GAMBA_COST:
+            BotUtil.dict_append(
+                self.values[RankingType.TOTAL_GAMBAD_SPENT], user_id, abs(value)
+            )
+            return
+
+        if value > 0:
+            BotUtil.dict_append(self.gamba_wins, user_id, 1)
+            self.gamba_losses.setdefault(user_id, 0)
+            BotUtil.dict_append(self.current_win_streak, user_id, 1)
+        else:
+            BotUtil.dict_append(self.gamba_losses, user_id, 1)
+            self.gamba_wins.setdefault(user_id, 0)
+            self.current_win_streak[user_id] = 0
+
+        if value == 0:
+            BotUtil.dict_append(self.current_loss_streak, user_id, 1)
+        else:
+            self.current_loss_streak[user_id] = 0
+
+        self.values[RankingType.WIN_RATE].setdefault(user_id, 0)
+        BotUtil.dict_append(
+            self.values[RankingType.WIN_STREAK],
+            user_id,
+            self.current_win_streak[user_id],
+            mode="max",
+        )
+        BotUtil.dict_append(
+            self.values[RankingType.LOSS_STREAK],
+            user_id,
+            self.current_loss_streak[user_id],
+            mode="max",
+        )
+        BotUtil.dict_append(self.gamba_count, user_id, 1)
+
+    def __get_ratios(self, ranking_type: RankingType) -> dict[int, float]:
+        ratios = {}
+        for user_id in self.values[ranking_type]:
+            ratio = 0
+            match ranking_type:
+                case RankingType.WIN_RATE:
+                    total = self.gamba_wins[user_id] + self.gamba_losses[user_id]
+                    if total != 0:
+                        ratio = round(self.gamba_wins[user_id] / total * 100, 2)
+                case RankingType.AVG_GAMBA_GAIN:
+                    if self.gamba_cost[user_id] != 0:
+                        ratio = round(
+                            self.gamba_won[user_id] / self.gamba_cost[user_id], 2
+                        )
+            ratios[user_id] = ratio
+        return ratios
+
+    def get_top(self, ranking_type: RankingType, limit: int) -> list[tuple[int, Any]]:
+        values = self.values[ranking_type]
+        if ranking_type in [RankingType.WIN_RATE, RankingType.AVG_GAMBA_GAIN]:
+            values = self.__get_ratios(ranking_type)
+
+        # equal to sorted(..., reverse=True)[:limit], ties keep first seen order
+        top = heapq.nlargest(limit, values.items(), key=lambda item: item[1])
+
+        match ranking_type:
+            case RankingType.TIMEOUT_TOTAL:
+                return [
+                    (k, BotUtil.strfdelta(v, inputtype="seconds")) for (k, v) in top
+                ]
+            case RankingType.JAIL_TOTAL:
+                return [
+                    (k, BotUtil.strfdelta(v, inputtype="minutes")) for (k, v) in top
+                ]
+            case RankingType.TOTAL_GAMBAD_SPENT | RankingType.TOTAL_GAMBAD_WON:
+                return [(k, f"🅱️{v}") for (k, v) in top]
+            case RankingType.WIN_RATE:
+                return [
+                    (
+                        k,
+                        f"{v}% ({self.gamba_wins[k]}/{self.gamba_wins[k] + self.gamba_losses[k]})",
+                    )
+                    for (k, v) in top
+                ]
+            case RankingType.AVG_GAMBA_GAIN:
+                return [
+                    (k, f"{v} ({self.gamba_won[k]}/{self.gamba_cost[k]})")
+                    for (k, v) in top
+                ]
+            case RankingType.WIN_STREAK | RankingType.LOSS_STREAK:
+                return [(k, f"{v} ({self.gamba_count[k]} total)") for (k, v) in top]
+            case RankingType.KARMA:
+                return [(k, f"😇{v}") if v >= 0 else (k, f"😈{v}") for (k, v) in top]
+            case RankingType.GOLD_STARS:
+                return [(k, f"⭐{v}") for (k, v) in top]
+            case RankingType.FUCK_YOUS:
+                return [(k, f"🖕{v}") for (k, v) in top]
+        return top
@@ -0,0 +1,54 @@
+from collections import OrderedDict
+
+from datalayer.stats import UserStats
+
+
+class UserStatsCache:
+
+    DEFAULT_SIZE = 1024
+
+    def __init__(self, max_size: int = DEFAULT_SIZE):
+        self.max_size = max_size
+        self.stats: OrderedDict[int, UserStats] = OrderedDict()
+        self.generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups <= 0:
+            return 0
+        return self.hits / lookups
+
+    def get(self, user_id: int) -> UserStats | None:
+        user_stats = self.stats.get(user_id)
+        if user_stats is None:
+            self.misses += 1
+            return None
+
+        self.stats.move_to_end(user_id)
+        self.hits += 1
+        return user_stats
+
+    def put(self, user_id: int, user_stats: UserStats, generation: int):
+        if generation != self.generation:
+            # an event was written while the stats were queried
+            return
+
+        self.stats[user_id] = user_stats
+        self.stats.move_to_end(user_id)
+        while len(self.stats) > self.max_size:
+            self.stats.popitem(last=False)
+
+    def invalidate(self, user_ids: set[int]):
+        self.generation += 1
+        for user_id in user_ids:
+            if self.stats.pop(user_id, None) is not None:
+                self.invalidations += 1
+
+    def clear(self):
+        self.generation += 1
+        self.stats.clear()
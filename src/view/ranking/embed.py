@@ -35,7 +35,7 @@ class RankingEmbed(discord.Embed):
         for user_name, amount in rankings.items():
             leaderbord_msg += f"**{rank}.** {user_name} `{amount}`\n"
             rank += 1
-            if rank == 30:
+            if rank > Ranking.DISPLAY_LIMIT:
                 break
 
         self.add_field(name="", value=leaderbord_msg)